@@ -0,0 +1,184 @@
+"""
+Hand Backend Benchmark
+So sánh độ trễ và thông lượng của các backend nhận diện tay trên video đã ghi
+
+Sử dụng:
+    python -m benchmarks.backends --source recording.mp4
+    python -m benchmarks.backends --source recording.mp4 --configs solutions:0 solutions:1 tasks:live_stream
+"""
+
+import argparse
+import time
+import cv2
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from benchmarks.common import load_frames
+from config.settings import MAX_HANDS
+from modules.hand_backends import SolutionsBackend, TasksBackend, unpack_task_result
+
+DEFAULT_CONFIGS = ["solutions:1", "solutions:0", "tasks:video", "tasks:live_stream"]
+
+
+class TimedTasksBackend(TasksBackend):
+    """TasksBackend ghi lại thời điểm gửi frame và thời điểm nhận kết quả qua callback"""
+
+    def __init__(self, *args, **kwargs):
+        self.submit_times = {}
+        self.outputs = {}
+        self.latencies = []
+        super().__init__(*args, **kwargs)
+        self.buffers = (np.zeros((MAX_HANDS, 21, 3), dtype=np.float32),
+                        np.zeros(MAX_HANDS, dtype=np.int8), np.zeros(MAX_HANDS, dtype=np.float32))
+
+    def _next_timestamp(self) -> int:
+        timestamp = super()._next_timestamp()
+        self.submit_times[timestamp] = time.perf_counter()
+        return timestamp
+
+    def _on_result(self, result, image, timestamp_ms: int):
+        arrived = time.perf_counter()
+        super()._on_result(result, image, timestamp_ms)
+        self.latencies.append(arrived - self.submit_times[timestamp_ms])
+        num_hands = unpack_task_result(result, *self.buffers)
+        self.outputs[timestamp_ms] = self.buffers[0][0, :, :2].copy() if num_hands else None
+
+
+def run_sync(backend, frames: List[np.ndarray]) -> Tuple[float, List[float], List[Optional[np.ndarray]]]:
+    """
+    Chạy backend đồng bộ, mỗi frame đợi kết quả của chính nó
+
+    Returns:
+        Tuple: (fps, độ trễ từng frame, landmarks (21, 2) của tay đầu tiên hoặc None)
+    """
+    landmarks = np.zeros((MAX_HANDS, 21, 3), dtype=np.float32)
+    handedness = np.zeros(MAX_HANDS, dtype=np.int8)
+    scores = np.zeros(MAX_HANDS, dtype=np.float32)
+    latencies = []
+    outputs = []
+
+    start = time.perf_counter()
+    for frame in frames:
+        frame_start = time.perf_counter()
+        num_hands, _ = backend.process(frame, landmarks, handedness, scores)
+        latencies.append(time.perf_counter() - frame_start)
+        outputs.append(landmarks[0, :, :2].copy() if num_hands else None)
+    elapsed = time.perf_counter() - start
+
+    return len(frames) / elapsed if elapsed > 0 else 0.0, latencies, outputs
+
+
+def run_live_stream(backend: TimedTasksBackend, frames: List[np.ndarray],
+                    fps: float) -> Tuple[float, List[float], List[Optional[np.ndarray]]]:
+    """
+    Gửi frame theo nhịp camera cho backend live_stream; MediaPipe tự bỏ frame khi đang bận
+
+    Returns:
+        Tuple: (số kết quả nhận được mỗi giây, độ trễ gửi -> callback, landmarks theo frame)
+    """
+    landmarks = np.zeros((MAX_HANDS, 21, 3), dtype=np.float32)
+    handedness = np.zeros(MAX_HANDS, dtype=np.int8)
+    scores = np.zeros(MAX_HANDS, dtype=np.float32)
+    frame_time = 1.0 / fps
+    timestamps = []
+
+    start = time.perf_counter()
+    for i, frame in enumerate(frames):
+        backend.process(frame, landmarks, handedness, scores)
+        timestamps.append(backend.last_timestamp)
+        delay = start + (i + 1) * frame_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    # Chờ các kết quả cuối cùng về qua callback
+    deadline = time.perf_counter() + 1.0
+    while timestamps[-1] not in backend.outputs and time.perf_counter() < deadline:
+        time.sleep(0.005)
+    elapsed = time.perf_counter() - start
+
+    outputs = [backend.outputs.get(timestamp) for timestamp in timestamps]
+    return len(backend.latencies) / elapsed if elapsed > 0 else 0.0, backend.latencies, outputs
+
+
+def compare(reference: List[Optional[np.ndarray]], outputs: List[Optional[np.ndarray]],
+            width: int, height: int) -> Tuple[float, float]:
+    """
+    So sánh landmarks với backend chuẩn
+
+    Returns:
+        Tuple[float, float]: (% frame có tay, sai số trung bình theo pixel)
+    """
+    detected = sum(output is not None for output in outputs)
+    errors = [
+        np.sqrt((((out - ref) * (width, height)) ** 2).sum(axis=1)).mean()
+        for ref, out in zip(reference, outputs) if ref is not None and out is not None
+    ]
+    return 100 * detected / max(len(outputs), 1), float(np.mean(errors)) if errors else float('nan')
+
+
+def run_config(config: str, frames: List[np.ndarray], fps: float) -> Dict[str, object]:
+    """Chạy một cấu hình dạng "solutions:<complexity>" hoặc "tasks:<running_mode>" """
+    name, option = config.split(":")
+    if name == "solutions":
+        backend = SolutionsBackend(model_complexity=int(option))
+        try:
+            run_sync(backend, frames[:5])  # warm-up, không tính thời gian khởi tạo graph
+            throughput, latencies, outputs = run_sync(backend, frames)
+        finally:
+            backend.close()
+    elif option == "live_stream":
+        backend = TimedTasksBackend(running_mode="live_stream")
+        try:
+            throughput, latencies, outputs = run_live_stream(backend, frames, fps)
+        finally:
+            backend.close()
+    else:
+        backend = TasksBackend(running_mode="video")
+        try:
+            throughput, latencies, outputs = run_sync(backend, frames)
+        finally:
+            backend.close()
+
+    return {'throughput': throughput, 'latencies': np.array(latencies) * 1000, 'outputs': outputs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hand landmark backends")
+    parser.add_argument("--source", default="0", help="Video file or camera index (default: 0)")
+    parser.add_argument("--frames", type=int, default=300, help="Maximum number of frames to use")
+    parser.add_argument("--fps", type=float, default=30.0, help="Frame rate used to feed the live_stream backend")
+    parser.add_argument("--configs", nargs="+", default=DEFAULT_CONFIGS,
+                        help="Backends to test, e.g. solutions:0 solutions:1 tasks:video tasks:live_stream")
+    args = parser.parse_args()
+
+    frames = [cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) for frame in load_frames(args.source, args.frames)]
+    if not frames:
+        print("❌ No frames read from source")
+        return
+
+    height, width = frames[0].shape[:2]
+    print(f"📹 {len(frames)} frames at {width}x{height}")
+
+    results = {}
+    for config in args.configs:
+        try:
+            results[config] = run_config(config, frames, args.fps)
+        except Exception as e:
+            print(f"⚠️  {config}: {e}")
+
+    if not results:
+        return
+
+    # Cấu hình đầu tiên chạy được (mặc định solutions:1, model đầy đủ) là chuẩn để so sánh sai số
+    reference = next(iter(results.values()))['outputs']
+
+    print(f"{'backend':>20} {'fps':>8} {'mean ms':>8} {'p95 ms':>8} {'detect%':>8} {'err px':>8}")
+    for config, result in results.items():
+        latencies = result['latencies']
+        mean_ms, p95_ms = (latencies.mean(), np.percentile(latencies, 95)) if len(latencies) else (float('nan'),) * 2
+        detect, error = compare(reference, result['outputs'], width, height)
+        print(f"{config:>20} {result['throughput']:>8.1f} {mean_ms:>8.2f} "
+              f"{p95_ms:>8.2f} {detect:>7.1f}% {error:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Click Latency Benchmark
+So sánh độ trễ click và số click sai giữa chế độ bầu chọn (cửa sổ ổn định + bầu chọn gesture)
+và chế độ onset (vận tốc khép + hysteresis) trên các phiên đã ghi có nhãn theo frame
+
+Độ trễ tính từ frame đầu tiên của mỗi đoạn nhíp thật (nhãn "pinch") tới frame trả về "left_click"
+(âm nếu onset click trước khi hai ngón chạm hẳn). Click sai gồm click không thuộc lần nhíp nào
+và click lặp lại trong cùng một lần nhíp (kể cả click muộn ngay sau khi nhả).
+
+Sử dụng:
+    python -m benchmarks.click_latency
+    python -m benchmarks.click_latency session.npz --positive pinch
+"""
+
+import argparse
+import numpy as np
+from typing import Dict, Tuple
+from config.settings import CLICK_THRESHOLD
+from utils.gesture_batch import evaluate_gestures, BATCH_LABELS
+
+LEFT_CLICK = BATCH_LABELS.index("left_click")
+
+
+def synthetic_session(seconds: float = 120.0, fps: float = 30.0, jitter: float = 0.004,
+                      seed: int = 0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sinh phiên nhíp tổng hợp: các lần nhíp thật xen kẽ các lần khép hờ (dừng ở 1.5-1.8x CLICK_THRESHOLD),
+    landmarks có nhiễu Gauss như đầu ra của MediaPipe
+
+    Returns:
+        Tuple: (landmarks (T, 21, 3), timestamps (T,), nhãn nhíp thật (T,) bool)
+    """
+    rng = np.random.default_rng(seed)
+    total = int(seconds * fps)
+
+    # Khoảng cách đầu ngón trỏ - đầu ngón cái theo thời gian
+    distance = []
+    while len(distance) < total:
+        rest = rng.uniform(0.12, 0.16)
+        distance += [rest] * int(rng.integers(10, 40))
+        target = rng.uniform(0.015, 0.035) if rng.random() < 0.7 else CLICK_THRESHOLD * rng.uniform(1.5, 1.8)
+        close = np.cos(np.linspace(0, np.pi, int(rng.integers(3, 7)))) * 0.5 + 0.5
+        distance += (target + (rest - target) * close).tolist()
+        distance += [target] * int(rng.integers(6, 20))
+        distance += (target + (rest - target) * close[::-1]).tolist()
+    distance = np.array(distance[:total])
+
+    # Bàn tay duỗi (ngón trỏ và ngón cái duỗi), đầu ngón cái đặt cách đầu ngón trỏ đúng khoảng cách trên
+    hand = np.zeros((21, 3), dtype=np.float32)
+    hand[:, :2] = [
+        (0.50, 0.80), (0.44, 0.76), (0.40, 0.70), (0.38, 0.64), (0.37, 0.58),
+        (0.48, 0.66), (0.48, 0.58), (0.48, 0.53), (0.48, 0.48),
+        (0.52, 0.68), (0.53, 0.62), (0.53, 0.66), (0.53, 0.70),
+        (0.56, 0.69), (0.57, 0.64), (0.57, 0.68), (0.57, 0.72),
+        (0.60, 0.71), (0.61, 0.67), (0.61, 0.70), (0.61, 0.73),
+    ]
+    landmarks = np.repeat(hand[None], total, axis=0)
+    landmarks[:, 4, 0] = landmarks[:, 8, 0] - distance
+    landmarks[:, 4, 1] = landmarks[:, 8, 1]
+    landmarks[:, 3, 0] = landmarks[:, 4, 0] - 0.05
+    landmarks[:, 3, 1] = landmarks[:, 4, 1] + 0.03
+    landmarks[:, :, :2] += rng.normal(0, jitter, (total, 21, 2))
+
+    timestamps = np.arange(total) / fps
+    return landmarks, timestamps, distance < CLICK_THRESHOLD
+
+
+def click_metrics(decisions: np.ndarray, pinched: np.ndarray, timestamps: np.ndarray,
+                  lead: float = 0.2, lag: float = 0.5) -> Dict[str, float]:
+    """
+    Ghép các click với các đoạn nhíp thật
+
+    Args:
+        decisions: Kết quả của evaluate_gestures
+        pinched: Mảng (T,) bool nhãn nhíp thật
+        timestamps: Mảng (T,) thời điểm của từng frame
+        lead: Click sớm hơn đầu đoạn nhíp tối đa bấy nhiêu giây vẫn được tính cho đoạn đó
+        lag: Click muộn hơn cuối đoạn nhíp tối đa bấy nhiêu giây vẫn được tính cho đoạn đó
+
+    Returns:
+        Dict[str, float]: Số lần nhíp, tỉ lệ phát hiện, độ trễ trung vị/p90 (ms), click sai
+    """
+    clicks = timestamps[decisions == LEFT_CLICK]
+    edges = np.diff(np.r_[0, pinched.astype(np.int8), 0])
+    starts = timestamps[np.flatnonzero(edges == 1)]
+    ends = timestamps[np.flatnonzero(edges == -1) - 1]
+
+    latencies = []
+    matched = np.zeros(len(clicks), dtype=bool)
+    repeated = 0
+    for start, end in zip(starts, ends):
+        inside = np.flatnonzero(~matched & (clicks >= start - lead) & (clicks <= end + lag))
+        if len(inside):
+            latencies.append(clicks[inside[0]] - start)
+            repeated += len(inside) - 1
+        matched[inside] = True
+
+    latencies = np.array(latencies) * 1000
+    duration = max(timestamps[-1] - timestamps[0], 1e-9) / 60
+    return {
+        'pinches': len(starts),
+        'detected': 100 * len(latencies) / max(len(starts), 1),
+        'median_ms': float(np.median(latencies)) if len(latencies) else float('nan'),
+        'p90_ms': float(np.percentile(latencies, 90)) if len(latencies) else float('nan'),
+        'spurious': int((~matched).sum()),
+        'repeated': repeated,
+        'false_per_min': (int((~matched).sum()) + repeated) / duration,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare click latency and false clicks of vote and onset modes")
+    parser.add_argument("sessions", nargs="*",
+                        help="Landmarks .npz with a per-frame 'labels' array (default: synthetic session)")
+    parser.add_argument("--positive", default="pinch", help="Label of true pinch frames")
+    args = parser.parse_args()
+
+    if args.sessions:
+        sessions = []
+        for path in args.sessions:
+            data = np.load(path)
+            sessions.append((data['landmarks'][:, 0], data['timestamps'], data['num_hands'] > 0,
+                             data['labels'].astype(str) == args.positive))
+    else:
+        landmarks, timestamps, pinched = synthetic_session()
+        sessions = [(landmarks, timestamps, None, pinched)]
+
+    print(f"{'mode':>6} {'pinches':>8} {'detected':>9} {'median':>8} {'p90':>8} "
+          f"{'spurious':>9} {'repeated':>9} {'false/min':>10}")
+    for mode in ("vote", "onset"):
+        for landmarks, timestamps, present, pinched in sessions:
+            decisions = evaluate_gestures(landmarks, timestamps, present, click_mode=mode)
+            metrics = click_metrics(decisions, pinched, timestamps)
+            print(f"{mode:>6} {metrics['pinches']:>8d} {metrics['detected']:>8.1f}% "
+                  f"{metrics['median_ms']:>6.0f}ms {metrics['p90_ms']:>6.0f}ms {metrics['spurious']:>9d} "
+                  f"{metrics['repeated']:>9d} {metrics['false_per_min']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
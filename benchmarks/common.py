@@ -0,0 +1,67 @@
+"""
+Benchmark Helpers
+Các hàm dùng chung cho những script benchmark của AeroHand
+"""
+
+import cv2
+import numpy as np
+from typing import Iterator, Optional, Union
+
+
+def iter_frames(source: Union[str, int], max_frames: Optional[int] = None) -> Iterator[np.ndarray]:
+    """
+    Đọc lần lượt các frame từ video đã ghi hoặc từ webcam
+
+    Args:
+        source: Đường dẫn file video hoặc index của webcam
+        max_frames: Số frame tối đa cần đọc (None = đọc hết)
+
+    Yields:
+        np.ndarray: Frame BGR
+    """
+    if isinstance(source, str) and source.isdigit():
+        source = int(source)
+
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open video source: {source}")
+
+    count = 0
+    try:
+        while max_frames is None or count < max_frames:
+            ret, frame = cap.read()
+            if not ret or frame is None:
+                break
+            count += 1
+            yield frame
+    finally:
+        cap.release()
+
+
+def load_frames(source: Union[str, int], max_frames: Optional[int] = None) -> list:
+    """
+    Đọc toàn bộ frame vào bộ nhớ để các lần chạy benchmark dùng cùng một dữ liệu
+
+    Args:
+        source: Đường dẫn file video hoặc index của webcam
+        max_frames: Số frame tối đa cần đọc
+
+    Returns:
+        list: Danh sách frame BGR
+    """
+    return list(iter_frames(source, max_frames))
+
+
+def results_to_array(results) -> Optional[np.ndarray]:
+    """
+    Lấy landmarks của tay đầu tiên dưới dạng mảng (21, 2)
+
+    Args:
+        results: Kết quả từ HandTracker.detect_hands
+
+    Returns:
+        Optional[np.ndarray]: Mảng (21, 2) hoặc None nếu không có tay
+    """
+    if results is None or results.num_hands == 0:
+        return None
+    return results.landmarks[0, :, :2].copy()
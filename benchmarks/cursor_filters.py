@@ -0,0 +1,189 @@
+"""
+Cursor Filter Benchmark
+So sánh các bộ lọc con trỏ (utils.cursor_filter) trên quỹ đạo đầu ngón trỏ tổng hợp: các lần trỏ nhanh
+(quỹ đạo minimum-jerk) xen kẽ các lần giữ yên, có nhiễu Gauss như landmarks của MediaPipe và đi qua
+bộ lọc landmarks (nếu LANDMARK_FILTER) như pipeline trực tiếp
+
+Chỉ số:
+    lag: độ trễ thêm khi di chuyển (ms), độ dịch thời gian làm sai số với quỹ đạo thật nhỏ nhất
+    jitter: rung khi giữ yên (px RMS trên màn hình)
+    overshoot: con trỏ vượt quá điểm dừng (px, trung bình các lần trỏ)
+    us: thời gian mỗi lần cập nhật (µs)
+
+Sử dụng:
+    python -m benchmarks.cursor_filters
+    python -m benchmarks.cursor_filters --jitter 0.006 --fps 60
+"""
+
+import argparse
+import time
+import numpy as np
+from typing import Dict, Tuple
+from config.settings import LANDMARK_FILTER, SCREEN_MARGIN
+from utils.cursor_filter import CURSOR_FILTERS, create_cursor_filter
+from utils.landmark_filter import filter_sequence
+
+# Giữ yên bấy nhiêu giây sau mỗi lần trỏ thì mới tính rung (bỏ qua phần bộ lọc đang hội tụ)
+SETTLE_TIME = 0.5
+
+
+def pointer_session(seconds: float = 120.0, fps: float = 30.0, jitter: float = 0.004,
+                    seed: int = 0) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sinh quỹ đạo đầu ngón trỏ: trỏ tới các điểm ngẫu nhiên (minimum-jerk) rồi giữ yên
+
+    Args:
+        seconds: Độ dài phiên (giây)
+        fps: Tốc độ frame
+        jitter: Độ lệch chuẩn nhiễu của landmarks (normalized)
+        seed: Seed ngẫu nhiên
+
+    Returns:
+        Tuple: (vị trí thật (T, 2), vị trí đo (T, 2), timestamps (T,), số thứ tự lần trỏ của từng frame
+                (T,) int, -1 khi đang giữ yên)
+    """
+    rng = np.random.default_rng(seed)
+    total = int(seconds * fps)
+    truth = np.zeros((total, 2))
+    segment = np.full(total, -1)
+
+    position = np.array([0.5, 0.5])
+    t, move = 0, 0
+    while t < total:
+        hold = int(rng.uniform(0.6, 1.5) * fps)
+        truth[t:t + hold] = position
+        t += hold
+        if t >= total:
+            break
+
+        # Trỏ tới điểm mới trong 0.2-0.6 giây, hồ sơ vị trí minimum-jerk 10s^3 - 15s^4 + 6s^5
+        target = rng.uniform(0.15, 0.85, 2)
+        frames = int(rng.uniform(0.2, 0.6) * fps)
+        s = np.arange(1, frames + 1) / frames
+        profile = 10 * s ** 3 - 15 * s ** 4 + 6 * s ** 5
+        path = position + profile[:, None] * (target - position)
+        end = min(t + frames, total)
+        truth[t:end] = path[:end - t]
+        segment[t:end] = move
+        position = target
+        t, move = end, move + 1
+
+    timestamps = np.arange(total) / fps
+    measured = truth + rng.normal(0, jitter, truth.shape)
+    if LANDMARK_FILTER:
+        landmarks = np.zeros((total, 1, 3), dtype=np.float32)
+        landmarks[:, 0, :2] = measured
+        measured = filter_sequence(landmarks, timestamps)[:, 0, :2].astype(np.float64)
+    return truth, measured, timestamps, segment
+
+
+def added_lag(output: np.ndarray, truth: np.ndarray, timestamps: np.ndarray, moving: np.ndarray,
+              max_lag: float = 0.3) -> float:
+    """
+    Độ trễ (giây) làm sai số giữa đầu ra và quỹ đạo thật bị dịch chậm lại nhỏ nhất trên các frame di chuyển
+
+    Args:
+        output: Vị trí đầu ra (T, 2)
+        truth: Vị trí thật (T, 2)
+        timestamps: Thời điểm (T,)
+        moving: Mảng (T,) bool các frame đang trỏ
+        max_lag: Độ trễ tối đa được thử (giây)
+
+    Returns:
+        float: Độ trễ (giây), âm nếu đầu ra đi trước quỹ đạo thật
+    """
+    lags = np.arange(-0.1, max_lag, 0.001)
+    errors = []
+    for lag in lags:
+        shifted = np.stack([np.interp(timestamps - lag, timestamps, truth[:, axis]) for axis in range(2)], axis=1)
+        errors.append(np.mean(np.sum((output[moving] - shifted[moving]) ** 2, axis=1)))
+    return float(lags[int(np.argmin(errors))])
+
+
+def cursor_metrics(output: np.ndarray, truth: np.ndarray, timestamps: np.ndarray, segment: np.ndarray,
+                   screen: Tuple[float, float]) -> Dict[str, float]:
+    """
+    Chỉ số của một bộ lọc trên phiên tổng hợp
+
+    Args:
+        output: Vị trí đầu ra (T, 2) normalized
+        truth: Vị trí thật (T, 2) normalized
+        timestamps: Thời điểm (T,)
+        segment: Số thứ tự lần trỏ của từng frame (-1 khi giữ yên)
+        screen: Kích thước vùng hoạt động trên màn hình (px) để đổi normalized sang px
+
+    Returns:
+        Dict[str, float]: lag_ms, jitter_px, overshoot_px
+    """
+    scale = np.asarray(screen, dtype=np.float64)
+    moving = segment >= 0
+
+    # Frame giữ yên đã qua SETTLE_TIME kể từ lần trỏ trước
+    last_move = np.maximum.accumulate(np.where(moving, timestamps, -np.inf))
+    settled = ~moving & (timestamps - last_move >= SETTLE_TIME)
+    jitter = np.sqrt(np.mean(np.sum(((output[settled] - truth[settled]) * scale) ** 2, axis=1)))
+
+    # Vượt quá: phần đầu ra đi qua điểm dừng theo hướng trỏ, trong SETTLE_TIME sau khi dừng
+    overshoots = []
+    for move in range(segment.max() + 1):
+        frames = np.flatnonzero(segment == move)
+        start, end = frames[0], frames[-1]
+        direction = (truth[end] - truth[max(start - 1, 0)]) * scale
+        length = np.hypot(*direction)
+        after = np.flatnonzero((timestamps > timestamps[end]) & (timestamps <= timestamps[end] + SETTLE_TIME))
+        if length < 1e-9 or not len(after):
+            continue
+        overshoots.append(max(0.0, float(np.max(((output[after] - truth[end]) * scale) @ direction / length))))
+
+    return {
+        'lag_ms': 1000 * added_lag(output, truth, timestamps, moving),
+        'jitter_px': float(jitter),
+        'overshoot_px': float(np.mean(overshoots)) if overshoots else 0.0,
+    }
+
+
+def run_filter(name: str, measured: np.ndarray, timestamps: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Chạy một bộ lọc qua cả phiên
+
+    Returns:
+        Tuple: (vị trí đầu ra (T, 2), µs mỗi lần cập nhật)
+    """
+    if name == "none":
+        return measured, 0.0
+    cursor_filter = create_cursor_filter(name)
+    points = measured.tolist()
+    times = timestamps.tolist()
+    output = []
+    start = time.perf_counter()
+    for (x, y), timestamp in zip(points, times):
+        output.append(cursor_filter.apply(x, y, timestamp))
+    elapsed = time.perf_counter() - start
+    return np.array(output), elapsed / len(points) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cursor filters: added lag, jitter at rest, "
+                                                 "overshoot and time per update")
+    parser.add_argument("--filters", nargs="+", default=["none", *CURSOR_FILTERS],
+                        choices=["none", *CURSOR_FILTERS])
+    parser.add_argument("--seconds", type=float, default=120.0, help="Synthetic session length")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--jitter", type=float, default=0.004, help="Landmark noise std (normalized)")
+    parser.add_argument("--screen", type=int, nargs=2, default=[1920, 1080], metavar=("WIDTH", "HEIGHT"))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    truth, measured, timestamps, segment = pointer_session(args.seconds, args.fps, args.jitter, args.seed)
+    screen = (args.screen[0] - 2 * SCREEN_MARGIN, args.screen[1] - 2 * SCREEN_MARGIN)
+
+    print(f"{'filter':>9} {'lag':>8} {'jitter':>9} {'overshoot':>10} {'us':>7}")
+    for name in args.filters:
+        output, us = run_filter(name, measured, timestamps)
+        metrics = cursor_metrics(output, truth, timestamps, segment, screen)
+        print(f"{name:>9} {metrics['lag_ms']:>6.0f}ms {metrics['jitter_px']:>7.2f}px "
+              f"{metrics['overshoot_px']:>8.1f}px {us:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
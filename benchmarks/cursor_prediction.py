@@ -0,0 +1,116 @@
+"""
+Cursor Prediction Benchmark
+Đo độ trễ cảm nhận của con trỏ (so với đầu ngón trỏ tại thời điểm con trỏ hiện trên màn hình)
+khi có và không có CursorPredictor, trên quỹ đạo tổng hợp hoặc quỹ đạo đã ghi
+
+Mỗi frame được xử lý sau độ trễ pipeline (--latency, đo được qua timestamp) và hiện ra sau thêm --display
+(không đo được). Độ trễ cảm nhận là độ dịch thời gian làm sai số giữa con trỏ và đầu ngón trỏ nhỏ nhất;
+rung và vượt quá điểm dừng tính như benchmarks.cursor_filters. Quỹ đạo đã ghi không có vị trí thật nên
+dùng chính đầu ngón trỏ đã ghi làm mượt không trễ (trung bình trượt đối xứng) làm tham chiếu.
+
+Sử dụng:
+    python -m benchmarks.cursor_prediction
+    python -m benchmarks.cursor_prediction session.npz --latency 0.05 --display 0.03
+"""
+
+import argparse
+import numpy as np
+from typing import Tuple
+from config.settings import CURSOR_FILTER, CURSOR_PREDICTION_EXTRA_LATENCY, SCREEN_MARGIN
+from utils.cursor_filter import CURSOR_FILTERS, create_cursor_filter
+from utils.cursor_predictor import CursorPredictor
+from utils.landmark_filter import filter_sequence
+from benchmarks.cursor_filters import pointer_session, cursor_metrics
+
+# Tốc độ (normalized / giây) từ đó một frame của quỹ đạo đã ghi được tính là đang trỏ
+MOVING_SPEED = 0.3
+
+
+def recorded_session(path: str, smoothing: int = 5) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Đọc quỹ đạo đầu ngón trỏ của tay đầu tiên từ landmarks đã ghi (main.py --process-video)
+
+    Args:
+        path: File .npz có landmarks, timestamps, num_hands
+        smoothing: Số frame của trung bình trượt đối xứng dùng làm quỹ đạo tham chiếu
+
+    Returns:
+        Tuple: (tham chiếu (T, 2), vị trí đo sau bộ lọc landmarks (T, 2), timestamps (T,),
+                số thứ tự đoạn trỏ của từng frame (T,), -1 khi không trỏ), chỉ các frame có tay
+    """
+    data = np.load(path)
+    present = data['num_hands'] > 0
+    landmarks = data['landmarks'][:, 0, 8:9]
+    timestamps = np.asarray(data['timestamps'], dtype=np.float64)
+    measured = filter_sequence(landmarks, timestamps, present)[present, 0, :2].astype(np.float64)
+    raw = landmarks[present, 0, :2].astype(np.float64)
+    timestamps = timestamps[present]
+
+    kernel = np.ones(smoothing) / smoothing
+    padded = np.pad(raw, ((smoothing // 2, smoothing // 2), (0, 0)), mode='edge')
+    reference = np.stack([np.convolve(padded[:, axis], kernel, mode='valid') for axis in range(2)], axis=1)
+
+    # Các đoạn trỏ: chuỗi frame liên tiếp có tốc độ tham chiếu vượt MOVING_SPEED
+    speed = np.hypot(*np.gradient(reference, timestamps, axis=0).T)
+    moving = speed > MOVING_SPEED
+    segment = np.where(moving, np.cumsum(np.diff(np.r_[0, moving.astype(np.int8)]) == 1) - 1, -1)
+    return reference, measured, timestamps, segment
+
+
+def run_pipeline(measured: np.ndarray, timestamps: np.ndarray, filter_name: str, latency: float,
+                 predictor: bool) -> np.ndarray:
+    """
+    Chạy bộ lọc con trỏ (và predictor) như MouseController, con trỏ được đặt sau latency giây
+
+    Returns:
+        np.ndarray: Vị trí con trỏ (T, 2) normalized
+    """
+    cursor_filter = create_cursor_filter(filter_name)
+    cursor_predictor = CursorPredictor() if predictor else None
+    output = []
+    for (measured_x, measured_y), timestamp in zip(measured.tolist(), timestamps.tolist()):
+        x, y = cursor_filter.apply(measured_x, measured_y, timestamp)
+        if cursor_predictor is not None:
+            x, y = cursor_predictor.apply(x, y, measured_x, measured_y, timestamp, timestamp + latency)
+        output.append((x, y))
+    return np.array(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure perceived cursor lag with and without "
+                                                 "latency-compensating prediction")
+    parser.add_argument("sessions", nargs="*", help="Landmarks .npz from main.py --process-video "
+                                                    "(default: synthetic pointing session)")
+    parser.add_argument("--filter", default=CURSOR_FILTER, choices=CURSOR_FILTERS)
+    parser.add_argument("--latency", type=float, default=0.04,
+                        help="Capture-to-cursor latency seen in frame timestamps (s)")
+    parser.add_argument("--display", type=float, default=CURSOR_PREDICTION_EXTRA_LATENCY,
+                        help="Latency not seen in timestamps: camera before read + display (s)")
+    parser.add_argument("--fps", type=float, default=30.0, help="Synthetic session frame rate")
+    parser.add_argument("--jitter", type=float, default=0.004, help="Synthetic landmark noise std")
+    parser.add_argument("--screen", type=int, nargs=2, default=[1920, 1080], metavar=("WIDTH", "HEIGHT"))
+    args = parser.parse_args()
+
+    if args.sessions:
+        sessions = [(path, *recorded_session(path)) for path in args.sessions]
+    else:
+        sessions = [("synthetic", *pointer_session(fps=args.fps, jitter=args.jitter))]
+    screen = (args.screen[0] - 2 * SCREEN_MARGIN, args.screen[1] - 2 * SCREEN_MARGIN)
+    shown_after = args.latency + args.display
+
+    print(f"{'session':>12} {'predict':>8} {'lag':>8} {'jitter':>9} {'overshoot':>10}")
+    for name, truth, measured, timestamps, segment in sessions:
+        # Vị trí đầu ngón trỏ tại thời điểm con trỏ của từng frame hiện trên màn hình
+        shown = np.stack([np.interp(timestamps + shown_after, timestamps, truth[:, axis])
+                          for axis in range(2)], axis=1)
+        shown_segment = segment[np.minimum(np.searchsorted(timestamps, timestamps + shown_after),
+                                           len(timestamps) - 1)]
+        for predictor in (False, True):
+            output = run_pipeline(measured, timestamps, args.filter, args.latency, predictor)
+            metrics = cursor_metrics(output, shown, timestamps, shown_segment, screen)
+            print(f"{name[-12:]:>12} {'on' if predictor else 'off':>8} {metrics['lag_ms']:>6.0f}ms "
+                  f"{metrics['jitter_px']:>7.2f}px {metrics['overshoot_px']:>8.1f}px")
+
+
+if __name__ == "__main__":
+    main()
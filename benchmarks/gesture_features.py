@@ -0,0 +1,159 @@
+"""
+Gesture Features Micro-benchmark
+So sánh số µs mỗi frame giữa cách tính khoảng cách vô hướng cũ và vector đặc trưng vector hóa
+
+Trên mảng vài chục phần tử, mỗi lệnh NumPy tốn chủ yếu chi phí gọi (~0.5-1 µs) nên đường từng frame
+(một vector đặc trưng + một lần kiểm tra luật, khoảng chục lệnh) không nhanh hơn code vô hướng cũ
+khi đầu vào là tuple Python; nó nhanh hơn khi đầu vào là mảng NumPy như HandTracker trả về (code cũ
+phải đọc từng phần tử thành scalar NumPy). Vector hóa thực sự có lợi ở đường batch (cả chuỗi frame
+trong vài lệnh), dùng cho evaluate_gestures và huấn luyện classifier.
+
+Sử dụng:
+    python -m benchmarks.gesture_features
+    python -m benchmarks.gesture_features --landmarks landmarks.npz --repeat 5
+"""
+
+import argparse
+import time
+import numpy as np
+from typing import List, Tuple
+from config.settings import CLICK_THRESHOLD
+from utils.gesture import GestureRecognizer
+from utils.gesture_features import compute_features_batch
+
+
+def _distance(point1, point2) -> float:
+    """Khoảng cách Euclidean vô hướng như bản cũ"""
+    return np.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
+
+
+def legacy_detect(landmarks: List[Tuple[float, float]]) -> Tuple[bool, bool]:
+    """
+    Bản cũ của detect_pinch_gesture / detect_fist_gesture (bỏ phần làm mượt):
+    mỗi khoảng cách là một lần gọi np.sqrt trên tuple
+
+    Returns:
+        Tuple[bool, bool]: (pinch, fist) của frame
+    """
+    tip_distance = _distance(landmarks[8], landmarks[4])
+    index_extended = _distance(landmarks[6], landmarks[8]) > 0.05
+    thumb_extended = _distance(landmarks[3], landmarks[4]) > 0.03
+    pinch = tip_distance < CLICK_THRESHOLD and index_extended and thumb_extended
+
+    wrist = landmarks[0]
+    closed_fingers = 0
+    for i, (tip, mcp) in enumerate(zip((4, 8, 12, 16, 20), (2, 5, 9, 13, 17))):
+        tip_to_wrist = _distance(landmarks[tip], wrist)
+        mcp_to_wrist = _distance(landmarks[mcp], wrist)
+        if i == 0:
+            if abs(landmarks[tip][0] - landmarks[mcp][0]) < 0.05:
+                closed_fingers += 1
+        elif tip_to_wrist < mcp_to_wrist * 0.9:
+            closed_fingers += 1
+
+    return bool(pinch), closed_fingers >= 4
+
+
+def vectorized_detect(recognizer: GestureRecognizer, landmarks: np.ndarray,
+                      pinch: int = 1, fist: int = 0) -> Tuple[bool, bool]:
+    """
+    Một lần tính vector đặc trưng, mọi luật gesture được kiểm tra trong một lần đánh giá vector hóa
+
+    Args:
+        recognizer: GestureRecognizer cung cấp bộ tính đặc trưng và bộ luật
+        landmarks: Mảng (21, 2|3)
+        pinch: Vị trí luật "pinch" trong recognizer.rules.names
+        fist: Vị trí luật "fist" trong recognizer.rules.names
+
+    Returns:
+        Tuple[bool, bool]: (pinch, fist) của frame
+    """
+    matched = recognizer.rules.match(recognizer.compute_features(landmarks))
+    return bool(matched[pinch]), bool(matched[fist])
+
+
+def batch_detect(recognizer: GestureRecognizer, hands: np.ndarray) -> np.ndarray:
+    """
+    Đặc trưng và luật của cả chuỗi frame trong vài lệnh vector hóa (như evaluate_gestures)
+
+    Returns:
+        np.ndarray: Mảng (T, số luật) bool
+    """
+    return recognizer.rules.match_batch(compute_features_batch(hands))
+
+
+def load_hands(path: str, count: int) -> np.ndarray:
+    """
+    Lấy các bàn tay (21, 2) từ file .npz của --process-video, hoặc sinh ngẫu nhiên nếu không có file
+
+    Returns:
+        np.ndarray: Mảng (count, 21, 2) float32
+    """
+    if path:
+        data = np.load(path)
+        hands = data['landmarks'][data['num_hands'] > 0, 0, :, :2]
+        if len(hands):
+            return hands[np.arange(count) % len(hands)].astype(np.float32)
+
+    rng = np.random.default_rng(0)
+    base = rng.uniform(0.3, 0.7, size=(1, 21, 2))
+    return (base + rng.normal(0, 0.05, size=(count, 21, 2))).astype(np.float32)
+
+
+def time_per_frame(function, frames) -> float:
+    """Thời gian trung bình mỗi frame (µs)"""
+    start = time.perf_counter()
+    for frame in frames:
+        function(frame)
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark gesture feature extraction")
+    parser.add_argument("--landmarks", help="Landmarks .npz from main.py --process-video (default: synthetic hands)")
+    parser.add_argument("--frames", type=int, default=5000, help="Number of hands per run")
+    parser.add_argument("--repeat", type=int, default=7, help="Number of runs, best time is reported")
+    args = parser.parse_args()
+
+    hands = load_hands(args.landmarks, args.frames)
+    # Bản cũ nhận danh sách tuple (x, y) như trước khi HandTracker trả mảng NumPy
+    hand_tuples = [[tuple(point) for point in hand.tolist()] for hand in hands]
+    recognizer = GestureRecognizer()
+    names = recognizer.rules.names
+    pinch, fist = names.index('pinch'), names.index('fist')
+
+    runs = {
+        # Cùng code cũ nhưng nhận mảng (21, 2) như HandTracker hiện tại (mỗi phần tử là scalar NumPy)
+        'legacy': (legacy_detect, hand_tuples),
+        'legacy_array': (legacy_detect, hands),
+        'vectorized': (lambda hand: vectorized_detect(recognizer, hand, pinch, fist), hands),
+        'extract_only': (recognizer.compute_features, hands),
+        'batch': (lambda chunk: batch_detect(recognizer, chunk), [hands]),
+    }
+    # Các cách chạy xen kẽ trong mỗi lượt để nhiễu của máy (tần số CPU, tiến trình khác) chia đều
+    best = {name: float('inf') for name in runs}
+    for _ in range(args.repeat):
+        for name, (function, frames) in runs.items():
+            best[name] = min(best[name], time_per_frame(function, frames))
+    legacy, legacy_array, vectorized, extract_only = (best[name] for name in list(runs)[:4])
+    batch = best['batch'] / len(hands)
+
+    agree = sum(legacy_detect(t) == vectorized_detect(recognizer, h, pinch, fist)
+                for t, h in zip(hand_tuples, hands))
+    matched = batch_detect(recognizer, hands)
+    batch_agree = np.mean([legacy_detect(t) == (matched[i, pinch], matched[i, fist])
+                           for i, t in enumerate(hand_tuples)])
+
+    print(f"🖐️  {len(hands)} hands, best of {args.repeat}")
+    print(f"{'scalar, tuples':>22}: {legacy:8.1f} µs/frame")
+    print(f"{'scalar, ndarray':>22}: {legacy_array:8.1f} µs/frame")
+    print(f"{'vectorized per frame':>22}: {vectorized:8.1f} µs/frame  "
+          f"({legacy / vectorized:.2f}x vs tuples, {legacy_array / vectorized:.2f}x vs ndarray)")
+    print(f"{'feature vector only':>22}: {extract_only:8.1f} µs/frame")
+    print(f"{'vectorized batch':>22}: {batch:8.2f} µs/frame  ({legacy / batch:.0f}x vs tuples)")
+    print(f"{'decision agreement':>22}: {100 * agree / len(hands):8.1f}% per frame, "
+          f"{100 * batch_agree:.1f}% batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Gesture Replay
+Chạy lại logic nhận diện gesture trên landmarks đã ghi để so sánh các bộ ngưỡng mà không cần thử trực tiếp
+
+Sử dụng:
+    python main.py --process-video session.mp4 --out session.npz
+    python -m benchmarks.gesture_replay session.npz --click-thresholds 0.04 0.05 0.06 0.07
+    python -m benchmarks.gesture_replay session.npz --cooldowns 0.1 0.3 --pinch-windows 3 5
+    python -m benchmarks.gesture_replay session.npz --verify
+"""
+
+import argparse
+import itertools
+import time
+import numpy as np
+from config.settings import CLICK_THRESHOLD, CLICK_COOLDOWN, PINCH_STABILITY_FRAMES
+from utils.gesture_batch import evaluate_gestures, replay_gestures, summarize, BATCH_LABELS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay gesture recognition over recorded landmarks")
+    parser.add_argument("landmarks", help="Landmarks .npz from main.py --process-video")
+    parser.add_argument("--click-thresholds", type=float, nargs="+", default=[CLICK_THRESHOLD])
+    parser.add_argument("--cooldowns", type=float, nargs="+", default=[CLICK_COOLDOWN])
+    parser.add_argument("--pinch-windows", type=int, nargs="+", default=[PINCH_STABILITY_FRAMES],
+                        help="Pinch stability windows (majority of the window is required)")
+    parser.add_argument("--verify", action="store_true",
+                        help="Also replay through the live GestureRecognizer on a virtual clock and "
+                             "report the agreement with the batch evaluation")
+    args = parser.parse_args()
+
+    data = np.load(args.landmarks)
+    landmarks = data['landmarks'][:, 0]
+    present = data['num_hands'] > 0
+    timestamps = data['timestamps']
+    duration = timestamps[-1] - timestamps[0] if len(timestamps) > 1 else 0.0
+    print(f"🖐️  {len(landmarks)} frames ({duration / 60:.1f} min), hand in {100 * present.mean():.1f}%")
+
+    print(f"{'threshold':>10} {'cooldown':>9} {'window':>7} {'left':>7} {'right':>7} "
+          f"{'L cool':>7} {'R cool':>7} {'ms':>8}" + (f" {'live ms':>8} {'agree':>7}" if args.verify else ""))
+    for threshold, cooldown, window in itertools.product(args.click_thresholds, args.cooldowns,
+                                                         args.pinch_windows):
+        stability = {'pinch': {'window': window, 'min_votes': window // 2 + 1}}
+        start = time.perf_counter()
+        decisions = evaluate_gestures(
+            landmarks, timestamps, present, click_threshold=threshold, click_cooldown=cooldown,
+            stability=stability
+        )
+        elapsed = time.perf_counter() - start
+        
+        verification = ""
+        if args.verify:
+            # Gesture động không có trong evaluate_gestures nên tắt khi so sánh
+            start = time.perf_counter()
+            live = replay_gestures(landmarks, timestamps, present, click_threshold=threshold,
+                                   click_cooldown=cooldown, stability=stability, classifier_mode="rules",
+                                   dynamic_gestures=False)
+            live_elapsed = time.perf_counter() - start
+            agree = np.mean([BATCH_LABELS[code] == gesture for code, gesture in zip(decisions.tolist(), live)])
+            verification = f" {live_elapsed * 1000:>8.1f} {100 * agree:>6.2f}%"
+
+        # Mỗi frame "left_click"/"right_click" là một lần click chuột trong ứng dụng
+        counts = summarize(decisions)
+        print(f"{threshold:>10.3f} {cooldown:>9.2f} {window:>7d} {counts['left_click']:>7d} "
+              f"{counts['right_click']:>7d} {counts['left_click_cooldown']:>7d} "
+              f"{counts['right_click_cooldown']:>7d} {elapsed * 1000:>8.1f}{verification}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Inference Scale Benchmark
+So sánh FPS và sai số landmark khi chạy MediaPipe ở các độ phân giải inference khác nhau
+
+Sử dụng:
+    python -m benchmarks.inference_scale --source recording.mp4 --widths 0 320 256 192
+"""
+
+import argparse
+import time
+import numpy as np
+from benchmarks.common import load_frames, results_to_array
+from modules.hand_tracking import HandTracker
+
+
+def run_tracker(frames: list, inference_width: int) -> tuple:
+    """
+    Chạy một HandTracker riêng trên toàn bộ frame
+
+    Args:
+        frames: Danh sách frame BGR
+        inference_width: Chiều rộng inference (0 = độ phân giải gốc)
+
+    Returns:
+        tuple: (fps, danh sách landmarks (21, 2) hoặc None cho mỗi frame)
+    """
+    tracker = HandTracker(inference_mode="inline", roi_tracking=False, inference_width=inference_width)
+    outputs = []
+    try:
+        start = time.perf_counter()
+        for frame in frames:
+            results = tracker.run_inference(frame)
+            outputs.append(results_to_array(results))
+        elapsed = time.perf_counter() - start
+    finally:
+        tracker.release()
+
+    return len(frames) / elapsed if elapsed > 0 else 0.0, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MediaPipe inference resolution")
+    parser.add_argument("--source", default="0", help="Video file or camera index (default: 0)")
+    parser.add_argument("--frames", type=int, default=300, help="Maximum number of frames to use")
+    parser.add_argument("--widths", type=int, nargs="+", default=[0, 480, 320, 256, 192],
+                        help="Inference widths to test (0 = full resolution)")
+    args = parser.parse_args()
+
+    frames = load_frames(args.source, args.frames)
+    if not frames:
+        print("❌ No frames read from source")
+        return
+
+    height, width = frames[0].shape[:2]
+    print(f"📹 {len(frames)} frames at {width}x{height}")
+
+    # Kết quả ở độ phân giải gốc là chuẩn để so sánh
+    reference_fps, reference = run_tracker(frames, 0)
+
+    print(f"{'width':>8} {'fps':>8} {'speedup':>8} {'detect%':>8} {'agree%':>8} {'err px':>8} {'p95 px':>8}")
+    for inference_width in args.widths:
+        if inference_width == 0:
+            fps, outputs = reference_fps, reference
+        else:
+            fps, outputs = run_tracker(frames, inference_width)
+
+        detected = sum(output is not None for output in outputs)
+        errors = []
+        agree = 0
+        for ref, out in zip(reference, outputs):
+            if (ref is None) == (out is None):
+                agree += 1
+            if ref is not None and out is not None:
+                # Sai số tính theo pixel của frame gốc
+                diff = (out - ref) * np.array([width, height], dtype=np.float32)
+                errors.append(np.sqrt((diff ** 2).sum(axis=1)))
+
+        if errors:
+            errors = np.concatenate(errors)
+            mean_error, p95_error = errors.mean(), np.percentile(errors, 95)
+        else:
+            mean_error = p95_error = float('nan')
+
+        label = "full" if inference_width == 0 else str(inference_width)
+        print(f"{label:>8} {fps:>8.1f} {fps / reference_fps:>7.2f}x "
+              f"{100 * detected / len(frames):>7.1f}% {100 * agree / len(frames):>7.1f}% "
+              f"{mean_error:>8.2f} {p95_error:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,19 +9,92 @@ FPS = 30
 # Cấu hình MediaPipe Hand Detection
 DETECTION_CONFIDENCE = 0.7  # Độ tin cậy tối thiểu để phát hiện tay (0.0 - 1.0)
 TRACKING_CONFIDENCE = 0.5   # Độ tin cậy tối thiểu để theo dõi tay (0.0 - 1.0)
-MAX_HANDS = 1              # Số lượng tay tối đa được phát hiện
+MAX_HANDS = 1              # Số lượng tay tối đa được phát hiện (2 để dùng hai tay)
+PRIMARY_HAND = "auto"      # Tay điều khiển chuột: "auto" (tay xuất hiện trước), "Left" hoặc "Right"
+HAND_MATCH_MAX_DISTANCE = 0.25  # Khoảng cách tối đa (normalized) để ghép tay với tay ở frame trước
+HAND_TRACK_TTL = 15        # Số frame giữ ID của tay đã biến mất trước khi cấp ID mới
+
+# Cấu hình backend nhận diện
+HAND_BACKEND = "solutions"  # "solutions" (mp.solutions.hands) hoặc "tasks" (MediaPipe Tasks HandLandmarker)
+MODEL_COMPLEXITY = 1       # 0 = model nhẹ (nhanh hơn), 1 = model đầy đủ (chỉ backend solutions, tasks bỏ qua)
+HAND_LANDMARKER_MODEL = "models/hand_landmarker.task"  # File model cho backend tasks
+TASKS_RUNNING_MODE = "live_stream"  # "live_stream" (bất đồng bộ, kết quả qua callback) hoặc "video" (đồng bộ)
+TASKS_DELEGATE = "cpu"     # "cpu" hoặc "gpu" cho backend tasks
+OPENCV_THREADS = 0         # Số thread OpenCV cho resize/cvtColor trước inference (0 = mặc định; không ảnh hưởng thread của MediaPipe)
+MODEL_WARMUP = True        # Chạy model trên frame giả song song với lúc mở camera để frame đầu không bị chậm
+
+# Cấu hình Inference
+INFERENCE_MODE = "inline"  # "inline" (chạy trên main thread) hoặc "process" (worker process riêng)
+INFERENCE_RING_SLOTS = 2   # Số slot frame trong shared-memory ring khi chạy chế độ "process"
+INFERENCE_WORKER_RESTARTS = 3  # Số lần khởi động lại worker process bị dừng bất thường trước khi quay về inline
+INFERENCE_WIDTH = 0        # Chiều rộng ảnh đưa vào MediaPipe (vd: 256, 320; 0 = giữ nguyên độ phân giải)
+INFERENCE_INTERVAL = 1     # Chạy MediaPipe mỗi N frame, các frame giữa dùng landmarks dự đoán (1 = mọi frame)
+PREDICTION_MOTION_THRESHOLD = 12.0  # Chênh lệch mức xám trung bình vùng tay để buộc chạy inference sớm
+PREDICTION_VELOCITY_SMOOTHING = 0.5 # Trọng số vận tốc mới khi dự đoán landmarks (0.0 - 1.0)
+MOTION_GATE = False        # Dùng lại kết quả inference trước khi cảnh gần như không đổi
+MOTION_GATE_THRESHOLD = 4.0  # Chênh lệch mức xám trung bình (0-255) của khối thay đổi nhiều nhất dưới ngưỡng này coi là cảnh tĩnh
+MOTION_GATE_SIZE = (64, 48)  # Kích thước ảnh xám thu nhỏ dùng để so sánh
+MOTION_GATE_BLOCK = 4        # Cạnh khối (pixel ảnh thu nhỏ, ~40px frame 640) - đủ nhỏ để thấy đầu ngón tay nhúc nhích
+MOTION_GATE_MAX_REUSE = 30   # Số frame tối đa dùng lại kết quả trước khi bắt buộc chạy inference (không có tay)
+MOTION_GATE_HAND_MAX_REUSE = 2  # Số frame tối đa dùng lại kết quả khi đang có tay (tránh mất click, đứng con trỏ)
+ROI_TRACKING = False       # Chỉ chạy inference trên vùng quanh bàn tay ở frame trước (khi đã thấy đủ MAX_HANDS tay)
+ROI_PADDING = 0.5          # Phần mở rộng bounding box mỗi phía (theo kích thước bàn tay)
+ROI_MIN_SIZE = 0.3         # Kích thước ROI tối thiểu (tỉ lệ so với cạnh ngắn của frame)
+ROI_MIN_CONFIDENCE = 0.8   # Dưới ngưỡng này thì quay về detect trên toàn frame
+ROI_EDGE_MARGIN = 0.02     # Landmark sát mép ROI hơn ngưỡng này = tay sắp rời khỏi ROI
 
 # Cấu hình điều khiển chuột
 SMOOTHING_FACTOR = 0.7     # Tăng để làm mượt hơn (0.0 - 1.0, càng cao càng mượt)
 MOUSE_SPEED = 1.5          # Tốc độ di chuyển chuột
 MOUSE_ACCELERATION = 1.0   # Không dùng gia tốc để tránh nháy
 DEADZONE_SIZE = 0.05       # Tăng vùng chết để tránh rung lắc
+# Bộ lọc con trỏ (benchmarks.cursor_filters: trễ/rung/vượt điểm dừng): "ema" giữ cảm giác con trỏ như trước
+# (117ms/2.6px/0.5px), "one_euro" bám nhanh hơn nhiều (25ms/2.5px/3.4px), "kalman" (17ms/3.4px/15px)
+CURSOR_FILTER = "ema"      # Bộ lọc con trỏ: "ema" (cửa sổ trọng số + SMOOTHING_FACTOR), "one_euro" hoặc "kalman"
+CURSOR_ONE_EURO_MIN_CUTOFF = 0.5  # Tần số cắt khi đứng yên của bộ lọc One Euro con trỏ (Hz)
+CURSOR_ONE_EURO_BETA = 10.0       # Hệ số tăng tần số cắt theo tốc độ (lớn hơn = ít trễ hơn khi di chuyển nhanh)
+CURSOR_ONE_EURO_D_CUTOFF = 1.0    # Tần số cắt của vận tốc (Hz)
+CURSOR_KALMAN_PROCESS_NOISE = 0.2       # Mật độ phổ gia tốc của Kalman (lớn hơn = bám nhanh hơn, rung hơn)
+CURSOR_KALMAN_MEASUREMENT_NOISE = 0.004 # Độ lệch chuẩn nhiễu vị trí đầu ngón trỏ (normalized)
+# Dự đoán con trỏ: giảm trễ nhưng vượt điểm dừng nhiều hơn khi dừng tay đột ngột. benchmarks.cursor_prediction
+# (phiên tổng hợp, trễ 40ms + 30ms màn hình): one_euro 96ms/7.8px -> 57ms/24px, ema 182ms/2.8px -> 115ms/2.8px
+CURSOR_PREDICTION = False  # Bật để ngoại suy con trỏ về phía trước bằng độ trễ đo được của pipeline (tắt mặc định)
+CURSOR_PREDICTION_EXTRA_LATENCY = 0.03  # Độ trễ không đo được qua timestamp: camera trước khi đọc frame + màn hình (giây)
+CURSOR_PREDICTION_MAX_HORIZON = 0.05    # Khoảng ngoại suy tối đa (giây), lớn hơn = ít trễ hơn nhưng vượt điểm dừng nhiều hơn
+CURSOR_PREDICTION_MIN_SPEED = 0.2       # Dưới tốc độ này không ngoại suy (normalized / giây), tránh khuếch đại rung
+CURSOR_PREDICTION_VELOCITY_TIME = 0.02  # Hằng số thời gian làm mượt vận tốc dự đoán (giây)
 
 # Cấu hình gesture recognition
+LANDMARK_FILTER = True     # Lọc One Euro landmarks của từng tay ngay sau HandTracker.get_landmarks
+ONE_EURO_MIN_CUTOFF = 1.0  # Tần số cắt khi tay đứng yên (Hz) - nhỏ hơn thì mượt hơn
+ONE_EURO_BETA = 10.0       # Tăng tần số cắt theo tốc độ landmark - lớn hơn thì ít trễ hơn khi di chuyển nhanh
+ONE_EURO_D_CUTOFF = 1.0    # Tần số cắt của vận tốc (Hz)
+TRACKING_MAX_GAP = 0.25    # Mất tay lâu hơn (giây) thì bộ lọc landmarks/con trỏ, dự đoán con trỏ và click onset bắt đầu lại
 CLICK_THRESHOLD = 0.06     # Giảm xuống để cần chạm gần hơn mới click
 FIST_THRESHOLD = 0.8       # Tăng để khó kích hoạt right click hơn
 DOUBLE_CLICK_TIME = 0.5    # Thời gian cho double click
-PINCH_STABILITY_FRAMES = 3 # Tăng số frame ổn định để tránh false positive
+# Landmarks đã lọc không còn rung quanh ngưỡng nên cửa sổ ổn định/bầu chọn được thu nhỏ (ít trễ hơn)
+PINCH_STABILITY_FRAMES = 1 if LANDMARK_FILTER else 3  # Số frame ổn định để tránh false positive
+GESTURE_VOTE_WINDOW = 3 if LANDMARK_FILTER else 5     # Số frame gần nhất dùng để bầu chọn gesture đầu ra (nhiều phiếu nhất)
+GESTURE_STABILITY = {      # Mỗi detector: cửa sổ (frame) và số frame tối thiểu phải phát hiện trong cửa sổ
+    'pinch': {'window': PINCH_STABILITY_FRAMES, 'min_votes': PINCH_STABILITY_FRAMES // 2 + 1},
+    'fist': {'window': 1, 'min_votes': 1},
+}
+CLICK_MODE = "vote"        # "vote": nhíp qua cửa sổ ổn định và bầu chọn, "onset": click ngay khi bắt đầu nhíp
+CLICK_RELEASE_RATIO = 1.6  # Chế độ onset: nhả nhíp khi khoảng cách > CLICK_THRESHOLD x hệ số này (hysteresis)
+CLICK_ONSET_RATIO = 1.4    # Chế độ onset: khép nhanh thì click sớm khi khoảng cách < CLICK_THRESHOLD x hệ số này
+CLICK_ONSET_SPEED = 3.0    # Chế độ onset: tốc độ khép tối thiểu (kích thước lòng bàn tay / giây) để click sớm
+LANDMARK_HISTORY_FRAMES = 64  # Số frame landmarks giữ trong lịch sử dùng chung (phải phủ HOVER_TIME: 64 frame đủ tới 60 FPS)
+GESTURE_CLASSIFIER_MODE = "rules"  # "rules": chỉ dùng luật, "classifier": model thay luật, "shadow": chạy song song để so sánh
+GESTURE_CLASSIFIER_MODEL = "models/gesture_classifier.npz"  # Model của train_gesture_classifier.py
+
+# Cấu hình gesture động (vuốt, vẽ vòng tròn) - so khớp quỹ đạo đầu ngón trỏ bằng DTW
+DYNAMIC_GESTURES = False   # Bật nhận diện gesture động (dễ nhầm với di chuột nhanh nên tắt mặc định)
+DYNAMIC_MATCH_THRESHOLD = 0.35  # Khoảng cách DTW trung bình mỗi mẫu tối đa để coi là khớp template
+DYNAMIC_MIN_SPEED = 4.0    # Tốc độ (kích thước lòng bàn tay / giây) từ đó hướng di chuyển được tính đầy đủ
+DYNAMIC_WARP_PENALTY = 0.5  # Chi phí thêm mỗi bước DTW chỉ tiến trên template (tránh một frame khớp cả template)
+DYNAMIC_COOLDOWN = 0.8     # Thời gian chờ giữa hai lần nhận gesture động (giây)
+DYNAMIC_MAX_GAP = 0.25     # Mất tay lâu hơn (giây) thì bắt đầu lại quỹ đạo
 
 # Cấu hình cooldown (tránh click liên tục)
 CLICK_COOLDOWN = 0.1       # Giảm thời gian cooldown xuống rất thấp
@@ -42,6 +115,14 @@ PRECISION_MODE_THRESHOLD = 0.1  # Ngưỡng để bật chế độ chính xác
 PRECISION_SPEED_FACTOR = 0.3    # Tốc độ trong chế độ chính xác
 STABILIZATION_FRAMES = 3        # Số frame ổn định trước khi di chuyển chuột
 
+# Cấu hình Idle power mode
+IDLE_TIMEOUT = 10.0        # Số giây không thấy tay trước khi giảm tốc độ capture/inference (0 = tắt)
+IDLE_FPS = 5               # FPS capture và inference khi không có tay
+IDLE_WAKE_FLUSH_FRAMES = 4  # Số frame cũ tối đa trong buffer camera bỏ qua khi thoát idle (0 = không bỏ)
+
+# Cấu hình xử lý video offline
+VIDEO_SHARD_OVERLAP = 30   # Số frame warm-up trước mỗi shard để tracking ổn định
+
 # Cấu hình Network Camera
 DEFAULT_CAMERA_PORT = 8080  # Port mặc định cho camera server
 NETWORK_TIMEOUT = 5        # Timeout kết nối network camera (giây)
@@ -56,6 +137,9 @@ SHOW_ERROR_WINDOW = True   # Hiển thị cửa sổ lỗi khi có vấn đề
 DEBUG_MODE = True          # Bật debug mode để hiển thị thông tin chi tiết
 SHOW_DEBUG_INFO = True     # Hiển thị debug info trên GUI
 SHOW_LANDMARKS = True      # Hiển thị landmarks của bàn tay
+LANDMARK_JOINT_RADIUS = 4  # Bán kính điểm khớp khi vẽ landmarks (pixel)
+LANDMARK_BONE_THICKNESS = 2  # Độ dày nét xương khi vẽ landmarks (pixel)
+LANDMARK_BONE_COLOR = (224, 224, 224)  # Màu xương bàn tay (BGR)
 SHOW_GESTURE_INFO = True   # Hiển thị thông tin gesture chi tiết
 LOG_LEVEL = "DEBUG"        # Mức độ log: DEBUG, INFO, WARNING, ERROR
 SAVE_DEBUG_FRAMES = False  # Lưu frame debug khi có lỗi
@@ -4,13 +4,32 @@ Chế độ demo để test gesture detection mà không điều khiển chuột
 """
 
 import cv2
-import time
 import logging
 import sys
 from modules.camera_manager import CameraManager
 from modules.hand_tracking import HandTracker
+from modules.landmark_renderer import LandmarkRenderer
 from utils.gesture import GestureRecognizer
-from config.settings import WINDOW_NAME, TEXT_COLOR, GESTURE_COLOR, ERROR_COLOR
+from utils.landmark_filter import OneEuroLandmarkFilter
+from utils.gesture_events import GestureEventBus, GestureStateMachine, GestureEvent
+from utils.clock import SYSTEM_CLOCK
+from config.settings import WINDOW_NAME, TEXT_COLOR, GESTURE_COLOR, ERROR_COLOR, SHOW_LANDMARKS, LANDMARK_FILTER
+
+# Text hiển thị theo gesture (demo không điều khiển chuột)
+GESTURE_TEXTS = {
+    "left_click": "🖱️ LEFT CLICK DETECTED!",
+    "right_click": "🖱️ RIGHT CLICK DETECTED!",
+    "swipe_left": "👈 SWIPE LEFT",
+    "swipe_right": "👉 SWIPE RIGHT",
+    "swipe_up": "👆 SWIPE UP",
+    "swipe_down": "👇 SWIPE DOWN",
+    "circle_cw": "🔃 CIRCLE",
+    "circle_ccw": "🔄 CIRCLE",
+    "pinch_start": "🤏 PINCH",
+    "drag_move": "✊ DRAG",
+    "fist_start": "✊ FIST",
+    "hover_enter": "⏸️ HOVER",
+}
 
 class AeroHandDemo:
     """Demo mode của AeroHand chỉ hiển thị gesture detection"""
@@ -20,15 +39,23 @@ class AeroHandDemo:
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
         
-        # Components
-        self.camera_manager = CameraManager()
-        self.hand_tracker = HandTracker()
-        self.gesture_recognizer = GestureRecognizer()
+        # Components (cùng một đồng hồ đơn điệu, timestamp lấy lúc capture)
+        self.clock = SYSTEM_CLOCK
+        self.camera_manager = CameraManager(self.clock)
+        self.hand_tracker = HandTracker(clock=self.clock)
+        self.landmark_renderer = LandmarkRenderer() if SHOW_LANDMARKS else None
+        self.gesture_recognizer = GestureRecognizer(clock=self.clock)
+        self.landmark_filter = OneEuroLandmarkFilter() if LANDMARK_FILTER else None
+        
+        # Text hiển thị được cập nhật qua bus sự kiện thay vì đọc gesture mỗi frame
+        self.event_bus = GestureEventBus()
+        self.gesture_events = GestureStateMachine(self.event_bus)
+        self.event_bus.subscribe(self.update_gesture_text)
         
         # Status
         self.is_running = False
         self.fps_counter = 0
-        self.fps_start_time = time.time()
+        self.fps_start_time = self.clock.now()
         self.current_fps = 0
         
         # Display info
@@ -67,7 +94,7 @@ class AeroHandDemo:
                 if not ret or frame is None:
                     continue
                 
-                processed_frame = self.process_frame(frame)
+                processed_frame = self.process_frame(frame, self.camera_manager.last_frame_time)
                 cv2.imshow(f"{WINDOW_NAME} - Demo Mode", processed_frame)
                 
                 key = cv2.waitKey(1) & 0xFF
@@ -90,19 +117,28 @@ class AeroHandDemo:
         
         return self.camera_manager.initialize_camera()
     
-    def process_frame(self, frame):
-        """Xử lý frame"""
+    def process_frame(self, frame, timestamp: float):
+        """Xử lý frame (timestamp: thời điểm capture theo self.clock)"""
         height, width = frame.shape[:2]
         
         # Detect hands
-        processed_frame, results = self.hand_tracker.detect_hands(frame)
+        processed_frame, results = self.hand_tracker.detect_hands(frame, timestamp)
+        
+        # Vẽ landmarks (bước hiển thị riêng, tắt bằng SHOW_LANDMARKS)
+        if self.landmark_renderer is not None:
+            self.landmark_renderer.draw(processed_frame, results)
         
         if self.hand_tracker.is_hand_detected(results):
-            landmarks = self.hand_tracker.get_landmarks(results, 0)
+            primary_index = self.hand_tracker.get_primary_hand_index(results)
+            landmarks = self.hand_tracker.get_landmarks(results, primary_index)
             
-            if landmarks:
+            if landmarks is not None:
+                # Lọc rung landmarks như ứng dụng chính
+                if self.landmark_filter is not None:
+                    landmarks = self.landmark_filter.apply(landmarks, timestamp)
+                
                 # Get gesture
-                gesture = self.gesture_recognizer.process_gesture(landmarks)
+                gesture = self.gesture_recognizer.process_gesture(landmarks, timestamp)
                 
                 # Get pointer position for visualization
                 pointer_pos = self.gesture_recognizer.get_pointer_position(landmarks)
@@ -115,27 +151,31 @@ class AeroHandDemo:
                     cv2.circle(processed_frame, (pixel_x, pixel_y), 15, GESTURE_COLOR, 3)
                     cv2.circle(processed_frame, (pixel_x, pixel_y), 8, (255, 255, 255), -1)
                 
-                # Update gesture text
-                if gesture == "left_click":
-                    self.gesture_text = "🖱️ LEFT CLICK DETECTED!"
-                elif gesture == "right_click":
-                    self.gesture_text = "🖱️ RIGHT CLICK DETECTED!"
-                elif gesture in ["left_click_cooldown", "right_click_cooldown"]:
-                    self.gesture_text = "⏳ COOLDOWN..."
-                else:
-                    self.gesture_text = "👉 POINTING / MOVING"
+                # Text hiển thị được cập nhật bởi subscriber khi trạng thái gesture thay đổi
+                self.gesture_events.update(int(results.ids[primary_index]), self.gesture_recognizer, gesture, timestamp)
                 
                 self.status_text = "✅ Hand detected - Tracking gestures"
             else:
+                self.gesture_events.release(timestamp)
                 self.gesture_text = "🤔 Hand visible but no landmarks"
                 self.status_text = "Processing hand data..."
         else:
+            self.gesture_events.release(timestamp)
+            # Mất tay: tay xuất hiện lại bắt đầu lịch sử mới (hover không tính thời gian vắng mặt)
+            if len(self.gesture_recognizer.history):
+                self.gesture_recognizer.reset_tracking()
+                if self.landmark_filter is not None:
+                    self.landmark_filter.reset()
             self.gesture_text = "👋 Show your hand to the camera"
             self.status_text = "🔍 Looking for hands..."
         
         self.draw_demo_ui(processed_frame)
         return processed_frame
     
+    def update_gesture_text(self, event: GestureEvent):
+        """Cập nhật text hiển thị theo sự kiện gesture"""
+        self.gesture_text = GESTURE_TEXTS.get(event.type, "👉 POINTING / MOVING")
+    
     def draw_demo_ui(self, frame):
         """Vẽ UI cho demo mode"""
         height, width = frame.shape[:2]
@@ -174,7 +214,7 @@ class AeroHandDemo:
         """Calculate FPS"""
         self.fps_counter += 1
         if self.fps_counter >= 30:
-            current_time = time.time()
+            current_time = self.clock.now()
             self.current_fps = self.fps_counter / (current_time - self.fps_start_time)
             self.fps_counter = 0
             self.fps_start_time = current_time
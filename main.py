@@ -6,49 +6,121 @@ Tác giả: AeroHand Team
 Phiên bản: 1.0.0
 """
 
-import cv2
-import numpy as np
 import time
 import logging
 import sys
 import argparse
+import threading
 from typing import Optional
 
-# Import các module tự định nghĩa
-from modules.camera_manager import CameraManager
-from modules.hand_tracking import HandTracker
-from utils.mouse_control import MouseController
-from utils.gesture import GestureRecognizer
+# Mốc thời gian bắt đầu để đo thời gian khởi động
+PROCESS_START = time.perf_counter()
+
+# Import các module tự định nghĩa (chỉ các module nhẹ, không kéo theo cv2/mediapipe/pyautogui)
+from modules.presence_scheduler import PresenceScheduler
+from utils.gesture_events import GestureEventBus, GestureStateMachine, GestureEvent
+from utils.startup_timer import StartupTimer
+from utils.clock import SYSTEM_CLOCK
 from config.settings import (
     WINDOW_NAME, FONT_SCALE, FONT_THICKNESS, 
     TEXT_COLOR, ERROR_COLOR, GESTURE_COLOR,
-    DEBUG_MODE, SHOW_DEBUG_INFO, SHOW_LANDMARKS, SHOW_GESTURE_INFO
+    DEBUG_MODE, SHOW_DEBUG_INFO, SHOW_LANDMARKS, SHOW_GESTURE_INFO,
+    CAMERA_WIDTH, CAMERA_HEIGHT, MODEL_WARMUP, LANDMARK_FILTER
 )
 
+# Các module nặng được nạp lười bởi load_runtime_modules() khi ứng dụng thực sự chạy,
+# để các lệnh như --scan-network hay --help khởi động ngay
+cv2 = None
+np = None
+CameraManager = None
+HandTracker = None
+MouseController = None
+GestureRecognizer = None
+LandmarkRenderer = None
+LandmarkHistory = None
+OneEuroLandmarkFilter = None
+
+def load_runtime_modules():
+    """Import cv2, numpy, mediapipe và pyautogui (chỉ lần gọi đầu tiên tốn thời gian)"""
+    global cv2, np, CameraManager, HandTracker, MouseController, GestureRecognizer, LandmarkRenderer, LandmarkHistory
+    global OneEuroLandmarkFilter
+    if cv2 is not None:
+        return
+    
+    import cv2
+    import numpy as np
+    from modules.camera_manager import CameraManager
+    from modules.hand_tracking import HandTracker
+    from modules.landmark_renderer import LandmarkRenderer
+    from utils.mouse_control import MouseController
+    from utils.gesture import GestureRecognizer
+    from utils.landmark_history import LandmarkHistory
+    from utils.landmark_filter import OneEuroLandmarkFilter
+
 class AeroHandApp:
     """Class chính của ứng dụng AeroHand"""
     
-    def __init__(self, camera_ip: Optional[str] = None, display_scale: float = 1.0):
+    def __init__(self, camera_ip: Optional[str] = None, display_scale: float = 1.0,
+                 inference_mode: Optional[str] = None, inference_width: Optional[int] = None,
+                 backend: Optional[str] = None, model_complexity: Optional[int] = None):
         """Khởi tạo ứng dụng"""
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
         
+        # Đo thời gian khởi động: import, mở camera, nạp model, landmark đầu tiên
+        self.startup_timer = StartupTimer(PROCESS_START)
+        with self.startup_timer.measure('import'):
+            load_runtime_modules()
+        
         # Camera configuration
         self.camera_ip = camera_ip
         self.is_network_camera = camera_ip is not None
         self.display_scale = display_scale  # Tỉ lệ thu nhỏ cửa sổ hiển thị
         
+        # Một đồng hồ đơn điệu cho cả pipeline: timestamp của frame lấy lúc capture và đi theo frame
+        self.clock = SYSTEM_CLOCK
+        
         # Khởi tạo các components
-        self.camera_manager = CameraManager()
-        self.hand_tracker = HandTracker()
-        self.mouse_controller = MouseController()
-        self.gesture_recognizer = GestureRecognizer()
+        self.camera_manager = CameraManager(self.clock)
+        # HandTracker được tạo và warm-up trong initialize(), song song với việc mở camera
+        self.hand_tracker = None
+        self.tracker_options = {
+            'inference_mode': inference_mode,
+            'inference_width': inference_width,
+            'backend': backend,
+            'model_complexity': model_complexity
+        }
+        self.mouse_controller = MouseController(self.clock)
+        
+        # Bảng hành động theo sự kiện gesture: (hàm thực thi hoặc None, text hiển thị)
+        # Thêm gesture mới chỉ cần khai báo luật (utils.gesture_rules) và một dòng ở đây
+        self.gesture_actions = {
+            "left_click": (self.mouse_controller.left_click, "LEFT CLICK"),
+            "right_click": (self.mouse_controller.right_click, "RIGHT CLICK"),
+            "swipe_right": (self.mouse_controller.switch_window, "NEXT WINDOW"),
+            "swipe_left": (lambda: self.mouse_controller.switch_window(reverse=True), "PREVIOUS WINDOW"),
+            "pinch_start": (None, "PINCH"),
+            "drag_move": (None, "DRAG"),
+            "fist_start": (None, "FIST"),
+            "hover_enter": (None, "HOVER"),
+        }
+        
+        # Bus sự kiện: vòng lặp chính chỉ cập nhật máy trạng thái, các thành phần nhận sự kiện qua subscribe
+        self.event_bus = GestureEventBus()
+        self.gesture_events = GestureStateMachine(self.event_bus)
+        self.setup_event_subscribers()
+        self.landmark_renderer = LandmarkRenderer() if SHOW_LANDMARKS else None
+        self.gesture_recognizers = {}  # GestureRecognizer riêng cho từng ID tay
+        self.cursor_hand_id = None  # ID của tay điều khiển chuột ở frame trước
+        self.landmark_filters = {}  # Bộ lọc One Euro riêng cho từng ID tay (nếu LANDMARK_FILTER)
+        self.presence_scheduler = PresenceScheduler(clock=self.clock)
         
         # Trạng thái ứng dụng
         self.is_running = False
         self.fps_counter = 0
-        self.fps_start_time = time.time()
+        self.fps_start_time = self.clock.now()
         self.current_fps = 0
+        self.hand_present = False
           # Thông tin hiển thị
         self.status_text = "Initializing..."
         self.gesture_text = "No hand detected"
@@ -83,6 +155,35 @@ class AeroHandApp:
         """
         self.logger.info("Đang khởi tạo AeroHand...")
         
+        # Nạp model và warm-up trong thread riêng trong lúc main thread mở camera
+        loader = threading.Thread(target=self.load_hand_tracker, name="HandTrackerLoader", daemon=True)
+        loader.start()
+        
+        with self.startup_timer.measure('camera_open'):
+            camera_ready = self.initialize_camera()
+        loader.join()
+        
+        if not camera_ready:
+            if self.hand_tracker is not None:
+                self.hand_tracker.release()
+                self.hand_tracker = None
+            return False
+        
+        if self.hand_tracker is None:
+            self.status_text = "Hand tracker initialization failed"
+            return False
+        
+        self.logger.info("AeroHand đã được khởi tạo thành công")
+        self.status_text += " - Show your hand to the camera"
+        return True
+    
+    def initialize_camera(self) -> bool:
+        """
+        Mở camera local hoặc network camera
+        
+        Returns:
+            bool: True nếu camera sẵn sàng
+        """
         if self.is_network_camera:
             # Sử dụng network camera
             self.logger.info(f"Connecting to network camera: {self.camera_ip}")
@@ -116,29 +217,44 @@ class AeroHandApp:
                 
             self.status_text = "Local camera ready"
         
-        self.logger.info("AeroHand đã được khởi tạo thành công")
-        self.status_text += " - Show your hand to the camera"
         return True
     
+    def load_hand_tracker(self):
+        """Khởi tạo HandTracker và chạy model trên frame giả (chạy trong thread riêng)"""
+        try:
+            with self.startup_timer.measure('model_load'):
+                tracker = HandTracker(clock=self.clock, **self.tracker_options)
+            
+            if MODEL_WARMUP:
+                with self.startup_timer.measure('warm_up'):
+                    tracker.warm_up((CAMERA_HEIGHT, CAMERA_WIDTH, 3))
+            
+            self.hand_tracker = tracker
+        except Exception as e:
+            self.logger.error(f"Không thể khởi tạo hand tracker: {e}")
+    
     def run(self):
         """Chạy ứng dụng chính"""
         if not self.initialize():
             self.show_error_message()
             return
         
+        self.startup_timer.mark_once('ready')
         self.logger.info("Bắt đầu chạy AeroHand")
         self.is_running = True
         
         try:
             while self.is_running:
+                frame_start = self.clock.now()
+                
                 # Đọc frame từ camera
                 ret, frame = self.camera_manager.read_frame()
                 if not ret or frame is None:
                     self.logger.warning("Không thể đọc frame từ camera")
                     continue
                 
-                # Xử lý frame
-                processed_frame = self.process_frame(frame)
+                # Xử lý frame với thời điểm capture của nó
+                processed_frame = self.process_frame(frame, self.camera_manager.last_frame_time)
                 
                 # Thu nhỏ cửa sổ hiển thị nếu cần
                 if self.display_scale != 1.0:
@@ -150,14 +266,24 @@ class AeroHandApp:
                 # Hiển thị frame
                 cv2.imshow(WINDOW_NAME, processed_frame)
                 
-                # Xử lý sự kiện bàn phím
-                key = cv2.waitKey(1) & 0xFF
+                # Idle power mode: giảm FPS khi không có tay, về tốc độ đầy đủ ngay khi thấy tay
+                if self.presence_scheduler.update(self.hand_present):
+                    self.camera_manager.set_fps(self.presence_scheduler.target_fps())
+                    if not self.presence_scheduler.is_idle:
+                        # Buffer camera còn frame cũ từ lúc đọc chậm ở chế độ idle
+                        self.camera_manager.flush_buffer(fps=self.presence_scheduler.target_fps())
+                wait_ms = max(1, int(self.presence_scheduler.remaining_frame_time(frame_start) * 1000))
+                
+                # Xử lý sự kiện bàn phím (đồng thời chờ để giữ FPS ở chế độ idle)
+                key = cv2.waitKey(wait_ms) & 0xFF
                 if key == ord('q') or key == 27:  # 'q' hoặc ESC để thoát
                     break
                 elif key == ord('r'):  # 'r' để reset
                     self.reset_application()
                 elif key == ord('h'):  # 'h' để hiển thị help
                     self.show_help()
+                elif key == ord('p'):  # 'p' để đổi tay điều khiển chính
+                    self.cycle_primary_hand()
                 
                 # Tính FPS
                 self.calculate_fps()
@@ -169,33 +295,58 @@ class AeroHandApp:
         finally:
             self.cleanup()
     
-    def process_frame(self, frame):
+    def process_frame(self, frame, timestamp: Optional[float] = None):
         """
         Xử lý frame từ webcam
         
         Args:
             frame: Frame từ webcam
+            timestamp: Thời điểm capture của frame theo self.clock (mặc định thời điểm hiện tại)
             
         Returns:
             Frame đã được xử lý
         """
         try:
-            # Lấy kích thước frame
+            # Lấy kích thước frame và thời điểm của frame (ghi cùng landmarks vào lịch sử)
             height, width = frame.shape[:2]
+            if timestamp is None:
+                timestamp = self.clock.now()
             
             # Phát hiện tay
-            processed_frame, results = self.hand_tracker.detect_hands(frame)
+            processed_frame, results = self.hand_tracker.detect_hands(frame, timestamp)
+            self.hand_present = self.hand_tracker.is_hand_detected(results)
+            
+            # Vẽ landmarks (bước hiển thị riêng, tắt bằng SHOW_LANDMARKS)
+            if self.landmark_renderer is not None:
+                self.landmark_renderer.draw(processed_frame, results)
+            
+            if self.hand_present and self.startup_timer.mark_once('first_landmark'):
+                self.logger.info(f"Startup timing: {self.startup_timer.report()}")
+            
+            # Tay vắng mặt ở frame này bắt đầu lại lịch sử khi xuất hiện lại
+            self.reset_lost_hands(results.ids.tolist() if self.hand_present else ())
             
-            if self.hand_tracker.is_hand_detected(results):
-                # Lấy landmarks của tay đầu tiên
-                landmarks = self.hand_tracker.get_landmarks(results, 0)
+            if self.hand_present:
+                # Mỗi tay có trạng thái gesture riêng, tay chính điều khiển chuột
+                primary_index = self.hand_tracker.get_primary_hand_index(results)
+                self.update_secondary_hands(processed_frame, results, primary_index, timestamp)
                 
-                if landmarks:
+                # Lấy landmarks (21, 3) của tay chính
+                landmarks = self.hand_tracker.get_landmarks(results, primary_index)
+                
+                if landmarks is not None:
+                    # Đổi tay điều khiển thì bộ lọc con trỏ bắt đầu lại từ vị trí của tay mới
+                    hand_id = int(results.ids[primary_index])
+                    self.update_cursor_hand(hand_id)
+                    
+                    # Lọc và ghi landmarks vào lịch sử của tay một lần, mọi thành phần đọc từ đó
+                    gesture_recognizer, landmarks = self.prepare_landmarks(hand_id, landmarks, timestamp)
+                    
                     # Nhận diện gesture
-                    gesture = self.gesture_recognizer.process_gesture(landmarks)
+                    gesture = gesture_recognizer.process_gesture(landmarks, timestamp)
                     
                     # Lấy vị trí ngón trỏ để điều khiển chuột
-                    pointer_pos = self.gesture_recognizer.get_pointer_position(landmarks)
+                    pointer_pos = gesture_recognizer.get_pointer_position(landmarks)
                     
                     if pointer_pos:
                         # Chuyển đổi tọa độ normalized sang pixel
@@ -203,31 +354,27 @@ class AeroHandApp:
                         pixel_y = int(pointer_pos[1] * height)
                         
                         # Di chuyển chuột
-                        self.mouse_controller.move_cursor(pixel_x, pixel_y, width, height)
+                        self.mouse_controller.move_cursor_from_history(gesture_recognizer.history)
                         
                         # Vẽ điểm ngón trỏ
                         cv2.circle(processed_frame, (pixel_x, pixel_y), 10, GESTURE_COLOR, -1)
                         cv2.circle(processed_frame, (pixel_x, pixel_y), 15, GESTURE_COLOR, 2)
                     
-                    # Xử lý các gesture click
-                    if gesture == "left_click":
-                        self.mouse_controller.left_click()
-                        self.gesture_text = "LEFT CLICK"
-                    elif gesture == "right_click":
-                        self.mouse_controller.right_click()
-                        self.gesture_text = "RIGHT CLICK"
-                    elif gesture in ["left_click_cooldown", "right_click_cooldown"]:
-                        self.gesture_text = "COOLDOWN"
-                    else:
-                        self.gesture_text = "MOVING"
+                    # Phát sự kiện khi trạng thái gesture thay đổi (chuột, overlay... là subscriber)
+                    self.gesture_events.update(hand_id, gesture_recognizer, gesture, timestamp)
                     
                     self.status_text = "Hand detected - Controlling mouse"
                 else:
+                    self.update_cursor_hand(None)
+                    self.gesture_events.release(timestamp)
                     self.gesture_text = "Hand detected - No landmarks"
                     self.status_text = "Processing hand data..."
             else:
+                self.update_cursor_hand(None)
+                self.gesture_events.release(timestamp)
                 self.gesture_text = "No hand detected"
-                self.status_text = "Show your hand to the camera"
+                self.status_text = "Idle - show your hand to resume" if self.presence_scheduler.is_idle \
+                    else "Show your hand to the camera"
             
             # Vẽ UI lên frame
             self.draw_ui(processed_frame)
@@ -241,6 +388,121 @@ class AeroHandApp:
             self.draw_ui(frame)
             return frame
     
+    def setup_event_subscribers(self):
+        """Đăng ký các subscriber mặc định: hành động chuột, text hiển thị và log debug"""
+        for event_type, (action, _) in self.gesture_actions.items():
+            if action is not None:
+                self.event_bus.subscribe(lambda event, action=action: action(), event_type)
+        self.event_bus.subscribe(self.update_gesture_text)
+        if DEBUG_MODE:
+            self.event_bus.subscribe(lambda event: self.logger.debug(repr(event)))
+    
+    def update_gesture_text(self, event: GestureEvent):
+        """
+        Cập nhật text hiển thị theo sự kiện gesture
+        
+        Args:
+            event: Sự kiện từ bus
+        """
+        _, text = self.gesture_actions.get(event.type, (None, None))
+        self.gesture_text = text or "MOVING"
+    
+    def get_gesture_recognizer(self, hand_id: int) -> "GestureRecognizer":
+        """
+        Lấy GestureRecognizer của một tay, tạo mới nếu tay mới xuất hiện
+        
+        Args:
+            hand_id: ID ổn định của tay
+            
+        Returns:
+            GestureRecognizer: Bộ nhận diện gesture của tay đó
+        """
+        if hand_id not in self.gesture_recognizers:
+            # Bỏ trạng thái của các tay đã mất ID
+            active_ids = set(self.hand_tracker.identity.active_ids())
+            for stale_id in [i for i in self.gesture_recognizers if i not in active_ids]:
+                del self.gesture_recognizers[stale_id]
+                self.landmark_filters.pop(stale_id, None)
+            # Lịch sử landmarks của tay do pipeline ghi, dùng chung cho gesture và con trỏ chuột
+            self.gesture_recognizers[hand_id] = GestureRecognizer(history=LandmarkHistory(), clock=self.clock)
+            if LANDMARK_FILTER:
+                self.landmark_filters[hand_id] = OneEuroLandmarkFilter()
+        return self.gesture_recognizers[hand_id]
+    
+    def update_cursor_hand(self, hand_id: Optional[int]):
+        """
+        Bắt đầu lại bộ lọc và predictor con trỏ khi tay điều khiển chuột đổi ID hoặc mất tay,
+        để con trỏ không nhảy hay ngoại suy từ trạng thái của tay khác
+        
+        Args:
+            hand_id: ID của tay điều khiển chuột ở frame này (None nếu không có)
+        """
+        if hand_id != self.cursor_hand_id:
+            self.mouse_controller.reset_smoothing()
+            self.cursor_hand_id = hand_id
+    
+    def reset_lost_hands(self, present_ids):
+        """
+        Xóa trạng thái theo thời gian (lịch sử, hover, bộ lọc landmarks) của các tay không có trong frame
+        
+        Args:
+            present_ids: ID các tay trong frame hiện tại
+        """
+        for hand_id, gesture_recognizer in self.gesture_recognizers.items():
+            if hand_id not in present_ids and len(gesture_recognizer.history):
+                gesture_recognizer.reset_tracking()
+                landmark_filter = self.landmark_filters.get(hand_id)
+                if landmark_filter is not None:
+                    landmark_filter.reset()
+    
+    def prepare_landmarks(self, hand_id: int, landmarks, timestamp: float):
+        """
+        Lọc landmarks của một tay và ghi vào lịch sử của tay đó
+        
+        Args:
+            hand_id: ID ổn định của tay
+            landmarks: Mảng (21, 3) từ HandTracker
+            timestamp: Thời điểm của frame
+            
+        Returns:
+            Tuple: (GestureRecognizer của tay, landmarks đã lọc)
+        """
+        gesture_recognizer = self.get_gesture_recognizer(hand_id)
+        landmark_filter = self.landmark_filters.get(hand_id)
+        if landmark_filter is not None:
+            landmarks = landmark_filter.apply(landmarks, timestamp)
+        gesture_recognizer.history.push(landmarks, timestamp)
+        return gesture_recognizer, landmarks
+    
+    def update_secondary_hands(self, frame, results, primary_index: Optional[int], timestamp: float):
+        """
+        Cập nhật gesture của các tay phụ (không điều khiển chuột) và vẽ nhãn ID
+        
+        Args:
+            frame: Frame để vẽ lên
+            results: Kết quả từ HandTracker
+            primary_index: Index của tay chính
+            timestamp: Thời điểm của frame
+        """
+        if results.num_hands < 2:
+            return
+        
+        height, width = frame.shape[:2]
+        for index in range(results.num_hands):
+            hand_id = int(results.ids[index])
+            label = f"#{hand_id} {results.labels[index]}"
+            if index != primary_index:
+                gesture_recognizer, landmarks = self.prepare_landmarks(hand_id, results.landmarks[index], timestamp)
+                gesture = gesture_recognizer.process_gesture(landmarks, timestamp)
+                label += f" {gesture}"
+            else:
+                label += " (primary)"
+            
+            wrist_x = int(results.landmarks[index, 0, 0] * width)
+            wrist_y = int(results.landmarks[index, 0, 1] * height)
+            cv2.putText(frame, label, (wrist_x - 40, wrist_y + 25), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, TEXT_COLOR, 1)
+    
     def draw_ui(self, frame):
         """
         Vẽ giao diện người dùng lên frame
@@ -277,6 +539,13 @@ class AeroHandApp:
                        (width - 100, 30), cv2.FONT_HERSHEY_SIMPLEX, 
                        0.6, TEXT_COLOR, 1)
             
+            # Vẽ tỉ lệ frame được motion gate bỏ qua inference
+            gate_stats = self.hand_tracker.get_motion_gate_stats()
+            if gate_stats is not None:
+                cv2.putText(frame, f"Gate: {gate_stats['hit_rate'] * 100:.0f}%", 
+                           (width - 100, 55), cv2.FONT_HERSHEY_SIMPLEX, 
+                           0.6, TEXT_COLOR, 1)
+            
             # Vẽ hướng dẫn
             cv2.putText(frame, "Press 'q' to quit, 'r' to reset, 'h' for help", 
                        (10, height - 20), cv2.FONT_HERSHEY_SIMPLEX, 
@@ -289,15 +558,25 @@ class AeroHandApp:
         """Tính toán FPS"""
         self.fps_counter += 1
         if self.fps_counter >= 30:  # Cập nhật FPS mỗi 30 frames
-            current_time = time.time()
+            current_time = self.clock.now()
             self.current_fps = self.fps_counter / (current_time - self.fps_start_time)
             self.fps_counter = 0
             self.fps_start_time = current_time
     
+    def cycle_primary_hand(self):
+        """Chuyển quyền điều khiển chuột sang tay tiếp theo đang có trong khung hình"""
+        results = self.hand_tracker.last_results
+        if results is None or results.num_hands == 0:
+            return
+        hand_id = self.hand_tracker.identity.cycle_primary(results.ids)
+        self.logger.info(f"Primary hand: #{hand_id}")
+    
     def reset_application(self):
         """Reset ứng dụng"""
         self.logger.info("Đang reset ứng dụng...")
-        self.gesture_recognizer.reset_cooldowns()
+        for gesture_recognizer in self.gesture_recognizers.values():
+            gesture_recognizer.reset_cooldowns()
+        self.hand_tracker.identity.set_primary_id(None)
         self.status_text = "Application reset"
         self.gesture_text = "Ready"
     
@@ -313,6 +592,7 @@ class AeroHandApp:
         Keyboard shortcuts:
         'q' or ESC: Quit application
         'r': Reset application
+        'p': Switch controlling hand (when MAX_HANDS > 1)
         'h': Show this help
         """
         self.logger.info(help_text)
@@ -345,7 +625,21 @@ class AeroHandApp:
         if self.camera_manager:
             self.camera_manager.release()
         
+        self.logger.info(f"Idle power mode: {self.presence_scheduler.get_idle_time():.0f}s in idle")
+        
+        cursor_predictor = self.mouse_controller.cursor_predictor
+        if cursor_predictor is not None and cursor_predictor.latency is not None:
+            self.logger.info(f"Cursor latency: {cursor_predictor.latency * 1000:.0f}ms measured, "
+                             f"{cursor_predictor.horizon * 1000:.0f}ms predicted ahead")
+        
+        if 'first_landmark' not in self.startup_timer.milestones:
+            self.logger.info(f"Startup timing (no hand seen): {self.startup_timer.report()}")
+        
         if self.hand_tracker:
+            gate_stats = self.hand_tracker.get_motion_gate_stats()
+            if gate_stats is not None:
+                self.logger.info(f"Motion gate: reused results for {gate_stats['hits']}/{gate_stats['checks']} "
+                                 f"frames ({gate_stats['hit_rate'] * 100:.1f}%)")
             self.hand_tracker.release()
         
         cv2.destroyAllWindows()
@@ -359,6 +653,14 @@ def main():
     parser.add_argument("--display-scale", type=float, default=1.0, help="Display window scale factor (0.5 = half size, 2.0 = double size)")
     parser.add_argument("--scan-network", action="store_true", help="Scan network for camera servers")
     parser.add_argument("--demo", action="store_true", help="Run in demo mode (no mouse control)")
+    parser.add_argument("--inference-mode", choices=["inline", "process"], help="Run MediaPipe inline or in a separate worker process")
+    parser.add_argument("--inference-width", type=int, help="Width of the frame fed to MediaPipe, e.g. 256 or 320 (0 = capture resolution)")
+    parser.add_argument("--backend", choices=["solutions", "tasks"], help="Hand landmark backend: legacy MediaPipe Solutions or Tasks HandLandmarker")
+    parser.add_argument("--model-complexity", type=int, choices=[0, 1], help="Hand model complexity for the solutions backend (0 = lite, 1 = full)")
+    parser.add_argument("--process-video", metavar="VIDEO", help="Process a recorded video offline into a landmarks .npz file")
+    parser.add_argument("--out", default="landmarks.npz", help="Output .npz path for --process-video (default: landmarks.npz)")
+    parser.add_argument("--workers", type=int, help="Number of worker processes for --process-video (default: CPU count)")
+    parser.add_argument("--mirror", action="store_true", help="Flip video frames horizontally like the live camera")
     
     args = parser.parse_args()
     
@@ -373,6 +675,22 @@ def main():
             print("❌ Network scanner not available")
         return
     
+    # Xử lý video offline nếu được yêu cầu
+    if args.process_video:
+        from modules.video_processor import process_video
+        print(f"🎞️  Processing video: {args.process_video}")
+        try:
+            stats = process_video(args.process_video, args.out, args.workers, mirror=args.mirror)
+            print(f"✅ Saved {stats['frames']} frames to {args.out}")
+            if stats['missing_frames']:
+                print(f"⚠️  {stats['missing_frames']} frames could not be decoded (saved as no hand)")
+            print(f"⏱️  {stats['elapsed']:.1f}s, {stats['fps']:.1f} FPS total, "
+                  f"{stats['record_fps_per_core']:.1f} FPS per core on recorded frames "
+                  f"({stats['workers']} workers, {stats['warmup_frames']} warm-up frames not counted)")
+        except Exception as e:
+            print(f"❌ Video processing failed: {e}")
+        return
+    
     # Chạy demo mode nếu được yêu cầu
     if args.demo:
         try:
@@ -399,6 +717,15 @@ def main():
     if args.display_scale != 1.0:
         print(f"🖼️  Display scale: {args.display_scale}x")
     
+    if args.inference_mode:
+        print(f"🧠 Inference mode: {args.inference_mode}")
+    
+    if args.inference_width:
+        print(f"🔍 Inference width: {args.inference_width}px")
+    
+    if args.backend:
+        print(f"🧩 Hand backend: {args.backend}")
+    
     print()
     print("📋 Instructions:")
     print("   • Point with index finger to move cursor")
@@ -409,7 +736,8 @@ def main():
     print("=" * 50)
     
     try:
-        app = AeroHandApp(args.camera_ip, args.display_scale)
+        app = AeroHandApp(args.camera_ip, args.display_scale, args.inference_mode, args.inference_width,
+                          args.backend, args.model_complexity)
         app.run()
     except Exception as e:
         print(f"❌ Fatal error: {e}")
@@ -8,7 +8,8 @@ import logging
 import socket
 import numpy as np
 from typing import Tuple, Optional
-from config.settings import CAMERA_INDEX, CAMERA_WIDTH, CAMERA_HEIGHT, FPS
+from config.settings import CAMERA_INDEX, CAMERA_WIDTH, CAMERA_HEIGHT, FPS, IDLE_WAKE_FLUSH_FRAMES
+from utils.clock import Clock, SYSTEM_CLOCK
 
 class NetworkCameraClient:
     """Client để kết nối đến camera server qua mạng"""
@@ -87,13 +88,21 @@ class NetworkCameraClient:
 class CameraManager:
     """Quản lý webcam và các thao tác liên quan đến camera (hỗ trợ cả local và network camera)"""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None):
+        """
+        Args:
+            clock: Nguồn thời gian gắn cho từng frame (mặc định đồng hồ đơn điệu của hệ thống)
+        """
         self.cap = None
         self.network_client = None
         self.is_opened = False
         self.is_network_camera = False
         self.logger = logging.getLogger(__name__)
         
+        # Thời điểm capture của frame đọc được gần nhất, lấy ngay sau khi đọc (trước mọi xử lý)
+        self.clock = clock or SYSTEM_CLOCK
+        self.last_frame_time = 0.0
+        
     def initialize_camera(self, camera_source: str = "local") -> bool:
         """
         Khởi tạo camera (local hoặc network)
@@ -238,7 +247,7 @@ class CameraManager:
     
     def read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
         """
-        Đọc frame từ camera (local hoặc network)
+        Đọc frame từ camera (local hoặc network), thời điểm capture ghi vào last_frame_time
         
         Returns:
             Tuple[bool, Optional[np.ndarray]]: (success, frame)
@@ -250,6 +259,7 @@ class CameraManager:
             if self.is_network_camera and self.network_client:
                 # Đọc từ network camera
                 ret, frame = self.network_client.read_frame()
+                self.last_frame_time = self.clock.now()
                 if ret and frame is not None:
                     # Resize nếu cần
                     if frame.shape[1] != CAMERA_WIDTH or frame.shape[0] != CAMERA_HEIGHT:
@@ -258,6 +268,7 @@ class CameraManager:
             elif self.cap is not None:
                 # Đọc từ local camera
                 ret, frame = self.cap.read()
+                self.last_frame_time = self.clock.now()
                 if ret:
                     # Flip frame horizontally để có hiệu ứng gương
                     frame = cv2.flip(frame, 1)
@@ -278,6 +289,62 @@ class CameraManager:
         """
         return CAMERA_WIDTH, CAMERA_HEIGHT
     
+    def set_fps(self, fps: float) -> bool:
+        """
+        Thay đổi FPS capture của local camera
+        
+        Network camera do server quyết định tốc độ gửi nên không thay đổi được ở đây.
+        
+        Args:
+            fps: FPS mong muốn
+            
+        Returns:
+            bool: True nếu driver chấp nhận giá trị mới
+        """
+        if self.is_network_camera or self.cap is None:
+            return False
+        
+        try:
+            accepted = self.cap.set(cv2.CAP_PROP_FPS, fps)
+            self.logger.debug(f"Camera FPS set to {fps} (accepted: {accepted})")
+            return accepted
+        except Exception as e:
+            self.logger.error(f"Lỗi khi đặt FPS camera: {e}")
+            return False
+    
+    def flush_buffer(self, max_frames: int = IDLE_WAKE_FLUSH_FRAMES, fps: float = FPS) -> int:
+        """
+        Bỏ các frame cũ đang nằm trong buffer của driver local camera (ví dụ khi thoát idle, vòng lặp
+        đọc chậm nên buffer chứa frame từ trước khi thấy tay), để frame đọc tiếp theo là frame mới
+        
+        Dùng grab() nên không giải mã. Dừng sớm khi một lần grab phải chờ camera (buffer đã rỗng).
+        Network camera không có buffer của driver nên không làm gì.
+        
+        Args:
+            max_frames: Số frame tối đa bỏ qua
+            fps: FPS capture hiện tại, để nhận ra lần grab phải chờ frame mới
+            
+        Returns:
+            int: Số frame đã bỏ qua
+        """
+        if self.is_network_camera or self.cap is None or max_frames <= 0:
+            return 0
+        
+        wait_threshold = 0.5 / fps if fps > 0 else 0.0
+        flushed = 0
+        try:
+            for _ in range(max_frames):
+                start = self.clock.now()
+                if not self.cap.grab():
+                    break
+                flushed += 1
+                if wait_threshold and self.clock.now() - start >= wait_threshold:
+                    break
+        except Exception as e:
+            self.logger.error(f"Lỗi khi bỏ frame cũ của camera: {e}")
+        self.logger.debug(f"Flushed {flushed} buffered camera frames")
+        return flushed
+    
     def release(self):
         """Giải phóng tài nguyên camera"""
         self.is_opened = False
@@ -0,0 +1,277 @@
+"""
+Hand Backends Module
+Các backend nhận diện bàn tay: MediaPipe Solutions (mp.solutions.hands) và MediaPipe Tasks (HandLandmarker)
+"""
+
+import os
+import logging
+import threading
+import mediapipe as mp
+import numpy as np
+from typing import Any, Optional, Tuple
+from config.settings import (
+    DETECTION_CONFIDENCE,
+    TRACKING_CONFIDENCE,
+    MAX_HANDS,
+    MODEL_COMPLEXITY,
+    HAND_LANDMARKER_MODEL,
+    TASKS_RUNNING_MODE,
+    TASKS_DELEGATE
+)
+from utils.clock import Clock, SYSTEM_CLOCK
+
+# Nhãn handedness tương ứng với giá trị trong mảng handedness
+HANDEDNESS_LABELS = ("Left", "Right")
+
+BACKENDS = ("solutions", "tasks")
+
+
+def unpack_results(results: Any, landmarks_out: np.ndarray, handedness_out: np.ndarray,
+                   scores_out: np.ndarray) -> int:
+    """
+    Chuyển kết quả MediaPipe Solutions vào các mảng cấp phát sẵn (duyệt protobuf đúng một lần)
+
+    Args:
+        results: Kết quả từ MediaPipe
+        landmarks_out: Mảng (max_hands, 21, 3) float32 nhận tọa độ normalized
+        handedness_out: Mảng (max_hands,) int8 nhận index trong HANDEDNESS_LABELS
+        scores_out: Mảng (max_hands,) float32 nhận độ tin cậy handedness
+
+    Returns:
+        int: Số bàn tay đã ghi vào mảng
+    """
+    if results is None or not results.multi_hand_landmarks:
+        return 0
+
+    num_hands = min(len(results.multi_hand_landmarks), len(landmarks_out))
+    for i in range(num_hands):
+        landmarks_out[i] = [(lm.x, lm.y, lm.z) for lm in results.multi_hand_landmarks[i].landmark]
+
+    handedness_out[:num_hands] = 0
+    scores_out[:num_hands] = 0.0
+    for i, handedness in enumerate((results.multi_handedness or [])[:num_hands]):
+        classification = handedness.classification[0]
+        handedness_out[i] = HANDEDNESS_LABELS.index(classification.label) \
+            if classification.label in HANDEDNESS_LABELS else 0
+        scores_out[i] = classification.score
+
+    return num_hands
+
+
+def unpack_task_result(result: Any, landmarks_out: np.ndarray, handedness_out: np.ndarray,
+                       scores_out: np.ndarray) -> int:
+    """
+    Chuyển HandLandmarkerResult của MediaPipe Tasks vào các mảng cấp phát sẵn
+
+    Args:
+        result: HandLandmarkerResult
+        landmarks_out: Mảng (max_hands, 21, 3) float32
+        handedness_out: Mảng (max_hands,) int8
+        scores_out: Mảng (max_hands,) float32
+
+    Returns:
+        int: Số bàn tay đã ghi vào mảng
+    """
+    if result is None or not result.hand_landmarks:
+        return 0
+
+    num_hands = min(len(result.hand_landmarks), len(landmarks_out))
+    for i in range(num_hands):
+        landmarks_out[i] = [(lm.x, lm.y, lm.z) for lm in result.hand_landmarks[i]]
+
+    handedness_out[:num_hands] = 0
+    scores_out[:num_hands] = 0.0
+    for i, categories in enumerate((result.handedness or [])[:num_hands]):
+        category = categories[0]
+        handedness_out[i] = HANDEDNESS_LABELS.index(category.category_name) \
+            if category.category_name in HANDEDNESS_LABELS else 0
+        scores_out[i] = category.score
+
+    return num_hands
+
+
+class SolutionsBackend:
+    """Backend dùng mp.solutions.hands.Hands (đồng bộ, mỗi frame trả kết quả của chính nó)"""
+
+    name = "solutions"
+    is_async = False
+
+    def __init__(self, model_complexity: int = MODEL_COMPLEXITY, max_hands: int = MAX_HANDS):
+        """
+        Args:
+            model_complexity: 0 = model nhẹ, 1 = model đầy đủ
+            max_hands: Số tay tối đa
+        """
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=max_hands,
+            model_complexity=model_complexity,
+            min_detection_confidence=DETECTION_CONFIDENCE,
+            min_tracking_confidence=TRACKING_CONFIDENCE
+        )
+
+    def process(self, rgb_frame: np.ndarray, landmarks_out: np.ndarray, handedness_out: np.ndarray,
+                scores_out: np.ndarray, timestamp: Optional[float] = None) -> Tuple[int, Any]:
+        """
+        Chạy nhận diện trên frame RGB
+
+        Args:
+            rgb_frame: Frame RGB
+            landmarks_out: Buffer nhận landmarks
+            handedness_out: Buffer nhận handedness
+            scores_out: Buffer nhận độ tin cậy
+            timestamp: Không dùng (Solutions tự theo dõi thứ tự frame), cùng giao diện với TasksBackend
+
+        Returns:
+            Tuple[int, Any]: (số tay, kết quả protobuf gốc dùng để vẽ)
+        """
+        raw = self.hands.process(rgb_frame)
+        return unpack_results(raw, landmarks_out, handedness_out, scores_out), raw
+
+    def close(self):
+        """Giải phóng graph MediaPipe"""
+        self.hands.close()
+
+
+class TasksBackend:
+    """
+    Backend dùng MediaPipe Tasks HandLandmarker
+
+    Ở chế độ "live_stream", frame được gửi bằng detect_async và kết quả về qua callback
+    trên thread của MediaPipe; process() trả kết quả mới nhất đã có (có thể trễ 1-2 frame)
+    nên main loop không phải chờ inference. Chế độ "video" chạy đồng bộ.
+    """
+
+    name = "tasks"
+
+    def __init__(self, model_path: str = HAND_LANDMARKER_MODEL, running_mode: str = TASKS_RUNNING_MODE,
+                 delegate: str = TASKS_DELEGATE, max_hands: int = MAX_HANDS, clock: Optional[Clock] = None):
+        """
+        Args:
+            model_path: Đường dẫn file hand_landmarker.task
+            running_mode: "live_stream" (bất đồng bộ) hoặc "video" (đồng bộ)
+            delegate: "cpu" hoặc "gpu"
+            max_hands: Số tay tối đa
+            clock: Nguồn thời gian khi frame không có timestamp capture (mặc định đồng hồ đơn điệu
+                   của hệ thống), cùng đồng hồ với HandTracker
+        """
+        self.logger = logging.getLogger(__name__)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"HandLandmarker model not found: {model_path}")
+
+        vision = mp.tasks.vision
+        self.is_async = running_mode == "live_stream"
+        self.lock = threading.Lock()
+        self.latest_result = None
+        self.latest_timestamp = -1
+        self.last_timestamp = -1
+        self.clock = clock or SYSTEM_CLOCK
+        self.start_time: Optional[float] = None
+
+        options = vision.HandLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(
+                model_asset_path=model_path,
+                delegate=(mp.tasks.BaseOptions.Delegate.GPU if delegate == "gpu"
+                          else mp.tasks.BaseOptions.Delegate.CPU)
+            ),
+            running_mode=(vision.RunningMode.LIVE_STREAM if self.is_async else vision.RunningMode.VIDEO),
+            num_hands=max_hands,
+            min_hand_detection_confidence=DETECTION_CONFIDENCE,
+            min_hand_presence_confidence=TRACKING_CONFIDENCE,
+            min_tracking_confidence=TRACKING_CONFIDENCE,
+            result_callback=self._on_result if self.is_async else None
+        )
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def _on_result(self, result: Any, image: Any, timestamp_ms: int):
+        """Callback của LIVE_STREAM, chạy trên thread của MediaPipe"""
+        with self.lock:
+            self.latest_result = result
+            self.latest_timestamp = timestamp_ms
+
+    def _next_timestamp(self, capture_time: Optional[float] = None) -> int:
+        """
+        Timestamp (ms) tăng dần nghiêm ngặt như MediaPipe yêu cầu, tính từ thời điểm capture của frame
+        (mặc định clock.now()) so với frame đầu tiên, để chạy lại trên VirtualClock cho cùng timestamps
+        """
+        if capture_time is None:
+            capture_time = self.clock.now()
+        if self.start_time is None:
+            self.start_time = capture_time
+        timestamp = int(round((capture_time - self.start_time) * 1000))
+        timestamp = max(timestamp, self.last_timestamp + 1)
+        self.last_timestamp = timestamp
+        return timestamp
+
+    def process(self, rgb_frame: np.ndarray, landmarks_out: np.ndarray, handedness_out: np.ndarray,
+                scores_out: np.ndarray, timestamp: Optional[float] = None) -> Tuple[int, Any]:
+        """
+        Gửi frame RGB cho HandLandmarker và ghi kết quả mới nhất vào buffer
+
+        Args:
+            rgb_frame: Frame RGB
+            landmarks_out: Buffer nhận landmarks
+            handedness_out: Buffer nhận handedness
+            scores_out: Buffer nhận độ tin cậy
+            timestamp: Thời điểm capture của frame (giây, theo clock), mặc định clock.now()
+
+        Returns:
+            Tuple[int, Any]: (số tay, None - kết quả Tasks không có protobuf để vẽ trực tiếp)
+        """
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(rgb_frame))
+        timestamp = self._next_timestamp(timestamp)
+
+        if self.is_async:
+            self.landmarker.detect_async(image, timestamp)
+            with self.lock:
+                result = self.latest_result
+        else:
+            result = self.landmarker.detect_for_video(image, timestamp)
+
+        return unpack_task_result(result, landmarks_out, handedness_out, scores_out), None
+
+    def get_latency(self) -> Optional[float]:
+        """
+        Độ trễ (giây, theo thời điểm capture) giữa frame mới nhất đã gửi và frame của kết quả mới nhất
+        (chỉ live_stream)
+
+        Returns:
+            Optional[float]: Độ trễ hoặc None nếu chưa có kết quả
+        """
+        with self.lock:
+            if self.latest_timestamp < 0:
+                return None
+            return (self.last_timestamp - self.latest_timestamp) / 1000.0
+
+    def close(self):
+        """Giải phóng HandLandmarker"""
+        self.landmarker.close()
+
+
+def create_backend(backend: str = "solutions", model_complexity: int = MODEL_COMPLEXITY,
+                   running_mode: str = TASKS_RUNNING_MODE, max_hands: int = MAX_HANDS,
+                   clock: Optional[Clock] = None) -> Any:
+    """
+    Tạo backend nhận diện theo tên
+
+    Args:
+        backend: "solutions" hoặc "tasks"
+        model_complexity: 0 hoặc 1 (chỉ backend solutions, backend tasks bỏ qua và cảnh báo nếu khác 1)
+        running_mode: "live_stream" hoặc "video" (backend tasks)
+        max_hands: Số tay tối đa
+        clock: Nguồn thời gian của backend tasks khi frame không có timestamp capture
+
+    Returns:
+        Any: SolutionsBackend hoặc TasksBackend
+    """
+    if backend == "tasks":
+        if model_complexity != 1:
+            # HandLandmarker chỉ có một model (tương đương model_complexity=1), độ nặng do file .task quyết định
+            logging.getLogger(__name__).warning(
+                f"model_complexity={model_complexity} is ignored by the tasks backend; "
+                f"it always runs {HAND_LANDMARKER_MODEL}"
+            )
+        return TasksBackend(running_mode=running_mode, max_hands=max_hands, clock=clock)
+    if backend != "solutions":
+        raise ValueError(f"Unknown hand backend: {backend} (expected one of {BACKENDS})")
+    return SolutionsBackend(model_complexity=model_complexity, max_hands=max_hands)
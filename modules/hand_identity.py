@@ -0,0 +1,206 @@
+"""
+Hand Identity Module
+Gán ID ổn định cho từng bàn tay qua các frame và chọn tay điều khiển chính
+"""
+
+import logging
+import numpy as np
+from typing import Optional, List, Sequence
+from config.settings import (
+    MAX_HANDS, PRIMARY_HAND, HAND_MATCH_MAX_DISTANCE, HAND_TRACK_TTL
+)
+
+# Landmarks tạo thành lòng bàn tay: cổ tay và các khớp MCP
+PALM_IDS = np.array([0, 5, 9, 13, 17])
+
+# Chi phí cộng thêm khi handedness khác nhau (MediaPipe đôi khi đổi nhãn trong vài frame)
+HANDEDNESS_MISMATCH_COST = 0.1
+
+
+class HandIdentityTracker:
+    """Ghép các bàn tay giữa hai frame theo vị trí cổ tay và tâm lòng bàn tay"""
+
+    def __init__(self, max_tracks: int = 2 * MAX_HANDS,
+                 max_distance: float = HAND_MATCH_MAX_DISTANCE,
+                 ttl: int = HAND_TRACK_TTL,
+                 primary_hand: str = PRIMARY_HAND):
+        """
+        Args:
+            max_tracks: Số tay tối đa được giữ ID (kể cả tay vừa biến mất)
+            max_distance: Khoảng cách đặc trưng tối đa để coi là cùng một tay
+            ttl: Số frame giữ ID của tay đã biến mất
+            primary_hand: "auto", "Left" hoặc "Right"
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_distance = max_distance
+        self.ttl = ttl
+        self.primary_hand = primary_hand
+
+        # Trạng thái của các track: đặc trưng [wrist_x, wrist_y, palm_x, palm_y]
+        self.features = np.zeros((max_tracks, 4), dtype=np.float32)
+        self.track_ids = np.full(max_tracks, -1, dtype=np.int64)
+        self.track_handedness = np.zeros(max_tracks, dtype=np.int8)
+        self.missed = np.zeros(max_tracks, dtype=np.int64)
+        self.next_id = 0
+
+        self.primary_id = None
+        self.manual_primary = False
+
+    def _compute_features(self, landmarks: np.ndarray) -> np.ndarray:
+        """
+        Tính đặc trưng vị trí của mỗi tay
+
+        Args:
+            landmarks: Mảng (hands, 21, 2|3)
+
+        Returns:
+            np.ndarray: Mảng (hands, 4) gồm tọa độ cổ tay và tâm lòng bàn tay
+        """
+        wrist = landmarks[:, 0, :2]
+        palm = landmarks[:, PALM_IDS, :2].mean(axis=1)
+        return np.concatenate([wrist, palm], axis=1)
+
+    def assign(self, landmarks: np.ndarray, handedness: np.ndarray) -> np.ndarray:
+        """
+        Gán ID cho các tay trong frame hiện tại
+
+        Chi phí mỗi frame là O(hands x tracks), cả hai đều bị giới hạn bởi MAX_HANDS.
+
+        Args:
+            landmarks: Mảng (hands, 21, 2|3)
+            handedness: Mảng (hands,) index handedness
+
+        Returns:
+            np.ndarray: Mảng (hands,) ID của từng tay
+        """
+        num_hands = len(landmarks)
+        ids = np.full(num_hands, -1, dtype=np.int64)
+        features = self._compute_features(landmarks) if num_hands else np.zeros((0, 4), dtype=np.float32)
+
+        active = np.flatnonzero(self.track_ids >= 0)
+        matched_tracks = np.zeros(len(self.track_ids), dtype=bool)
+
+        if num_hands and len(active):
+            # Ma trận chi phí (hands, active_tracks) tính vector hóa
+            cost = np.linalg.norm(features[:, None, :] - self.features[None, active, :], axis=2)
+            cost += HANDEDNESS_MISMATCH_COST * (handedness[:, None] != self.track_handedness[None, active])
+
+            # Ghép tham lam theo chi phí tăng dần (đủ tốt khi số tay nhỏ)
+            hand_used = np.zeros(num_hands, dtype=bool)
+            for flat_index in np.argsort(cost, axis=None):
+                hand, column = divmod(int(flat_index), len(active))
+                if cost[hand, column] > self.max_distance:
+                    break
+                track = active[column]
+                if hand_used[hand] or matched_tracks[track]:
+                    continue
+                hand_used[hand] = True
+                matched_tracks[track] = True
+                ids[hand] = self.track_ids[track]
+                self._update_track(track, features[hand], handedness[hand])
+
+        # Track không được ghép: tăng số frame mất, xóa khi quá TTL
+        lost = (self.track_ids >= 0) & ~matched_tracks
+        self.missed[lost] += 1
+        expired = lost & (self.missed > self.ttl)
+        self.track_ids[expired] = -1
+
+        # Tay mới: cấp ID mới, dùng slot trống hoặc slot mất lâu nhất
+        for hand in np.flatnonzero(ids < 0):
+            free = np.flatnonzero(self.track_ids < 0)
+            if len(free):
+                track = free[0]
+            else:
+                candidates = np.where(matched_tracks, -1, self.missed)
+                track = int(np.argmax(candidates))
+            self.track_ids[track] = self.next_id
+            ids[hand] = self.next_id
+            matched_tracks[track] = True
+            self._update_track(track, features[hand], handedness[hand])
+            self.next_id += 1
+
+        return ids
+
+    def _update_track(self, track: int, features: np.ndarray, handedness: int):
+        """Cập nhật trạng thái một track đã ghép"""
+        self.features[track] = features
+        self.track_handedness[track] = handedness
+        self.missed[track] = 0
+
+    def select_primary(self, ids: np.ndarray, handedness: np.ndarray,
+                       labels: Sequence[str] = ("Left", "Right")) -> Optional[int]:
+        """
+        Chọn tay điều khiển chính trong frame hiện tại
+
+        Tay chính được giữ nguyên khi còn trong khung hình. Nếu PRIMARY_HAND là
+        "Left"/"Right", tay có handedness phù hợp được ưu tiên (trừ khi người dùng
+        đã chọn ID thủ công).
+
+        Args:
+            ids: Mảng (hands,) ID của từng tay
+            handedness: Mảng (hands,) index handedness
+            labels: Nhãn tương ứng với index handedness
+
+        Returns:
+            Optional[int]: Index của tay chính trong frame hoặc None nếu không có tay
+        """
+        if len(ids) == 0:
+            return None
+
+        current = np.flatnonzero(ids == self.primary_id) if self.primary_id is not None else []
+        preferred = np.zeros(len(ids), dtype=bool)
+        if self.primary_hand in labels:
+            preferred = handedness == labels.index(self.primary_hand)
+
+        if len(current):
+            index = int(current[0])
+            if self.manual_primary or not preferred.any() or preferred[index]:
+                return index
+
+        # Chọn tay phù hợp handedness (nếu có), ưu tiên ID nhỏ nhất (xuất hiện sớm nhất)
+        candidates = np.flatnonzero(preferred) if preferred.any() else np.arange(len(ids))
+        index = int(candidates[np.argmin(ids[candidates])])
+        if self.primary_id != ids[index]:
+            self.logger.debug(f"Primary hand -> ID {ids[index]}")
+        self.primary_id = int(ids[index])
+        self.manual_primary = False
+        return index
+
+    def set_primary_id(self, hand_id: Optional[int]):
+        """
+        Chọn thủ công tay điều khiển chính theo ID
+
+        Args:
+            hand_id: ID của tay (None = quay về chọn tự động)
+        """
+        self.primary_id = hand_id
+        self.manual_primary = hand_id is not None
+
+    def cycle_primary(self, ids: np.ndarray) -> Optional[int]:
+        """
+        Chuyển tay điều khiển chính sang tay tiếp theo trong frame
+
+        Args:
+            ids: Mảng (hands,) ID của các tay hiện tại
+
+        Returns:
+            Optional[int]: ID của tay chính mới
+        """
+        if len(ids) == 0:
+            return self.primary_id
+
+        ordered = np.sort(ids)
+        following = ordered[ordered > (self.primary_id if self.primary_id is not None else -1)]
+        self.set_primary_id(int(following[0] if len(following) else ordered[0]))
+        return self.primary_id
+
+    def active_ids(self) -> List[int]:
+        """Danh sách ID đang được theo dõi (kể cả tay vừa biến mất trong TTL)"""
+        return [int(i) for i in self.track_ids if i >= 0]
+
+    def reset(self):
+        """Xóa toàn bộ ID"""
+        self.track_ids[:] = -1
+        self.missed[:] = 0
+        self.primary_id = None
+        self.manual_primary = False
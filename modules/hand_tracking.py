@@ -4,33 +4,192 @@ Module nhận diện và theo dõi bàn tay sử dụng MediaPipe
 """
 
 import cv2
-import mediapipe as mp
 import numpy as np
 import logging
 from typing import List, Optional, Tuple, Dict, Any
+from mediapipe.framework.formats import landmark_pb2, classification_pb2
 from config.settings import (
-    DETECTION_CONFIDENCE, 
-    TRACKING_CONFIDENCE, 
-    MAX_HANDS
+    MAX_HANDS,
+    HAND_BACKEND,
+    MODEL_COMPLEXITY,
+    TASKS_RUNNING_MODE,
+    OPENCV_THREADS,
+    INFERENCE_MODE,
+    INFERENCE_WORKER_RESTARTS,
+    INFERENCE_WIDTH,
+    INFERENCE_INTERVAL,
+    PREDICTION_MOTION_THRESHOLD,
+    MOTION_GATE,
+    FPS,
+    ROI_TRACKING,
+    ROI_PADDING,
+    ROI_MIN_SIZE,
+    ROI_MIN_CONFIDENCE,
+    ROI_EDGE_MARGIN
 )
+from modules.hand_backends import HANDEDNESS_LABELS, create_backend
+from utils.clock import Clock, SYSTEM_CLOCK
+from modules.inference_worker import InferenceWorker
+from modules.landmark_predictor import LandmarkPredictor, default_max_horizon
+from modules.motion_detector import SceneChangeDetector, gray_thumbnail
+from modules.hand_identity import HandIdentityTracker
+
+class HandResults:
+    """Kết quả nhận diện tay dạng mảng NumPy, tương thích với thuộc tính của kết quả MediaPipe"""
+    
+    def __init__(self, landmarks: np.ndarray, handedness: np.ndarray, scores: np.ndarray,
+                 raw: Optional[Any] = None):
+        """
+        Args:
+            landmarks: Mảng (hands, 21, 3) float32 tọa độ normalized
+            handedness: Mảng (hands,) int8, index trong HANDEDNESS_LABELS
+            scores: Mảng (hands,) float32 độ tin cậy handedness
+            raw: Kết quả MediaPipe gốc nếu landmarks chưa bị chỉnh sửa (dùng để vẽ)
+        """
+        self.landmarks = landmarks
+        self.handedness = handedness
+        self.scores = scores
+        self.raw = raw
+        
+        # ID ổn định của từng tay, được HandTracker gán sau khi nhận diện
+        self.ids = np.arange(len(landmarks))
+        self._multi_hand_landmarks = None
+        self._multi_handedness = None
+    
+    @property
+    def num_hands(self) -> int:
+        """Số bàn tay phát hiện được"""
+        return len(self.landmarks)
+    
+    @property
+    def labels(self) -> List[str]:
+        """Nhãn handedness ("Left"/"Right") của từng tay"""
+        return [HANDEDNESS_LABELS[i] for i in self.handedness]
+    
+    @property
+    def multi_hand_landmarks(self) -> Optional[List[Any]]:
+        """Landmarks dạng protobuf của MediaPipe, chỉ dựng lại khi thực sự cần"""
+        if self.num_hands == 0:
+            return None
+        if self.raw is not None:
+            return self.raw.multi_hand_landmarks
+        if self._multi_hand_landmarks is None:
+            self._multi_hand_landmarks = [
+                landmark_pb2.NormalizedLandmarkList(landmark=[
+                    landmark_pb2.NormalizedLandmark(x=float(x), y=float(y), z=float(z))
+                    for x, y, z in hand
+                ])
+                for hand in self.landmarks
+            ]
+        return self._multi_hand_landmarks
+    
+    @property
+    def multi_handedness(self) -> Optional[List[Any]]:
+        """Handedness dạng protobuf của MediaPipe, chỉ dựng lại khi thực sự cần"""
+        if self.num_hands == 0:
+            return None
+        if self.raw is not None:
+            return self.raw.multi_handedness
+        if self._multi_handedness is None:
+            self._multi_handedness = [
+                classification_pb2.ClassificationList(classification=[
+                    classification_pb2.Classification(index=int(index), label=HANDEDNESS_LABELS[index],
+                                                      score=float(score))
+                ])
+                for index, score in zip(self.handedness, self.scores)
+            ]
+        return self._multi_handedness
 
 class HandTracker:
     """Class để nhận diện và theo dõi bàn tay"""
     
-    def __init__(self):
-        self.mp_hands = mp.solutions.hands
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.mp_drawing_styles = mp.solutions.drawing_styles
+    def __init__(self, inference_mode: Optional[str] = None, roi_tracking: Optional[bool] = None,
+                 inference_width: Optional[int] = None, inference_interval: Optional[int] = None,
+                 motion_gate: Optional[bool] = None, backend: Optional[str] = None,
+                 model_complexity: Optional[int] = None, running_mode: Optional[str] = None,
+                 clock: Optional[Clock] = None):
+        """
+        Args:
+            inference_mode: "inline" hoặc "process" (mặc định lấy từ INFERENCE_MODE)
+            roi_tracking: Bật inference trên vùng quanh bàn tay (mặc định lấy từ ROI_TRACKING)
+            inference_width: Chiều rộng ảnh đưa vào MediaPipe, 0 = giữ nguyên (mặc định lấy từ INFERENCE_WIDTH)
+            inference_interval: Chạy MediaPipe mỗi N frame ở chế độ inline (mặc định lấy từ INFERENCE_INTERVAL)
+            motion_gate: Dùng lại kết quả trước khi cảnh không đổi (mặc định lấy từ MOTION_GATE)
+            backend: "solutions" hoặc "tasks" (mặc định lấy từ HAND_BACKEND)
+            model_complexity: 0 hoặc 1 cho backend solutions (mặc định lấy từ MODEL_COMPLEXITY)
+            running_mode: "live_stream" hoặc "video" cho backend tasks (mặc định lấy từ TASKS_RUNNING_MODE)
+            clock: Nguồn thời gian của bộ dự đoán landmarks (mặc định đồng hồ đơn điệu của hệ thống)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.clock = clock or SYSTEM_CLOCK
+        self.inference_mode = inference_mode or INFERENCE_MODE
+        self.backend = backend or HAND_BACKEND
+        self.model_complexity = MODEL_COMPLEXITY if model_complexity is None else model_complexity
+        self.running_mode = running_mode or TASKS_RUNNING_MODE
         
-        # Khởi tạo MediaPipe Hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=MAX_HANDS,
-            min_detection_confidence=DETECTION_CONFIDENCE,
-            min_tracking_confidence=TRACKING_CONFIDENCE
-        )
+        if OPENCV_THREADS > 0:
+            # Giới hạn thread OpenCV cho resize/cvtColor (MediaPipe không cho chỉnh thread qua Python API)
+            cv2.setNumThreads(OPENCV_THREADS)
         
-        self.logger = logging.getLogger(__name__)
+        self.hands = None
+        self.worker = None
+        self.last_results = None
+        
+        # Mảng cấp phát sẵn nhận landmarks từ MediaPipe, dùng lại cho mọi frame
+        self.landmark_buffer = np.zeros((MAX_HANDS, 21, 3), dtype=np.float32)
+        self.handedness_buffer = np.zeros(MAX_HANDS, dtype=np.int8)
+        self.score_buffer = np.zeros(MAX_HANDS, dtype=np.float32)
+        
+        # ROI tracking: (x0, y0, x1, y1) pixel của vùng quanh bàn tay ở frame trước
+        self.roi_tracking = ROI_TRACKING if roi_tracking is None else roi_tracking
+        if self.roi_tracking and self.backend == "tasks" and self.running_mode == "live_stream":
+            # Kết quả bất đồng bộ thuộc về frame (và ROI) trước đó nên không ánh xạ ngược được
+            self.logger.warning("ROI tracking is not supported with the live_stream backend, disabling")
+            self.roi_tracking = False
+        self.roi = None
+        self.roi_hits = 0
+        self.roi_fallbacks = 0
+        
+        # Độ phân giải inference tách biệt với độ phân giải capture/hiển thị
+        self.inference_width = INFERENCE_WIDTH if inference_width is None else inference_width
+        
+        # Skip-frame inference: các frame giữa hai lần inference dùng landmarks dự đoán
+        self.inference_interval = max(1, INFERENCE_INTERVAL if inference_interval is None else inference_interval)
+        if self.inference_mode == "process" and self.inference_interval > 1:
+            # Worker trả kết quả bất đồng bộ (đã tự bỏ frame khi ring đầy), landmarks dự đoán trên main thread
+            # không khớp được với kết quả trễ vài frame của worker
+            self.logger.warning("Skip-frame inference is not supported in process mode, running every frame")
+            self.inference_interval = 1
+        self.predictor = LandmarkPredictor(max_horizon=default_max_horizon(FPS, self.inference_interval))
+        self.frames_since_inference = 0
+        self.last_handedness = np.zeros(0, dtype=np.int8)
+        self.last_scores = np.zeros(0, dtype=np.float32)
+        self.motion_reference = None
+        self.inferred_frames = 0
+        self.predicted_frames = 0
+        
+        # Gán ID ổn định cho từng tay qua các frame
+        self.identity = HandIdentityTracker()
+        
+        # Motion gate: bỏ qua inference khi cảnh tĩnh (tay đứng yên hoặc bàn trống)
+        use_motion_gate = MOTION_GATE if motion_gate is None else motion_gate
+        self.motion_gate = SceneChangeDetector() if use_motion_gate else None
+        
+        self.worker_restarts = 0
+        if self.inference_mode == "process":
+            # MediaPipe chạy trong worker process, main thread chỉ gửi frame và nhận landmarks.
+            # Worker chỉ gọi run_inference nên skip-frame và motion gate của tracker trong worker được tắt
+            self.worker = InferenceWorker(tracker_options={
+                'roi_tracking': self.roi_tracking,
+                'inference_width': self.inference_width,
+                'inference_interval': 1,
+                'motion_gate': False,
+                'backend': self.backend,
+                'model_complexity': self.model_complexity,
+                'running_mode': self.running_mode
+            })
+        else:
+            self.hands = self._create_hands()
         
         # Định nghĩa các landmark IDs quan trọng
         self.LANDMARK_IDS = {
@@ -56,33 +215,73 @@ class HandTracker:
             'PINKY_MCP': 17
         }
     
-    def detect_hands(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[Any]]:
+    def _create_hands(self):
+        """Khởi tạo backend nhận diện (MediaPipe Solutions hoặc Tasks)"""
+        return create_backend(self.backend, self.model_complexity, self.running_mode, clock=self.clock)
+    
+    def warm_up(self, frame_shape: Tuple[int, int, int], timeout: float = 5.0) -> bool:
+        """
+        Chạy model trên frame giả để MediaPipe khởi tạo graph trước khi có frame thật
+        
+        Trạng thái tracking (ROI, dự đoán, ID) không bị ảnh hưởng vì frame giả không có tay.
+        
+        Args:
+            frame_shape: Kích thước frame (height, width, 3)
+            timeout: Thời gian chờ tối đa kết quả từ worker process (giây)
+            
+        Returns:
+            bool: True nếu warm-up thành công
+        """
+        try:
+            dummy = np.zeros(frame_shape, dtype=np.uint8)
+            if self.worker is not None:
+                if not self.worker.start(frame_shape):
+                    return False
+                self.worker.submit(dummy, self.clock.now())
+                return self.worker.poll(timeout=timeout) is not None
+            
+            self.run_inference(dummy)
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"Model warm-up failed: {e}")
+            return False
+    
+    def detect_hands(self, frame: np.ndarray,
+                     timestamp: Optional[float] = None) -> Tuple[np.ndarray, Optional[HandResults]]:
         """
         Phát hiện bàn tay trong frame
         
+        Hàm không vẽ lên frame; việc hiển thị landmarks là bước riêng (LandmarkRenderer)
+        để các lần chạy không hiển thị không tốn chi phí vẽ.
+        
         Args:
             frame: Frame đầu vào từ webcam
+            timestamp: Thời điểm capture của frame theo clock (mặc định clock.now()),
+                       dùng cho landmarks dự đoán ở chế độ skip-frame và timestamp của backend tasks
             
         Returns:
-            Tuple[np.ndarray, Optional[Any]]: (processed_frame, hands_results)
+            Tuple[np.ndarray, Optional[HandResults]]: (processed_frame, hands_results)
         """
+        if timestamp is None:
+            timestamp = self.clock.now()
         try:
-            # Convert BGR to RGB (MediaPipe yêu cầu RGB)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Xử lý frame để phát hiện tay
-            results = self.hands.process(rgb_frame)
-            
-            # Vẽ landmarks lên frame nếu phát hiện được tay
-            if results.multi_hand_landmarks:
-                for hand_landmarks in results.multi_hand_landmarks:
-                    self.mp_drawing.draw_landmarks(
-                        frame,
-                        hand_landmarks,
-                        self.mp_hands.HAND_CONNECTIONS,
-                        self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                        self.mp_drawing_styles.get_default_hand_connections_style()
-                    )
+            if (self.motion_gate is not None
+                    and self.motion_gate.is_static(frame, self.is_hand_detected(self.last_results))):
+                # Cảnh không đổi -> dùng lại kết quả trước, không chạy MediaPipe
+                results = self.last_results
+            else:
+                if self.worker is not None:
+                    results = self._assign_ids(self._detect_hands_remote(frame, timestamp))
+                elif self.inference_interval > 1:
+                    # ID được gán bên trong để bộ dự đoán ghép landmarks theo ID
+                    results = self._detect_hands_skip_frame(frame, timestamp)
+                else:
+                    results = self._assign_ids(self.run_inference(frame, timestamp))
+                
+                self.last_results = results
+                if self.motion_gate is not None:
+                    self.motion_gate.mark_inferred()
             
             return frame, results
             
@@ -90,71 +289,393 @@ class HandTracker:
             self.logger.error(f"Lỗi khi phát hiện tay: {e}")
             return frame, None
     
-    def get_landmarks(self, results: Any, hand_index: int = 0) -> Optional[List[Tuple[float, float]]]:
+    def _assign_ids(self, results: Optional[HandResults]) -> Optional[HandResults]:
+        """Gán ID ổn định cho các tay trong kết quả (nếu có)"""
+        if results is not None:
+            results.ids = self.identity.assign(results.landmarks, results.handedness)
+        return results
+    
+    def _detect_hands_skip_frame(self, frame: np.ndarray, timestamp: float) -> HandResults:
+        """
+        Chạy MediaPipe mỗi N frame (hoặc sớm hơn khi vùng tay thay đổi nhiều),
+        các frame còn lại trả về landmarks dự đoán theo vận tốc
+        
+        Args:
+            frame: Frame BGR từ webcam
+            timestamp: Thời điểm capture của frame
+            
+        Returns:
+            HandResults: Kết quả inference hoặc landmarks dự đoán, đã gán ID
+        """
+        self.frames_since_inference += 1
+        
+        if (self.predictor.has_state()
+                and self.frames_since_inference < self.inference_interval
+                and not self._hand_region_changed(frame)):
+            self.predicted_frames += 1
+            results = HandResults(self.predictor.predict(timestamp), self.last_handedness, self.last_scores)
+            # Landmarks dự đoán giữ thứ tự và ID của lần inference trước
+            results.ids = self.predictor.ids[:results.num_hands].copy()
+            return results
+        
+        results = self._assign_ids(self.run_inference(frame, timestamp))
+        self.last_handedness = results.handedness.copy()
+        self.last_scores = results.scores.copy()
+        self.predictor.update(results.landmarks, timestamp, results.ids)
+        self.motion_reference = self._hand_region_snapshot(frame, results.landmarks)
+        self.frames_since_inference = 0
+        self.inferred_frames += 1
+        return results
+    
+    def _hand_region_snapshot(self, frame: np.ndarray, landmarks: np.ndarray) -> Optional[Tuple]:
+        """
+        Lưu ảnh xám thu nhỏ của vùng bàn tay để so sánh chuyển động ở các frame sau
+        
+        Args:
+            frame: Frame BGR
+            landmarks: Mảng (hands, 21, 3)
+            
+        Returns:
+            Optional[Tuple]: ((x0, y0, x1, y1), ảnh xám 32x32) hoặc None
+        """
+        if len(landmarks) == 0 or PREDICTION_MOTION_THRESHOLD <= 0:
+            return None
+        
+        height, width = frame.shape[:2]
+        xy = landmarks[:, :, :2].reshape(-1, 2)
+        x0, y0 = np.clip(xy.min(axis=0) * (width, height), 0, (width - 1, height - 1)).astype(int)
+        x1, y1 = np.clip(xy.max(axis=0) * (width, height), 0, (width, height)).astype(int)
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return None
+        
+        box = (x0, y0, x1, y1)
+        return box, gray_thumbnail(frame, (32, 32), box)
+    
+    def _hand_region_changed(self, frame: np.ndarray) -> bool:
+        """
+        Kiểm tra vùng bàn tay có thay đổi nhiều so với lần inference trước không
+        
+        Args:
+            frame: Frame BGR hiện tại
+            
+        Returns:
+            bool: True nếu tư thế tay có khả năng đã thay đổi
+        """
+        if self.motion_reference is None:
+            return False
+        
+        box, reference = self.motion_reference
+        current = gray_thumbnail(frame, (32, 32), box)
+        return cv2.absdiff(current, reference).mean() > PREDICTION_MOTION_THRESHOLD
+    
+    def get_motion_gate_stats(self) -> Optional[Dict[str, float]]:
+        """
+        Lấy thống kê motion gate của phiên hiện tại
+        
+        Returns:
+            Optional[Dict[str, float]]: checks, hits, hit_rate hoặc None nếu không bật motion gate
+        """
+        if self.motion_gate is None:
+            return None
+        return self.motion_gate.get_stats()
+    
+    def get_inference_stats(self) -> Dict[str, int]:
+        """
+        Lấy thống kê skip-frame inference
+        
+        Returns:
+            Dict[str, int]: Số frame chạy MediaPipe và số frame dùng landmarks dự đoán
+        """
+        return {
+            'inferred_frames': self.inferred_frames,
+            'predicted_frames': self.predicted_frames
+        }
+    
+    def run_inference(self, frame: np.ndarray, timestamp: Optional[float] = None) -> HandResults:
+        """
+        Chạy MediaPipe trên frame (hoặc trên ROI quanh bàn tay nếu bật ROI tracking)
+        
+        Mảng landmarks trong kết quả là view của buffer dùng chung và sẽ bị ghi đè
+        ở lần inference tiếp theo.
+        
+        Args:
+            frame: Frame BGR
+            timestamp: Thời điểm capture của frame theo clock (mặc định clock.now()), backend tasks
+                       dùng làm timestamp của HandLandmarker
+            
+        Returns:
+            HandResults: Kết quả với landmarks normalized theo toàn frame
+        """
+        if not self.roi_tracking:
+            return self._process(frame, timestamp)
+        
+        height, width = frame.shape[:2]
+        results = None
+        
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            results = self._process(frame[y0:y1, x0:x1], timestamp)
+            
+            if self._is_roi_result_valid(results):
+                self._map_roi_landmarks(results, self.roi, width, height)
+                self.roi_hits += 1
+            else:
+                # Mất tay, độ tin cậy thấp hoặc tay chạm mép ROI -> detect lại trên toàn frame
+                results = None
+                self.roi_fallbacks += 1
+        
+        if results is None:
+            results = self._process(frame, timestamp)
+        
+        self.roi = self._compute_roi(results, width, height)
+        return results
+    
+    def _process(self, frame: np.ndarray, timestamp: Optional[float] = None) -> HandResults:
+        """
+        Thu nhỏ frame về độ phân giải inference, chuyển BGR sang RGB (MediaPipe yêu cầu RGB),
+        chạy backend và chuyển kết quả vào buffer landmarks
+        
+        Landmarks là tọa độ normalized nên không cần chuyển đổi ngược sau khi thu nhỏ.
+        """
+        height, width = frame.shape[:2]
+        if self.inference_width and width > self.inference_width:
+            inference_height = max(1, round(height * self.inference_width / width))
+            frame = cv2.resize(frame, (self.inference_width, inference_height), interpolation=cv2.INTER_AREA)
+        
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        num_hands, raw = self.hands.process(rgb_frame, self.landmark_buffer,
+                                            self.handedness_buffer, self.score_buffer, timestamp)
+        return HandResults(self.landmark_buffer[:num_hands], self.handedness_buffer[:num_hands],
+                           self.score_buffer[:num_hands], raw)
+    
+    def _is_roi_result_valid(self, results: HandResults) -> bool:
+        """
+        Kiểm tra kết quả chạy trên ROI có dùng được không
+        
+        Args:
+            results: Kết quả trên ảnh crop
+            
+        Returns:
+            bool: True nếu đủ MAX_HANDS tay nằm trọn trong ROI với độ tin cậy đủ cao
+        """
+        # ROI chỉ có khi đã theo dõi đủ MAX_HANDS tay: thiếu tay trong ROI là một tay đã rời đi
+        if results.num_hands < MAX_HANDS or (results.scores < ROI_MIN_CONFIDENCE).any():
+            return False
+        
+        xy = results.landmarks[:, :, :2]
+        return bool(((xy > ROI_EDGE_MARGIN) & (xy < 1.0 - ROI_EDGE_MARGIN)).all())
+    
+    def _map_roi_landmarks(self, results: HandResults, roi: Tuple[int, int, int, int], width: int, height: int):
+        """
+        Chuyển landmarks từ tọa độ normalized của ROI về tọa độ normalized của toàn frame
+        
+        Args:
+            results: Kết quả trên ảnh crop (được sửa trực tiếp)
+            roi: (x0, y0, x1, y1) pixel của ROI
+            width: Chiều rộng frame gốc
+            height: Chiều cao frame gốc
+        """
+        x0, y0, x1, y1 = roi
+        scale_x = (x1 - x0) / width
+        scale_y = (y1 - y0) / height
+        
+        landmarks = results.landmarks
+        landmarks[..., 0] *= scale_x
+        landmarks[..., 0] += x0 / width
+        landmarks[..., 1] *= scale_y
+        landmarks[..., 1] += y0 / height
+        # z được MediaPipe chuẩn hóa theo chiều rộng ảnh đầu vào
+        landmarks[..., 2] *= scale_x
+        
+        # Protobuf gốc vẫn mang tọa độ của ROI nên không dùng được nữa
+        results.raw = None
+    
+    def _compute_roi(self, results: HandResults, width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Tính ROI vuông có padding bao quanh tất cả bàn tay đã phát hiện
+        
+        Khi còn thiếu tay (num_hands < MAX_HANDS) frame sau vẫn chạy trên toàn frame, nếu không
+        tay thứ hai xuất hiện ngoài ROI sẽ không bao giờ được phát hiện cho tới khi mất tay đầu tiên.
+        
+        Args:
+            results: Kết quả nhận diện (tọa độ theo toàn frame)
+            width: Chiều rộng frame
+            height: Chiều cao frame
+            
+        Returns:
+            Optional[Tuple[int, int, int, int]]: (x0, y0, x1, y1) hoặc None nếu chưa đủ MAX_HANDS tay
+        """
+        if results is None or results.num_hands < MAX_HANDS:
+            return None
+        
+        xy = results.landmarks[:, :, :2].reshape(-1, 2)
+        min_x, min_y = xy.min(axis=0) * (width, height)
+        max_x, max_y = xy.max(axis=0) * (width, height)
+        
+        # ROI vuông để MediaPipe không bị méo hình khi resize ảnh đầu vào
+        size = max(max_x - min_x, max_y - min_y) * (1 + 2 * ROI_PADDING)
+        size = max(size, ROI_MIN_SIZE * min(width, height))
+        size = min(size, width, height)
+        
+        center_x = (min_x + max_x) / 2
+        center_y = (min_y + max_y) / 2
+        x0 = int(max(0, min(center_x - size / 2, width - size)))
+        y0 = int(max(0, min(center_y - size / 2, height - size)))
+        
+        return (x0, y0, x0 + int(size), y0 + int(size))
+    
+    def get_roi_stats(self) -> Dict[str, Any]:
+        """
+        Lấy thống kê ROI tracking
+        
+        Returns:
+            Dict[str, Any]: Số frame chạy trên ROI, số lần quay về toàn frame và ROI hiện tại
+        """
+        return {
+            'roi': self.roi,
+            'roi_hits': self.roi_hits,
+            'roi_fallbacks': self.roi_fallbacks
+        }
+    
+    def _detect_hands_remote(self, frame: np.ndarray, timestamp: Optional[float] = None) -> Optional[HandResults]:
+        """
+        Gửi frame cho worker process và lấy kết quả mới nhất đã có
+        
+        Kết quả trả về có thể trễ một vài frame so với frame hiện tại vì
+        inference chạy song song với main thread.
+        
+        Args:
+            frame: Frame BGR từ webcam
+            timestamp: Thời điểm capture của frame, gửi kèm frame cho worker
+            
+        Returns:
+            Optional[HandResults]: Kết quả mới nhất hoặc None nếu worker chưa trả kết quả nào
+        """
+        if self.worker.process is None:
+            if not self.worker.start(frame.shape):
+                # Không khởi động được worker thì quay về chạy inline
+                return self._fall_back_to_inline(frame, timestamp)
+        elif not self.worker.is_running():
+            # Worker chết (crash của MediaPipe, bị kill): khởi động lại vài lần rồi quay về inline
+            self.worker.stop()
+            if self.worker_restarts >= INFERENCE_WORKER_RESTARTS:
+                self.logger.error(f"Inference worker stopped {self.worker_restarts + 1} times")
+                return self._fall_back_to_inline(frame, timestamp)
+            
+            self.worker_restarts += 1
+            self.logger.warning(f"Inference worker stopped unexpectedly, restarting "
+                                f"({self.worker_restarts}/{INFERENCE_WORKER_RESTARTS})")
+            # Kết quả cũ thuộc về worker trước, không dùng lại trong lúc worker mới khởi động
+            self.last_results = None
+            if not self.worker.start(frame.shape):
+                return self._fall_back_to_inline(frame, timestamp)
+        
+        self.worker.submit(frame, timestamp)
+        
+        latest = self.worker.poll()
+        if latest is not None:
+            self.last_results = HandResults(*latest)
+        
+        return self.last_results
+    
+    def _fall_back_to_inline(self, frame: np.ndarray, timestamp: Optional[float] = None) -> HandResults:
+        """
+        Bỏ worker process, tạo backend trong process chính và chạy inference trên frame hiện tại
+        
+        Args:
+            frame: Frame BGR từ webcam
+            timestamp: Thời điểm capture của frame
+            
+        Returns:
+            HandResults: Kết quả inference inline
+        """
+        self.logger.warning("Falling back to inline inference")
+        self.worker = None
+        self.inference_mode = "inline"
+        self.hands = self._create_hands()
+        return self.run_inference(frame, timestamp)
+    
+    def get_landmarks(self, results: Optional[HandResults], hand_index: int = 0) -> Optional[np.ndarray]:
         """
         Lấy tọa độ các landmarks của bàn tay
         
         Args:
-            results: Kết quả từ MediaPipe
+            results: Kết quả từ detect_hands
             hand_index: Index của bàn tay (0 cho tay đầu tiên)
             
         Returns:
-            Optional[List[Tuple[float, float]]]: Danh sách tọa độ landmarks hoặc None
+            Optional[np.ndarray]: View (21, 3) tọa độ normalized (x, y, z) hoặc None
         """
-        if not results.multi_hand_landmarks or hand_index >= len(results.multi_hand_landmarks):
+        if results is None or hand_index >= results.num_hands:
             return None
         
-        try:
-            hand_landmarks = results.multi_hand_landmarks[hand_index]
-            landmarks = []
-            
-            for landmark in hand_landmarks.landmark:
-                landmarks.append((landmark.x, landmark.y))
+        return results.landmarks[hand_index]
+    
+    def get_primary_hand_index(self, results: Optional[HandResults]) -> Optional[int]:
+        """
+        Lấy index của tay điều khiển chính (theo PRIMARY_HAND hoặc ID được chọn)
+        
+        Args:
+            results: Kết quả từ detect_hands
             
-            return landmarks
+        Returns:
+            Optional[int]: Index của tay chính trong results hoặc None nếu không có tay
+        """
+        if results is None or results.num_hands == 0:
+            return None
+        return self.identity.select_primary(results.ids, results.handedness, HANDEDNESS_LABELS)
+    
+    def get_landmarks_by_id(self, results: Optional[HandResults], hand_id: int) -> Optional[np.ndarray]:
+        """
+        Lấy landmarks của tay theo ID ổn định
+        
+        Args:
+            results: Kết quả từ detect_hands
+            hand_id: ID của tay
             
-        except Exception as e:
-            self.logger.error(f"Lỗi khi lấy landmarks: {e}")
+        Returns:
+            Optional[np.ndarray]: View (21, 3) hoặc None nếu tay không có trong frame
+        """
+        if results is None:
             return None
+        matches = np.flatnonzero(results.ids == hand_id)
+        return results.landmarks[matches[0]] if len(matches) else None
     
-    def get_finger_tip_positions(self, landmarks: List[Tuple[float, float]], 
+    def get_finger_tip_positions(self, landmarks: np.ndarray, 
                                 image_width: int, image_height: int) -> Dict[str, Tuple[int, int]]:
         """
         Lấy vị trí đầu ngón tay trong tọa độ pixel
         
         Args:
-            landmarks: Danh sách landmarks
+            landmarks: Mảng landmarks (21, 2) hoặc (21, 3)
             image_width: Chiều rộng của hình ảnh
             image_height: Chiều cao của hình ảnh
             
         Returns:
             Dict[str, Tuple[int, int]]: Dictionary chứa vị trí đầu các ngón tay
         """
-        finger_tips = {}
-        
         try:
-            # Lấy tọa độ các đầu ngón tay
-            tip_ids = {
-                'thumb': self.LANDMARK_IDS['THUMB_TIP'],
-                'index': self.LANDMARK_IDS['INDEX_FINGER_TIP'],
-                'middle': self.LANDMARK_IDS['MIDDLE_FINGER_TIP'],
-                'ring': self.LANDMARK_IDS['RING_FINGER_TIP'],
-                'pinky': self.LANDMARK_IDS['PINKY_TIP']
-            }
+            tip_ids = [
+                self.LANDMARK_IDS['THUMB_TIP'],
+                self.LANDMARK_IDS['INDEX_FINGER_TIP'],
+                self.LANDMARK_IDS['MIDDLE_FINGER_TIP'],
+                self.LANDMARK_IDS['RING_FINGER_TIP'],
+                self.LANDMARK_IDS['PINKY_TIP']
+            ]
             
-            for finger, tip_id in tip_ids.items():
-                if tip_id < len(landmarks):
-                    x = int(landmarks[tip_id][0] * image_width)
-                    y = int(landmarks[tip_id][1] * image_height)
-                    finger_tips[finger] = (x, y)
+            # Chuyển toàn bộ đầu ngón tay sang pixel trong một phép tính
+            pixels = (np.asarray(landmarks)[tip_ids, :2] * (image_width, image_height)).astype(int)
             
-            return finger_tips
+            return {
+                finger: (int(x), int(y))
+                for finger, (x, y) in zip(('thumb', 'index', 'middle', 'ring', 'pinky'), pixels)
+            }
             
         except Exception as e:
             self.logger.error(f"Lỗi khi lấy vị trí đầu ngón tay: {e}")
             return {}
     
-    def get_landmark_position(self, landmarks: List[Tuple[float, float]], 
+    def get_landmark_position(self, landmarks: np.ndarray, 
                              landmark_id: int, image_width: int, image_height: int) -> Optional[Tuple[int, int]]:
         """
         Lấy vị trí pixel của một landmark cụ thể
@@ -195,20 +716,23 @@ class HandTracker:
             self.logger.error(f"Lỗi khi tính khoảng cách: {e}")
             return float('inf')
     
-    def is_hand_detected(self, results: Any) -> bool:
+    def is_hand_detected(self, results: Optional[HandResults]) -> bool:
         """
         Kiểm tra có phát hiện được tay không
         
         Args:
-            results: Kết quả từ MediaPipe
+            results: Kết quả từ detect_hands
             
         Returns:
             bool: True nếu phát hiện được tay
         """
-        return results is not None and results.multi_hand_landmarks is not None
+        return results is not None and results.num_hands > 0
     
     def release(self):
         """Giải phóng tài nguyên"""
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.hands:
             self.hands.close()
-            self.logger.info("Hand tracker released")
+        self.logger.info("Hand tracker released")
@@ -0,0 +1,205 @@
+"""
+Inference Worker Module
+Chạy MediaPipe Hands trong một process riêng, nhận frame qua shared-memory ring
+và trả landmarks về qua queue gọn nhẹ
+"""
+
+import cv2
+import logging
+import queue
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+from typing import Optional, Tuple, Dict, Any
+from config.settings import INFERENCE_RING_SLOTS
+
+
+def _worker_main(shm_name: str, slots: int, frame_shape: Tuple[int, ...],
+                 task_queue: Any, result_queue: Any, tracker_options: Dict[str, Any]):
+    """
+    Vòng lặp của worker process: đọc frame từ ring, chạy MediaPipe, trả landmarks
+
+    Args:
+        shm_name: Tên vùng shared memory chứa ring
+        slots: Số slot trong ring
+        frame_shape: Kích thước một frame (height, width, 3)
+        task_queue: Queue nhận (slot, seq, timestamp capture) từ main process
+        result_queue: Queue trả (seq, slot, landmarks, handedness, scores)
+        tracker_options: Tham số khởi tạo HandTracker trong worker
+    """
+    # Import trong worker để tránh vòng import và để process con tự khởi tạo MediaPipe
+    from modules.hand_tracking import HandTracker
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = np.ndarray((slots,) + tuple(frame_shape), dtype=np.uint8, buffer=shm.buf)
+    tracker = HandTracker(inference_mode="inline", **tracker_options)
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            slot, seq, timestamp = task
+            try:
+                # Mảng được pickle (sao chép) khi đưa vào queue nên buffer của tracker dùng lại được
+                results = tracker.run_inference(ring[slot], timestamp)
+                payload = (results.landmarks, results.handedness, results.scores)
+            except Exception:
+                payload = (np.zeros((0, 21, 3), dtype=np.float32),
+                           np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.float32))
+
+            result_queue.put((seq, slot) + payload)
+    finally:
+        tracker.release()
+        del ring
+        shm.close()
+
+
+class InferenceWorker:
+    """Quản lý worker process chạy MediaPipe và shared-memory ring chứa frame"""
+
+    def __init__(self, slots: int = INFERENCE_RING_SLOTS, tracker_options: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            slots: Số slot frame trong shared-memory ring
+            tracker_options: Tham số khởi tạo HandTracker trong worker (vd: roi_tracking)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.slots = max(1, slots)
+        self.tracker_options = tracker_options or {}
+
+        self.frame_shape = None
+        self.shm = None
+        self.ring = None
+        self.process = None
+        self.task_queue = None
+        self.result_queue = None
+
+        # Slot đang rảnh và số thứ tự frame
+        self.free_slots = []
+        self.next_seq = 0
+        self.last_seq = -1
+        self.dropped_frames = 0
+
+    def start(self, frame_shape: Tuple[int, ...]) -> bool:
+        """
+        Khởi tạo shared-memory ring và worker process
+
+        Args:
+            frame_shape: Kích thước frame (height, width, 3)
+
+        Returns:
+            bool: True nếu khởi động thành công
+        """
+        try:
+            self.frame_shape = tuple(frame_shape)
+            frame_bytes = int(np.prod(self.frame_shape))
+
+            self.shm = shared_memory.SharedMemory(create=True, size=frame_bytes * self.slots)
+            self.ring = np.ndarray((self.slots,) + self.frame_shape, dtype=np.uint8, buffer=self.shm.buf)
+            self.free_slots = list(range(self.slots))
+
+            # Dùng "spawn" để hành vi giống nhau trên Windows, macOS và Linux
+            ctx = multiprocessing.get_context("spawn")
+            self.task_queue = ctx.Queue()
+            self.result_queue = ctx.Queue()
+            self.process = ctx.Process(
+                target=_worker_main,
+                args=(self.shm.name, self.slots, self.frame_shape, self.task_queue, self.result_queue,
+                      self.tracker_options),
+                daemon=True
+            )
+            self.process.start()
+
+            self.logger.info(f"Inference worker started (pid={self.process.pid}, "
+                             f"{self.slots} slots of {self.frame_shape})")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Không thể khởi động inference worker: {e}")
+            self.stop()
+            return False
+
+    def is_running(self) -> bool:
+        """Kiểm tra worker process còn chạy không"""
+        return self.process is not None and self.process.is_alive()
+
+    def submit(self, frame: np.ndarray, timestamp: Optional[float] = None) -> bool:
+        """
+        Ghi frame vào một slot rảnh của ring và gửi yêu cầu cho worker
+
+        Args:
+            frame: Frame BGR từ camera
+            timestamp: Thời điểm capture của frame (None = worker dùng đồng hồ của nó)
+
+        Returns:
+            bool: True nếu frame được gửi, False nếu ring đầy (frame bị bỏ qua)
+        """
+        if not self.free_slots:
+            self.dropped_frames += 1
+            return False
+
+        slot = self.free_slots.pop()
+        if frame.shape == self.frame_shape:
+            np.copyto(self.ring[slot], frame)
+        else:
+            # Landmarks là tọa độ normalized nên resize không làm sai lệch kết quả
+            cv2.resize(frame, (self.frame_shape[1], self.frame_shape[0]), dst=self.ring[slot])
+
+        self.task_queue.put((slot, self.next_seq, timestamp))
+        self.next_seq += 1
+        return True
+
+    def poll(self, timeout: Optional[float] = None) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Lấy kết quả mới nhất từ worker, bỏ qua các kết quả cũ hơn
+
+        Args:
+            timeout: Thời gian chờ kết quả (None = không chờ)
+
+        Returns:
+            Optional[Tuple]: (landmarks, handedness, scores) mới nhất hoặc None nếu chưa có kết quả mới
+        """
+        latest = None
+        while True:
+            try:
+                if timeout is not None and latest is None:
+                    item = self.result_queue.get(timeout=timeout)
+                else:
+                    item = self.result_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            seq, slot, landmarks, handedness, scores = item
+            self.free_slots.append(slot)
+            if seq > self.last_seq:
+                self.last_seq = seq
+                latest = (landmarks, handedness, scores)
+
+        return latest
+
+    def stop(self):
+        """Dừng worker process và giải phóng shared memory"""
+        if self.process is not None:
+            try:
+                self.task_queue.put(None)
+                self.process.join(timeout=2.0)
+                if self.process.is_alive():
+                    self.process.terminate()
+            except Exception as e:
+                self.logger.error(f"Lỗi khi dừng inference worker: {e}")
+            self.process = None
+
+        self.ring = None
+        if self.shm is not None:
+            try:
+                self.shm.close()
+                self.shm.unlink()
+            except Exception:
+                pass
+            self.shm = None
+
+        if self.dropped_frames:
+            self.logger.info(f"Inference worker dropped {self.dropped_frames} frames (ring full)")
+        self.free_slots = []
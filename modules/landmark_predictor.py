@@ -0,0 +1,120 @@
+"""
+Landmark Predictor Module
+Dự đoán vị trí 21 landmarks giữa các lần chạy MediaPipe bằng mô hình vận tốc không đổi
+"""
+
+import numpy as np
+from typing import Optional
+from config.settings import MAX_HANDS, PREDICTION_VELOCITY_SMOOTHING, INFERENCE_INTERVAL
+
+
+class LandmarkPredictor:
+    """
+    Bộ lọc vận tốc không đổi (alpha-beta với alpha = 1) cho toàn bộ mảng landmarks
+
+    Khi có kết quả inference, vị trí được lấy nguyên từ MediaPipe và vận tốc được
+    làm mượt theo hàm mũ. Giữa các lần inference, vị trí được ngoại suy tuyến tính
+    theo thời gian. Toàn bộ phép tính được vector hóa trên mảng (hands, 21, 3)
+    cấp phát sẵn.
+
+    Trạng thái của từng tay gắn với ID ổn định (HandIdentityTracker): MediaPipe có thể đổi thứ tự
+    các tay giữa hai frame, ghép theo index sẽ sinh vận tốc khổng lồ giữa hai tay khác nhau.
+    """
+
+    def __init__(self, max_hands: int = MAX_HANDS,
+                 velocity_smoothing: float = PREDICTION_VELOCITY_SMOOTHING,
+                 max_horizon: Optional[float] = None):
+        """
+        Args:
+            max_hands: Số tay tối đa cần theo dõi
+            velocity_smoothing: Trọng số của vận tốc mới đo (0.0 - 1.0)
+            max_horizon: Thời gian ngoại suy tối đa (giây), None = không giới hạn
+        """
+        self.velocity_smoothing = velocity_smoothing
+        self.max_horizon = max_horizon
+
+        self.position = np.zeros((max_hands, 21, 3), dtype=np.float32)
+        self.velocity = np.zeros((max_hands, 21, 3), dtype=np.float32)
+        self.prediction = np.zeros((max_hands, 21, 3), dtype=np.float32)
+        self.ids = np.full(max_hands, -1, dtype=np.int64)
+        self.num_hands = 0
+        self.last_update_time = 0.0
+
+    def has_state(self) -> bool:
+        """Kiểm tra đã có landmarks để dự đoán chưa"""
+        return self.num_hands > 0
+
+    def update(self, landmarks: Optional[np.ndarray], timestamp: float, ids: Optional[np.ndarray] = None):
+        """
+        Cập nhật bộ lọc với landmarks đo được từ MediaPipe
+
+        Args:
+            landmarks: Mảng (hands, 21, 3) hoặc None nếu không có tay
+            timestamp: Thời điểm của frame (giây)
+            ids: Mảng (hands,) ID ổn định của từng tay (mặc định coi index là ID)
+        """
+        if landmarks is None or len(landmarks) == 0:
+            self.reset()
+            return
+
+        num_hands = min(len(landmarks), len(self.position))
+        ids = np.arange(num_hands) if ids is None else np.asarray(ids)[:num_hands]
+        dt = timestamp - self.last_update_time
+
+        # Trạng thái cũ của từng tay theo ID; tay mới (hoặc dt không hợp lệ) bắt đầu với vận tốc 0
+        matches = ids[:, None] == self.ids[None, :]
+        previous = matches.argmax(axis=1)
+        velocity = self.velocity[previous]
+        if dt > 0:
+            measured_velocity = (landmarks[:num_hands] - self.position[previous]) / dt
+            velocity += self.velocity_smoothing * (measured_velocity - velocity)
+        else:
+            velocity[:] = 0.0
+        velocity[~matches.any(axis=1)] = 0.0
+
+        self.velocity[:num_hands] = velocity
+        self.position[:num_hands] = landmarks[:num_hands]
+        self.ids[:num_hands] = ids
+        self.ids[num_hands:] = -1
+        self.num_hands = num_hands
+        self.last_update_time = timestamp
+
+    def predict(self, timestamp: float) -> np.ndarray:
+        """
+        Ngoại suy landmarks tại thời điểm cho trước
+
+        Args:
+            timestamp: Thời điểm cần dự đoán (giây)
+
+        Returns:
+            np.ndarray: View (hands, 21, 3) của mảng dự đoán (được ghi đè ở lần gọi sau),
+                        cùng thứ tự tay với self.ids
+        """
+        dt = max(0.0, timestamp - self.last_update_time)
+        if self.max_horizon is not None:
+            dt = min(dt, self.max_horizon)
+
+        n = self.num_hands
+        np.multiply(self.velocity[:n], dt, out=self.prediction[:n])
+        self.prediction[:n] += self.position[:n]
+        return self.prediction[:n]
+
+    def reset(self):
+        """Xóa trạng thái dự đoán"""
+        self.num_hands = 0
+        self.velocity[:] = 0.0
+        self.ids[:] = -1
+
+
+def default_max_horizon(fps: float, interval: int = INFERENCE_INTERVAL) -> float:
+    """
+    Thời gian ngoại suy tối đa hợp lý: hai khoảng inference
+
+    Args:
+        fps: Tốc độ capture
+        interval: Số frame giữa hai lần inference
+
+    Returns:
+        float: Thời gian (giây)
+    """
+    return 2.0 * max(1, interval) / max(fps, 1.0)
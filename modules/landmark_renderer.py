@@ -0,0 +1,91 @@
+"""
+Landmark Renderer Module
+Vẽ khung xương bàn tay lên frame bằng các thao tác vector hóa (thay cho mp_drawing.draw_landmarks)
+"""
+
+import cv2
+import numpy as np
+from typing import Any, Optional
+from config.settings import MAX_HANDS, LANDMARK_JOINT_RADIUS, LANDMARK_BONE_THICKNESS, LANDMARK_BONE_COLOR
+
+# Các cặp landmark tạo thành xương bàn tay (giống mp.solutions.hands.HAND_CONNECTIONS)
+HAND_CONNECTIONS = np.array([
+    (0, 1), (1, 2), (2, 3), (3, 4),          # Ngón cái
+    (0, 5), (5, 6), (6, 7), (7, 8),          # Ngón trỏ
+    (5, 9), (9, 10), (10, 11), (11, 12),     # Ngón giữa
+    (9, 13), (13, 14), (14, 15), (15, 16),   # Ngón áp út
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)  # Ngón út và lòng bàn tay
+], dtype=np.intp)
+
+# Màu khớp theo ngón (BGR), cùng bảng màu với style mặc định của MediaPipe
+_PALM = (48, 48, 255)
+_THUMB = (180, 229, 255)
+_INDEX = (128, 64, 128)
+_MIDDLE = (0, 204, 255)
+_RING = (48, 255, 48)
+_PINKY = (192, 101, 21)
+
+JOINT_COLORS = np.array([
+    _PALM, _PALM, _THUMB, _THUMB, _THUMB,
+    _PALM, _INDEX, _INDEX, _INDEX,
+    _PALM, _MIDDLE, _MIDDLE, _MIDDLE,
+    _PALM, _RING, _RING, _RING,
+    _PALM, _PINKY, _PINKY, _PINKY
+], dtype=np.uint8)
+
+
+class LandmarkRenderer:
+    """Vẽ landmarks của tất cả bàn tay: một lần cv2.polylines cho xương, một lần gán mảng cho khớp"""
+
+    def __init__(self, joint_radius: int = LANDMARK_JOINT_RADIUS,
+                 bone_thickness: int = LANDMARK_BONE_THICKNESS,
+                 bone_color: tuple = LANDMARK_BONE_COLOR,
+                 max_hands: int = MAX_HANDS):
+        """
+        Args:
+            joint_radius: Bán kính điểm khớp (pixel)
+            bone_thickness: Độ dày nét xương (pixel)
+            bone_color: Màu xương (BGR)
+            max_hands: Số tay tối đa
+        """
+        self.bone_thickness = bone_thickness
+        self.bone_color = tuple(int(c) for c in bone_color)
+
+        # Offset các pixel của một hình tròn bán kính joint_radius, tính một lần
+        span = np.arange(-joint_radius, joint_radius + 1)
+        dy, dx = np.meshgrid(span, span, indexing="ij")
+        inside = dx ** 2 + dy ** 2 <= joint_radius ** 2
+        self.disc_offsets = np.stack([dx[inside], dy[inside]], axis=1)
+
+        # Màu của từng pixel trong tất cả các khớp của max_hands tay: (max_hands * 21 * disc, 3)
+        self.stamp_colors = np.repeat(np.tile(JOINT_COLORS, (max_hands, 1)), len(self.disc_offsets), axis=0)
+
+    def draw(self, frame: np.ndarray, results: Optional[Any]) -> np.ndarray:
+        """
+        Vẽ landmarks lên frame (sửa trực tiếp frame)
+
+        Args:
+            frame: Frame BGR
+            results: HandResults từ HandTracker.detect_hands
+
+        Returns:
+            np.ndarray: Frame đã vẽ
+        """
+        if results is None or results.num_hands == 0:
+            return frame
+
+        height, width = frame.shape[:2]
+        points = np.rint(results.landmarks[:, :, :2] * (width, height)).astype(np.int32)
+
+        # Tất cả xương của tất cả tay: mảng (hands * 21, 2, 2) đưa vào một lần polylines
+        bones = points[:, HAND_CONNECTIONS].reshape(-1, 2, 2)
+        cv2.polylines(frame, bones, False, self.bone_color, self.bone_thickness, cv2.LINE_AA)
+
+        # Khớp: cộng offset hình tròn vào từng khớp rồi gán màu bằng fancy indexing
+        pixels = (points.reshape(-1, 1, 2) + self.disc_offsets).reshape(-1, 2)
+        colors = self.stamp_colors[:len(pixels)]
+        visible = ((pixels[:, 0] >= 0) & (pixels[:, 0] < width)
+                   & (pixels[:, 1] >= 0) & (pixels[:, 1] < height))
+        frame[pixels[visible, 1], pixels[visible, 0]] = colors[visible]
+
+        return frame
@@ -0,0 +1,126 @@
+"""
+Motion Detector Module
+Phát hiện thay đổi trong cảnh bằng ảnh xám thu nhỏ để bỏ qua inference khi cảnh tĩnh
+"""
+
+import cv2
+import numpy as np
+from typing import Optional, Tuple, Dict
+from config.settings import (
+    MOTION_GATE_THRESHOLD, MOTION_GATE_SIZE, MOTION_GATE_BLOCK, MOTION_GATE_MAX_REUSE, MOTION_GATE_HAND_MAX_REUSE
+)
+
+
+def gray_thumbnail(frame: np.ndarray, size: Tuple[int, int],
+                   box: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
+    """
+    Tạo ảnh xám thu nhỏ của frame (hoặc một vùng của frame)
+
+    Thu nhỏ trước rồi mới chuyển sang xám để chỉ phải chuyển màu trên vài nghìn pixel.
+
+    Args:
+        frame: Frame BGR
+        size: Kích thước ảnh thu nhỏ (width, height)
+        box: Vùng (x0, y0, x1, y1) cần lấy, None = toàn frame
+
+    Returns:
+        np.ndarray: Ảnh xám uint8 kích thước size
+    """
+    if box is not None:
+        x0, y0, x1, y1 = box
+        frame = frame[y0:y1, x0:x1]
+    small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+
+class SceneChangeDetector:
+    """
+    Phát hiện cảnh không đổi so với frame được inference gần nhất
+
+    So sánh theo khối: ảnh chênh lệch được chia thành các khối block x block và lấy khối thay đổi
+    nhiều nhất. Trung bình cả ảnh thì một cú nhíp hay đầu ngón tay di chuyển (vài pixel của ảnh
+    thu nhỏ) bị pha loãng dưới ngưỡng.
+    """
+
+    def __init__(self, threshold: float = MOTION_GATE_THRESHOLD,
+                 size: Tuple[int, int] = MOTION_GATE_SIZE,
+                 max_reuse: int = MOTION_GATE_MAX_REUSE,
+                 block: int = MOTION_GATE_BLOCK,
+                 hand_max_reuse: int = MOTION_GATE_HAND_MAX_REUSE):
+        """
+        Args:
+            threshold: Chênh lệch mức xám trung bình (0-255) của khối thay đổi nhiều nhất
+                       dưới ngưỡng này coi là cảnh tĩnh
+            size: Kích thước ảnh xám thu nhỏ (width, height)
+            max_reuse: Số frame liên tiếp tối đa được dùng lại kết quả cũ khi không có tay
+            block: Cạnh khối so sánh (pixel của ảnh thu nhỏ)
+            hand_max_reuse: Số frame liên tiếp tối đa được dùng lại kết quả cũ khi đang có tay
+        """
+        self.threshold = threshold
+        self.size = tuple(size)
+        self.max_reuse = max_reuse
+        self.hand_max_reuse = hand_max_reuse
+        self.grid = (max(1, self.size[0] // block), max(1, self.size[1] // block))
+
+        self.reference = None
+        self.current = None
+        self.reuse_count = 0
+
+        # Thống kê cho cả phiên làm việc
+        self.checks = 0
+        self.hits = 0
+
+    def is_static(self, frame: np.ndarray, hand_present: bool = False) -> bool:
+        """
+        Kiểm tra frame có gần như giống frame tham chiếu không
+
+        So sánh với frame của lần inference gần nhất (không phải frame liền trước)
+        để chuyển động chậm vẫn được cộng dồn và kích hoạt inference.
+
+        Args:
+            frame: Frame BGR hiện tại
+            hand_present: Kết quả trước có tay (chỉ dùng lại tối đa hand_max_reuse frame)
+
+        Returns:
+            bool: True nếu có thể dùng lại kết quả inference trước
+        """
+        self.checks += 1
+        self.current = gray_thumbnail(frame, self.size)
+
+        max_reuse = self.hand_max_reuse if hand_present else self.max_reuse
+        if self.reference is None or self.reuse_count >= max_reuse:
+            return False
+
+        # Trung bình chênh lệch của từng khối (INTER_AREA), so ngưỡng với khối thay đổi nhiều nhất
+        difference = cv2.absdiff(self.current, self.reference)
+        blocks = cv2.resize(difference.astype(np.float32), self.grid, interpolation=cv2.INTER_AREA)
+        if blocks.max() >= self.threshold:
+            return False
+
+        self.reuse_count += 1
+        self.hits += 1
+        return True
+
+    def mark_inferred(self):
+        """Đặt frame vừa kiểm tra làm tham chiếu sau khi đã chạy inference trên nó"""
+        self.reference = self.current
+        self.reuse_count = 0
+
+    def reset(self):
+        """Xóa frame tham chiếu"""
+        self.reference = None
+        self.current = None
+        self.reuse_count = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Lấy thống kê của phiên
+
+        Returns:
+            Dict[str, float]: Số lần kiểm tra, số lần dùng lại kết quả và tỉ lệ dùng lại
+        """
+        return {
+            'checks': self.checks,
+            'hits': self.hits,
+            'hit_rate': self.hits / self.checks if self.checks else 0.0
+        }
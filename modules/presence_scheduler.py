@@ -0,0 +1,108 @@
+"""
+Presence Scheduler Module
+Giảm tốc độ capture và inference khi không có tay trong khung hình (idle power mode)
+"""
+
+import logging
+from typing import Optional
+from config.settings import FPS, IDLE_TIMEOUT, IDLE_FPS
+from utils.clock import Clock, SYSTEM_CLOCK
+
+
+class PresenceScheduler:
+    """Điều phối tốc độ vòng lặp chính dựa trên việc có tay trong khung hình hay không"""
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT, idle_fps: float = IDLE_FPS,
+                 active_fps: float = FPS, clock: Optional[Clock] = None):
+        """
+        Args:
+            idle_timeout: Số giây không thấy tay trước khi vào chế độ idle (0 = tắt)
+            idle_fps: Tốc độ capture/inference trong chế độ idle
+            active_fps: Tốc độ capture bình thường
+            clock: Nguồn thời gian khi không truyền now (mặc định đồng hồ đơn điệu của hệ thống)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.clock = clock or SYSTEM_CLOCK
+        self.idle_timeout = idle_timeout
+        self.idle_fps = idle_fps
+        self.active_fps = active_fps
+
+        self.is_idle = False
+        # Bắt đầu đếm từ frame đầu tiên được xử lý, không tính thời gian khởi động camera/model
+        self.last_presence_time: Optional[float] = None
+        self.idle_since = 0.0
+        self.total_idle_time = 0.0
+
+    def update(self, hand_detected: bool, now: Optional[float] = None) -> bool:
+        """
+        Cập nhật trạng thái theo kết quả nhận diện của frame vừa xử lý
+
+        Args:
+            hand_detected: True nếu frame vừa rồi có tay
+            now: Thời điểm hiện tại (mặc định clock.now())
+
+        Returns:
+            bool: True nếu vừa chuyển giữa chế độ active và idle
+        """
+        if now is None:
+            now = self.clock.now()
+        if self.last_presence_time is None:
+            self.last_presence_time = now
+
+        if hand_detected:
+            self.last_presence_time = now
+            if self.is_idle:
+                # Thấy tay -> về tốc độ đầy đủ ngay từ frame tiếp theo
+                self.is_idle = False
+                self.total_idle_time += now - self.idle_since
+                self.logger.info("Hand detected - leaving idle power mode")
+                return True
+            return False
+
+        if (not self.is_idle and self.idle_timeout > 0
+                and now - self.last_presence_time >= self.idle_timeout):
+            self.is_idle = True
+            self.idle_since = now
+            self.logger.info(f"No hand for {self.idle_timeout:.0f}s - entering idle power mode "
+                             f"({self.idle_fps} FPS)")
+            return True
+
+        return False
+
+    def target_fps(self) -> float:
+        """FPS mục tiêu của trạng thái hiện tại"""
+        return self.idle_fps if self.is_idle else self.active_fps
+
+    def remaining_frame_time(self, frame_start: float, now: Optional[float] = None) -> float:
+        """
+        Thời gian cần chờ thêm để giữ đúng FPS của chế độ idle
+
+        Ở chế độ active, vòng lặp chạy theo tốc độ camera nên không cần chờ.
+
+        Args:
+            frame_start: Thời điểm bắt đầu xử lý frame hiện tại
+            now: Thời điểm hiện tại (mặc định clock.now())
+
+        Returns:
+            float: Số giây cần chờ (0 nếu không cần)
+        """
+        if not self.is_idle or self.idle_fps <= 0:
+            return 0.0
+
+        if now is None:
+            now = self.clock.now()
+        return max(0.0, 1.0 / self.idle_fps - (now - frame_start))
+
+    def get_idle_time(self, now: Optional[float] = None) -> float:
+        """
+        Tổng thời gian ở chế độ idle trong phiên
+
+        Args:
+            now: Thời điểm hiện tại (mặc định clock.now())
+
+        Returns:
+            float: Số giây
+        """
+        if now is None:
+            now = self.clock.now()
+        return self.total_idle_time + (now - self.idle_since if self.is_idle else 0.0)
@@ -0,0 +1,255 @@
+"""
+Video Processor Module
+Xử lý offline video đã ghi thành landmarks, chia video thành nhiều shard chạy song song
+"""
+
+import os
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import cv2
+import numpy as np
+from typing import Optional, Dict, Any, Tuple
+from config.settings import MAX_HANDS, VIDEO_SHARD_OVERLAP
+
+
+def count_video_frames(path: str) -> Tuple[int, float]:
+    """
+    Đếm số frame và FPS của video
+
+    CAP_PROP_FRAME_COUNT không chính xác với một số codec, khi đó đếm bằng cách grab từng frame.
+
+    Args:
+        path: Đường dẫn file video
+
+    Returns:
+        Tuple[int, float]: (số frame, FPS)
+    """
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open video: {path}")
+
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if frame_count <= 0:
+            frame_count = 0
+            while cap.grab():
+                frame_count += 1
+        return frame_count, fps
+    finally:
+        cap.release()
+
+
+def _seek(cap: Any, frame_index: int):
+    """Di chuyển đến frame cho trước, grab tuần tự nếu backend không hỗ trợ seek"""
+    if frame_index <= 0:
+        return
+    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+    position = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+    if position != frame_index:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        for _ in range(frame_index):
+            if not cap.grab():
+                break
+
+
+def _process_shard(path: str, start: int, end: int, overlap: int, mirror: bool) -> Dict[str, Any]:
+    """
+    Xử lý một đoạn video [start, end) trong worker process
+
+    Mỗi worker có HandTracker riêng ở chế độ video (tracking giữa các frame). Các frame
+    overlap trước start chỉ dùng để làm nóng trạng thái tracking, không được ghi lại.
+
+    Args:
+        path: Đường dẫn file video
+        start: Frame đầu tiên của shard
+        end: Frame sau frame cuối cùng của shard
+        overlap: Số frame warm-up trước start
+        mirror: Lật frame theo chiều ngang giống camera trực tiếp
+
+    Returns:
+        Dict[str, Any]: Mảng kết quả của shard, số frame đã ghi (processed, ít hơn end - start nếu video
+                        hết sớm), thời gian của cả shard (elapsed: seek + warm-up + ghi) và thời gian
+                        chỉ của các frame được ghi (record_time)
+    """
+    # Import trong worker để mỗi process tự khởi tạo MediaPipe
+    from modules.hand_tracking import HandTracker
+
+    count = end - start
+    landmarks = np.zeros((count, MAX_HANDS, 21, 3), dtype=np.float32)
+    num_hands = np.zeros(count, dtype=np.int8)
+    handedness = np.zeros((count, MAX_HANDS), dtype=np.int8)
+    scores = np.zeros((count, MAX_HANDS), dtype=np.float32)
+
+    # Backend tasks chạy đồng bộ (running mode "video") để mỗi frame có kết quả của chính nó
+    tracker = HandTracker(inference_mode="inline", roi_tracking=False, inference_width=0,
+                          inference_interval=1, motion_gate=False, running_mode="video")
+    cap = cv2.VideoCapture(path)
+    # Timestamp của frame theo vị trí trong video (như timestamps trong file .npz), không theo đồng hồ
+    video_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    warmup_start = max(0, start - overlap)
+    processed = 0
+    warmup = 0
+    record_started = None
+
+    started = time.perf_counter()
+    try:
+        _seek(cap, warmup_start)
+        for frame_index in range(warmup_start, end):
+            ret, frame = cap.read()
+            if not ret or frame is None:
+                break
+            if frame_index == start:
+                # Throughput mỗi core chỉ tính các frame được ghi, không tính seek và warm-up
+                record_started = time.perf_counter()
+            if mirror:
+                frame = cv2.flip(frame, 1)
+
+            results = tracker.run_inference(frame, frame_index / video_fps)
+            if frame_index < start:
+                warmup += 1
+                continue
+
+            i = frame_index - start
+            n = results.num_hands
+            landmarks[i, :n] = results.landmarks
+            num_hands[i] = n
+            handedness[i, :n] = results.handedness
+            scores[i, :n] = results.scores
+            processed += 1
+    finally:
+        cap.release()
+        tracker.release()
+    finished = time.perf_counter()
+
+    return {
+        'start': start,
+        'end': end,
+        'landmarks': landmarks,
+        'num_hands': num_hands,
+        'handedness': handedness,
+        'scores': scores,
+        'processed': processed,
+        'warmup': warmup,
+        'elapsed': finished - started,
+        'record_time': finished - record_started if record_started is not None else 0.0
+    }
+
+
+def process_video(path: str, out_path: str, workers: Optional[int] = None,
+                  overlap: int = VIDEO_SHARD_OVERLAP, mirror: bool = False) -> Dict[str, float]:
+    """
+    Chuyển video đã ghi thành file landmarks .npz, chạy song song trên nhiều core
+
+    File kết quả chứa:
+        landmarks (T, MAX_HANDS, 21, 3), num_hands (T,), handedness (T, MAX_HANDS),
+        scores (T, MAX_HANDS), timestamps (T,) và fps
+
+    Args:
+        path: Đường dẫn file video
+        out_path: Đường dẫn file .npz đầu ra
+        workers: Số process (mặc định = số core)
+        overlap: Số frame warm-up trước mỗi shard
+        mirror: Lật frame theo chiều ngang giống camera trực tiếp
+
+    Returns:
+        Dict[str, float]: Thống kê: frames (số frame đã giải mã và ghi), warmup_frames, missing_frames
+                          (frame trong khoảng đã đếm nhưng không đọc được), elapsed, fps (frame ghi / thời
+                          gian thực), record_fps_per_core (frame ghi / thời gian xử lý chính các frame đó
+                          của mỗi worker, không tính seek và warm-up), workers
+    """
+    logger = logging.getLogger(__name__)
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    total_frames, video_fps = count_video_frames(path)
+    if total_frames == 0:
+        raise RuntimeError(f"No frames in video: {path}")
+
+    # Chia đều video thành các shard liên tiếp, mỗi worker một shard
+    boundaries = np.linspace(0, total_frames, min(workers, total_frames) + 1).astype(int)
+    shards = [(int(a), int(b)) for a, b in zip(boundaries[:-1], boundaries[1:]) if b > a]
+    logger.info(f"Processing {total_frames} frames in {len(shards)} shards "
+                f"({workers} workers, overlap {overlap})")
+
+    landmarks = np.zeros((total_frames, MAX_HANDS, 21, 3), dtype=np.float32)
+    num_hands = np.zeros(total_frames, dtype=np.int8)
+    handedness = np.zeros((total_frames, MAX_HANDS), dtype=np.int8)
+    scores = np.zeros((total_frames, MAX_HANDS), dtype=np.float32)
+
+    processed = 0
+    warmup = 0
+    record_time = 0.0
+    decoded_end = 0
+    short_shards = []
+    started = time.perf_counter()
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=ctx) as executor:
+        futures = [executor.submit(_process_shard, path, start, end, overlap, mirror)
+                   for start, end in shards]
+
+        # Ghép kết quả theo đúng thứ tự frame dựa trên vị trí bắt đầu của shard
+        for future in as_completed(futures):
+            shard = future.result()
+            start, end, count = shard['start'], shard['end'], shard['processed']
+            landmarks[start:start + count] = shard['landmarks'][:count]
+            num_hands[start:start + count] = shard['num_hands'][:count]
+            handedness[start:start + count] = shard['handedness'][:count]
+            scores[start:start + count] = shard['scores'][:count]
+
+            processed += count
+            warmup += shard['warmup']
+            record_time += shard['record_time']
+            if count:
+                decoded_end = max(decoded_end, start + count)
+            if count < end - start:
+                short_shards.append((start, end, count))
+            logger.info(f"Shard {start}-{end}: {count} frames in {shard['elapsed']:.1f}s "
+                        f"(+{shard['warmup']} warm-up; {count / max(shard['record_time'], 1e-9):.1f} FPS "
+                        f"on recorded frames)")
+
+    elapsed = time.perf_counter() - started
+
+    # Shard đọc thiếu frame: phần cuối video không giải mã được (CAP_PROP_FRAME_COUNT đếm dư) thì cắt bỏ,
+    # để timestamps không phủ frame chưa từng được đọc; khoảng trống giữa video thì cảnh báo
+    if decoded_end == 0:
+        raise RuntimeError(f"Could not decode any frame: {path}")
+    if decoded_end < total_frames:
+        logger.warning(f"Video ended at frame {decoded_end} of {total_frames} counted; "
+                       f"trimming output to {decoded_end} frames")
+        total_frames = decoded_end
+        landmarks, num_hands = landmarks[:total_frames], num_hands[:total_frames]
+        handedness, scores = handedness[:total_frames], scores[:total_frames]
+    missing = 0
+    for start, end, count in sorted(short_shards):
+        gap = min(end, total_frames) - (start + count)
+        if gap > 0:
+            missing += gap
+            logger.warning(f"Shard {start}-{end}: frames {start + count}-{min(end, total_frames)} "
+                           f"could not be decoded and are saved as no hand")
+
+    np.savez_compressed(
+        out_path,
+        landmarks=landmarks,
+        num_hands=num_hands,
+        handedness=handedness,
+        scores=scores,
+        timestamps=np.arange(total_frames, dtype=np.float64) / video_fps,
+        fps=video_fps
+    )
+
+    stats = {
+        'frames': processed,
+        'warmup_frames': warmup,
+        'missing_frames': missing,
+        'elapsed': elapsed,
+        'fps': processed / elapsed if elapsed > 0 else 0.0,
+        'record_fps_per_core': processed / record_time if record_time > 0 else 0.0,
+        'workers': len(shards)
+    }
+    logger.info(f"Saved landmarks to {out_path}: {stats['frames']} frames in {elapsed:.1f}s, "
+                f"{stats['fps']:.1f} FPS total, {stats['record_fps_per_core']:.1f} FPS per core "
+                f"(recorded frames only, excluding seek and {warmup} warm-up frames)")
+    return stats
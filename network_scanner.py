@@ -7,7 +7,6 @@ import socket
 import threading
 import time
 import argparse
-from modules.camera_manager import CameraManager
 
 class NetworkScanner:
     """Class để scan network tìm camera servers"""
@@ -91,6 +90,9 @@ class NetworkScanner:
         """Test một IP cụ thể"""
         print(f"🔍 Testing connection to {ip}:{self.port}...")
         
+        # Import khi cần để việc quét mạng không phải nạp OpenCV
+        from modules.camera_manager import CameraManager
+        
         if CameraManager.test_network_connection(ip, self.port, self.timeout):
             print(f"✅ Connection successful to {ip}:{self.port}")
             return True
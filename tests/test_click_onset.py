@@ -0,0 +1,87 @@
+"""
+Kiểm tra PinchOnsetDetector: hysteresis nhấn/nhả, nhấn sớm theo vận tốc khép và điều kiện hình dạng tay
+"""
+
+import numpy as np
+from utils.gesture_features import FEATURE_NAMES, NUM_FEATURES
+from utils.click_onset import PinchOnsetDetector
+
+# Kích thước lòng bàn tay giả định để đổi khoảng cách sang pinch_distance_norm
+PALM = 0.1
+FRAME = 1.0 / 30.0
+
+
+def _features(distance: float, index_pip_tip: float = 0.1, thumb_ip_tip: float = 0.1) -> np.ndarray:
+    features = np.zeros(NUM_FEATURES, dtype=np.float32)
+    features[FEATURE_NAMES["pinch_distance"]] = distance
+    features[FEATURE_NAMES["pinch_distance_norm"]] = distance / PALM
+    features[FEATURE_NAMES["index_pip_tip"]] = index_pip_tip
+    features[FEATURE_NAMES["thumb_ip_tip"]] = thumb_ip_tip
+    return features
+
+
+def _run(detector: PinchOnsetDetector, distances, start: float = 0.0, step: float = FRAME):
+    return [detector.update(_features(distance), start + i * step) for i, distance in enumerate(distances)]
+
+
+def _detector() -> PinchOnsetDetector:
+    # Nhấn < 0.06, nhấn sớm < 0.084, nhả > 0.096
+    return PinchOnsetDetector(press_threshold=0.06, release_ratio=1.6, onset_ratio=1.4, onset_speed=3.0)
+
+
+def test_hysteresis_single_click_per_pinch():
+    detector = _detector()
+    # Giữ nhíp và dao động giữa ngưỡng nhấn và ngưỡng nhả không tạo thêm click
+    clicks = _run(detector, [0.12, 0.12, 0.05, 0.05, 0.08, 0.05, 0.09, 0.05, 0.12, 0.12, 0.05])
+    assert clicks == [False, False, True, False, False, False, False, False, False, False, True]
+
+
+def test_release_needs_release_threshold():
+    detector = _detector()
+    assert _run(detector, [0.12, 0.12, 0.05]) == [False, False, True]
+
+    # Mở ra dưới ngưỡng nhả: vẫn đang nhấn, khép lại không click
+    detector.update(_features(0.09), 3 * FRAME)
+    assert detector.pressed
+    assert not detector.update(_features(0.05), 4 * FRAME)
+
+    # Qua ngưỡng nhả rồi khép lại: click mới
+    detector.update(_features(0.11), 5 * FRAME)
+    assert not detector.pressed
+    assert detector.update(_features(0.05), 6 * FRAME)
+
+
+def test_fast_closing_presses_early():
+    detector = _detector()
+    # Khép nhanh: 0.15 -> 0.08 trong một frame (21 lòng bàn tay / giây), 0.08 < ngưỡng nhấn sớm
+    assert _run(detector, [0.15, 0.15, 0.08]) == [False, False, True]
+
+    # Khép chậm tới cùng khoảng cách: chưa nhấn cho tới khi qua ngưỡng nhấn
+    detector = _detector()
+    assert _run(detector, [0.09, 0.085, 0.08, 0.08, 0.055], step=0.5) == [False, False, False, False, True]
+
+
+def test_gap_disables_early_press():
+    detector = _detector()
+    detector.update(_features(0.15), 0.0)
+    # Khoảng trống lớn hơn max_gap (mất tay): không tính vận tốc, không nhấn sớm
+    assert not detector.update(_features(0.08), detector.max_gap + 0.1)
+    assert detector.closing_speed == 0.0
+
+
+def test_requires_extended_fingers():
+    detector = _detector()
+    detector.update(_features(0.12), 0.0)
+    # Ngón trỏ co (như nắm tay): khoảng cách nhỏ nhưng không click
+    assert not detector.update(_features(0.03, index_pip_tip=0.01), FRAME)
+    assert not detector.update(_features(0.03, thumb_ip_tip=0.01), 2 * FRAME)
+    assert detector.update(_features(0.03), 3 * FRAME)
+
+
+def test_reset_releases():
+    detector = _detector()
+    _run(detector, [0.12, 0.05])
+    assert detector.pressed
+    detector.reset()
+    assert not detector.pressed
+    assert detector.update(_features(0.05), 1.0)
@@ -0,0 +1,72 @@
+"""
+Kiểm tra các bộ lọc con trỏ: bắt đầu lại từ vị trí đo sau khoảng trống, reset(), hội tụ về vị trí đứng yên
+và EMA tăng dần khớp với smoothing cũ tính lại cả cửa sổ
+"""
+
+import math
+import pytest
+from utils.cursor_filter import (
+    CURSOR_FILTERS, EMA_WINDOW_DECAY, CursorFilter, EmaCursorFilter, create_cursor_filter
+)
+
+FRAME = 1.0 / 30.0
+
+
+@pytest.mark.parametrize("name", CURSOR_FILTERS)
+def test_restart_after_gap(name):
+    cursor_filter = create_cursor_filter(name)
+    assert cursor_filter.apply(0.2, 0.3, 0.0) == (0.2, 0.3)
+
+    # Trong max_gap: được làm mượt, không nhảy tới vị trí đo
+    x, y = cursor_filter.apply(0.8, 0.7, FRAME)
+    assert 0.2 < x < 0.8 and 0.3 < y < 0.7
+
+    # Khoảng trống lớn hơn max_gap (mất tay): bắt đầu lại đúng tại vị trí đo
+    assert cursor_filter.apply(0.5, 0.4, FRAME + cursor_filter.max_gap + 0.01) == (0.5, 0.4)
+
+
+@pytest.mark.parametrize("name", CURSOR_FILTERS)
+def test_reset_and_repeated_timestamp(name):
+    cursor_filter = create_cursor_filter(name)
+    cursor_filter.apply(0.2, 0.2, 0.0)
+    cursor_filter.apply(0.4, 0.4, FRAME)
+
+    cursor_filter.reset()
+    assert cursor_filter.apply(0.9, 0.1, 2 * FRAME) == (0.9, 0.1)
+
+    # Cùng timestamp (khoảng thời gian không dương) cũng bắt đầu lại thay vì chia cho 0
+    assert cursor_filter.apply(0.3, 0.6, 2 * FRAME) == (0.3, 0.6)
+
+
+@pytest.mark.parametrize("name", CURSOR_FILTERS)
+def test_converges_to_still_position(name):
+    cursor_filter = create_cursor_filter(name)
+    cursor_filter.apply(0.2, 0.8, 0.0)
+    for t in range(1, 90):
+        x, y = cursor_filter.apply(0.6, 0.4, t * FRAME)
+    assert x == pytest.approx(0.6, abs=1e-3) and y == pytest.approx(0.4, abs=1e-3)
+
+
+def test_ema_matches_full_window():
+    smoothing, window = 0.7, 4
+    cursor_filter = EmaCursorFilter(smoothing=smoothing, window=window)
+    points = [(0.1 * t % 1.0, math.sin(t) * 0.5 + 0.5) for t in range(20)]
+
+    # Smoothing cũ: trung bình trọng số e^(-0.5 k) của window vị trí gần nhất, rồi làm mượt hàm mũ
+    expected = None
+    for t, (x, y) in enumerate(points):
+        recent = points[max(0, t - window + 1):t + 1][::-1]
+        weights = [EMA_WINDOW_DECAY ** k for k in range(len(recent))]
+        average = [sum(w * p[axis] for w, p in zip(weights, recent)) / sum(weights) for axis in range(2)]
+        if expected is None:
+            expected = (x, y)
+        else:
+            expected = tuple(e + (a - e) * (1.0 - smoothing) for e, a in zip(expected, average))
+
+        output = cursor_filter.apply(x, y, t * FRAME)
+        assert output == pytest.approx(expected, abs=1e-9)
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        CursorFilter()
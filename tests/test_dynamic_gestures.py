@@ -0,0 +1,95 @@
+"""
+Kiểm tra DynamicGestureEngine: cột DTW tăng dần phải bằng subsequence DTW tính trực tiếp theo công thức
+D(t, i) = c_i + min(D(t, i-1) + p, D(t-1, i), D(t-1, i-1)), D(t, 0) = 0, và gesture được nhận từ lịch sử landmarks
+"""
+
+import numpy as np
+from utils.dynamic_gestures import DynamicGestureEngine, GestureTemplate, swipe_template, circle_templates
+from utils.landmark_history import LandmarkHistory
+
+
+def _naive_dtw(template: np.ndarray, samples: np.ndarray, penalty: float) -> np.ndarray:
+    """
+    Subsequence DTW đầy đủ trên cả chuỗi (float64)
+
+    Returns:
+        np.ndarray: Mảng (T, m) giá trị D(t, i) với i = 1..m
+    """
+    length = len(template)
+    previous = np.full(length + 1, np.inf)
+    previous[0] = 0.0
+    rows = []
+    for sample in samples:
+        current = np.full(length + 1, np.inf)
+        current[0] = 0.0
+        for i in range(1, length + 1):
+            cost = abs(template[i - 1] - sample)
+            current[i] = cost + min(current[i - 1] + penalty, previous[i], previous[i - 1])
+        rows.append(current[1:])
+        previous = current
+    return np.array(rows)
+
+
+def test_incremental_column_matches_naive_dtw():
+    rng = np.random.default_rng(0)
+    templates = [swipe_template("swipe_right", 0, length=5),
+                 GestureTemplate("random", rng.normal(size=(7, 2))),
+                 *circle_templates("circle_cw", True, length=6)[:2]]
+    penalty = 0.5
+    engine = DynamicGestureEngine(templates, warp_penalty=penalty)
+
+    angles = rng.uniform(0, 2 * np.pi, 60)
+    samples = (np.cos(angles) + 1j * np.sin(angles)) * rng.uniform(0.2, 1.0, 60)
+    columns = []
+    for sample in samples:
+        engine._update_column(complex(sample))
+        columns.append(engine._column.copy())
+    columns = np.array(columns)
+
+    for template, start, end in zip(templates, engine.starts, engine.ends):
+        points = template.directions[:, 0] + 1j * template.directions[:, 1]
+        expected = _naive_dtw(points.astype(np.complex64), samples.astype(np.complex64), penalty)
+        np.testing.assert_allclose(columns[:, start:end + 1], expected, rtol=1e-4, atol=1e-4)
+
+
+def _pointer_history():
+    """Lịch sử của bàn tay (lòng bàn tay 0.1) với đầu ngón trỏ ở vị trí cho trước"""
+    history = LandmarkHistory(capacity=16)
+
+    def push(x: float, y: float, timestamp: float):
+        hand = np.zeros((21, 3), dtype=np.float32)
+        hand[0, :2] = (x, y + 0.1)
+        hand[9, :2] = (x, y)
+        hand[8, :2] = (x, y - 0.05)
+        history.push(hand, timestamp)
+        return history
+
+    return push
+
+
+def test_swipe_recognized_once():
+    engine = DynamicGestureEngine([swipe_template("swipe_right", 0), swipe_template("swipe_left", 180)],
+                                  cooldown=0.5)
+    push = _pointer_history()
+
+    # Giữ yên rồi vuốt sang phải nhanh (6 lòng bàn tay / giây) trong 0.5 giây
+    results = [engine.update(push(0.5, 0.5, t / 30.0)) for t in range(10)]
+    results += [engine.update(push(0.5 + 0.02 * t, 0.5, (10 + t) / 30.0)) for t in range(1, 16)]
+
+    assert results[:10] == [None] * 10
+    assert results.count("swipe_right") == 1
+    assert "swipe_left" not in results
+
+
+def test_gap_restarts_trajectory():
+    engine = DynamicGestureEngine([swipe_template("swipe_right", 0, length=8)], max_gap=0.25)
+    push = _pointer_history()
+
+    # Nửa cú vuốt, mất tay 1 giây, rồi nửa còn lại: không được ghép thành một cú vuốt
+    results = [engine.update(push(0.3 + 0.02 * t, 0.5, t / 30.0)) for t in range(5)]
+    results += [engine.update(push(0.4 + 0.02 * t, 0.5, 1.2 + t / 30.0)) for t in range(5)]
+    assert results == [None] * 10
+
+    # Tiếp tục vuốt sau khi tay quay lại: đủ mẫu liên tục thì vẫn nhận được
+    results = [engine.update(push(0.5 + 0.02 * t, 0.5, 1.2 + (5 + t) / 30.0)) for t in range(5)]
+    assert results.count("swipe_right") == 1
@@ -0,0 +1,52 @@
+"""
+Kiểm tra evaluate_gestures: kết quả vector hóa phải trùng từng frame với replay_gestures, tức là
+GestureRecognizer của pipeline trực tiếp chạy trên đồng hồ ảo, ở cả chế độ click "vote" và "onset"
+"""
+
+import numpy as np
+import pytest
+from benchmarks.click_latency import synthetic_session
+from utils.gesture_batch import BATCH_LABELS, evaluate_gestures, replay_gestures, summarize
+
+
+def _session():
+    """Phiên nhíp tổng hợp có thêm các đoạn nắm tay, một lần mất tay dài và một lần mất tay ngắn"""
+    landmarks, timestamps, _ = synthetic_session(seconds=20.0)
+    rng = np.random.default_rng(1)
+
+    # Nắm tay: đầu 4 ngón về giữa cổ tay và MCP, đầu ngón cái thẳng hàng với MCP ngón cái theo x
+    fist = landmarks[0].copy()
+    for tip, mcp in ((8, 5), (12, 9), (16, 13), (20, 17)):
+        fist[tip, :2] = (fist[0, :2] + fist[mcp, :2]) / 2
+    fist[4, 0] = fist[2, 0]
+    for start, length in ((200, 30), (420, 12), (480, 25)):
+        landmarks[start:start + length] = fist + rng.normal(0, 0.004, (length, 21, 3)).astype(np.float32)
+
+    present = np.ones(len(timestamps), dtype=bool)
+    present[100:130] = False
+    present[300:302] = False
+    return landmarks, timestamps, present
+
+
+@pytest.mark.parametrize("click_mode", ["vote", "onset"])
+@pytest.mark.parametrize("landmark_filter", [True, False])
+def test_evaluate_matches_live_replay(click_mode, landmark_filter):
+    landmarks, timestamps, present = _session()
+    decisions = evaluate_gestures(landmarks, timestamps, present, click_mode=click_mode,
+                                  landmark_filter=landmark_filter)
+    replayed = replay_gestures(landmarks, timestamps, present, landmark_filter=landmark_filter,
+                               click_mode=click_mode)
+
+    assert [BATCH_LABELS[decision] for decision in decisions] == replayed
+
+    # Phiên phải thực sự có click trái, click phải và frame không có tay để phép so sánh có ý nghĩa
+    counts = summarize(decisions)
+    assert counts["left_click"] > 0 and counts["right_click"] > 0
+    assert counts["no_hand"] == int((~present).sum())
+
+
+def test_custom_click_threshold_matches_replay():
+    landmarks, timestamps, present = _session()
+    decisions = evaluate_gestures(landmarks, timestamps, present, click_threshold=0.03, click_cooldown=0.3)
+    replayed = replay_gestures(landmarks, timestamps, present, click_threshold=0.03, click_cooldown=0.3)
+    assert [BATCH_LABELS[decision] for decision in decisions] == replayed
@@ -0,0 +1,91 @@
+"""
+Kiểm tra GestureRuleSet: đường batch (match_batch, stabilize_batch) phải cho đúng kết quả của match()
+và stabilize() chạy từng frame, và ma trận biên dịch phải khớp với việc kiểm tra từng điều kiện
+"""
+
+import numpy as np
+import pytest
+from utils.gesture_features import FEATURE_NAMES, NUM_FEATURES
+from utils.gesture_rules import GESTURE_REGISTRY, GestureRule, GestureRuleSet, build_rules, register_gesture
+
+
+def _rules():
+    """Luật mặc định cùng một luật "ít nhất 2/3 điều kiện" với cửa sổ ổn định khác"""
+    return build_rules(registry=()) + [
+        GestureRule("spread", "scroll",
+                    [("pinch_distance", ">", 0.2), ("index_pip_tip", ">", 0.05), ("thumb_dx", ">", 0.1)],
+                    priority=0, window=4, min_votes=3, min_conditions=2),
+    ]
+
+
+def _features(count: int, seed: int = 0) -> np.ndarray:
+    """Đặc trưng ngẫu nhiên quanh các ngưỡng của luật để mọi luật đều khớp và không khớp"""
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-0.1, 1.2, size=(count, NUM_FEATURES)).astype(np.float32) * \
+        rng.choice([0.1, 1.0], size=(count, NUM_FEATURES)).astype(np.float32)
+
+
+def _naive_match(rule: GestureRule, features: np.ndarray) -> bool:
+    passed = 0
+    for feature, operator, threshold in rule.conditions:
+        value = float(features[FEATURE_NAMES[feature]])
+        passed += value < threshold if operator == "<" else value > threshold
+    return passed >= rule.min_conditions
+
+
+def test_match_batch_matches_per_frame():
+    features = _features(500)
+    rule_set = GestureRuleSet(_rules())
+    batch = rule_set.match_batch(features)
+
+    for t, frame in enumerate(features):
+        matched = rule_set.match(frame)
+        np.testing.assert_array_equal(batch[t], matched)
+        assert matched.tolist() == [_naive_match(rule, frame) for rule in rule_set.rules]
+
+    # Mỗi luật đều có frame khớp và frame không khớp
+    assert batch.any(axis=0).all() and (~batch).any(axis=0).all()
+
+
+def test_stabilize_batch_matches_per_frame():
+    features = _features(500, seed=1)
+    rule_set = GestureRuleSet(_rules())
+    matched = rule_set.match_batch(features)
+    batch = rule_set.stabilize_batch(matched)
+
+    stable = np.array([rule_set.stabilize(rule_set.match(frame)) for frame in features])
+    np.testing.assert_array_equal(batch, stable)
+
+
+def test_rules_sorted_by_priority():
+    rule_set = GestureRuleSet(_rules())
+    assert rule_set.names == ["fist", "pinch", "spread"]
+    assert rule_set.labels == ["moving", "left_click", "right_click", "scroll"]
+
+
+def test_registry_is_explicit():
+    spread = _rules()[-1]
+    saved = list(GESTURE_REGISTRY)
+    try:
+        register_gesture(spread)
+        assert [rule.name for rule in build_rules()] == ["pinch", "fist", "spread"]
+        # registry=() không phụ thuộc các gesture đã đăng ký toàn cục
+        assert [rule.name for rule in build_rules(registry=())] == ["pinch", "fist"]
+
+        # Bộ luật đã tạo không đổi khi đăng ký thêm sau đó
+        rules = build_rules()
+        register_gesture(spread.replace(name="other"))
+        assert [rule.name for rule in rules] == ["pinch", "fist", "spread"]
+    finally:
+        GESTURE_REGISTRY[:] = saved
+
+
+def test_invalid_rule_rejected():
+    conditions = [("pinch_distance", "<", 0.05), ("index_pip_tip", ">", 0.05)]
+    with pytest.raises(ValueError):
+        GestureRule("bad", "left_click", conditions, window=3, min_votes=4)
+    with pytest.raises(ValueError):
+        GestureRule("bad", "left_click", conditions, min_conditions=3)
+    # Ghi đè độ ổn định làm luật không bao giờ kích hoạt cũng bị từ chối
+    with pytest.raises(ValueError):
+        build_rules(stability={"pinch": {"window": 2, "min_votes": 3}}, registry=())
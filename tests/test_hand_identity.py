@@ -0,0 +1,91 @@
+"""
+Kiểm tra HandIdentityTracker: ID đi theo bàn tay khi MediaPipe đổi thứ tự tay, được giữ trong TTL
+khi tay biến mất và tay chính không đổi khi thứ tự thay đổi
+"""
+
+import numpy as np
+from modules.hand_identity import HandIdentityTracker
+
+LEFT, RIGHT = 0, 1
+
+
+def _hand(x: float, y: float) -> np.ndarray:
+    """Bàn tay (21, 3) quanh điểm (x, y), cổ tay ở dưới"""
+    rng = np.random.default_rng(int(x * 1000) + int(y * 10))
+    hand = np.zeros((21, 3), dtype=np.float32)
+    hand[:, :2] = (x, y) + rng.uniform(-0.05, 0.05, size=(21, 2))
+    hand[0, :2] = (x, y + 0.1)
+    return hand
+
+
+def _frame(*hands):
+    landmarks = np.stack([hand for hand, _ in hands]) if hands else np.zeros((0, 21, 3), dtype=np.float32)
+    handedness = np.array([label for _, label in hands], dtype=np.int8)
+    return landmarks, handedness
+
+
+def test_ids_follow_hands_under_reorder():
+    tracker = HandIdentityTracker(ttl=5)
+    a, b = (_hand(0.3, 0.5), LEFT), (_hand(0.7, 0.5), RIGHT)
+    first = tracker.assign(*_frame(a, b))
+    assert first.tolist() == [0, 1]
+
+    rng = np.random.default_rng(0)
+    for step in range(1, 30):
+        # Tay di chuyển ít, thứ tự trong kết quả MediaPipe đổi ngẫu nhiên
+        shift = np.float32(0.005 * step)
+        moved_a = (a[0] + [shift, 0.0, 0.0], LEFT)
+        moved_b = (b[0] - [shift, 0.0, 0.0], RIGHT)
+        if rng.random() < 0.5:
+            ids = tracker.assign(*_frame(moved_a, moved_b))
+            assert ids.tolist() == [0, 1]
+        else:
+            ids = tracker.assign(*_frame(moved_b, moved_a))
+            assert ids.tolist() == [1, 0]
+
+
+def test_handedness_flip_does_not_swap_ids():
+    tracker = HandIdentityTracker()
+    a, b = _hand(0.3, 0.5), _hand(0.7, 0.5)
+    tracker.assign(*_frame((a, LEFT), (b, RIGHT)))
+
+    # MediaPipe đổi nhãn handedness của cả hai tay trong một frame: vị trí vẫn quyết định ID
+    ids = tracker.assign(*_frame((b, LEFT), (a, RIGHT)))
+    assert ids.tolist() == [1, 0]
+
+
+def test_lost_hand_keeps_id_within_ttl():
+    tracker = HandIdentityTracker(ttl=3)
+    a, b = (_hand(0.3, 0.5), LEFT), (_hand(0.7, 0.5), RIGHT)
+    tracker.assign(*_frame(a, b))
+
+    # Tay a biến mất 3 frame (= TTL) rồi quay lại: giữ ID cũ
+    for _ in range(3):
+        assert tracker.assign(*_frame(b)).tolist() == [1]
+    assert tracker.assign(*_frame(b, a)).tolist() == [1, 0]
+
+    # Biến mất lâu hơn TTL: tay quay lại nhận ID mới
+    for _ in range(4):
+        tracker.assign(*_frame(b))
+    assert tracker.assign(*_frame(a, b)).tolist() == [2, 1]
+
+
+def test_far_hand_gets_new_id():
+    tracker = HandIdentityTracker()
+    tracker.assign(*_frame((_hand(0.2, 0.5), LEFT)))
+    # Tay ở xa hơn HAND_MATCH_MAX_DISTANCE không được ghép với track cũ
+    assert tracker.assign(*_frame((_hand(0.8, 0.5), LEFT))).tolist() == [1]
+
+
+def test_primary_hand_stable_under_reorder():
+    tracker = HandIdentityTracker(primary_hand="auto")
+    a, b = (_hand(0.3, 0.5), LEFT), (_hand(0.7, 0.5), RIGHT)
+
+    landmarks, handedness = _frame(a, b)
+    ids = tracker.assign(landmarks, handedness)
+    assert ids[tracker.select_primary(ids, handedness)] == 0
+
+    landmarks, handedness = _frame(b, a)
+    ids = tracker.assign(landmarks, handedness)
+    index = tracker.select_primary(ids, handedness)
+    assert index == 1 and ids[index] == 0
@@ -0,0 +1,73 @@
+"""
+Kiểm tra LandmarkHistory: cửa sổ sau khi ring quay vòng phải đúng thứ tự cũ -> mới và là view, không sao chép
+"""
+
+import numpy as np
+from utils.landmark_history import LandmarkHistory
+
+
+def _frame(value: float, num_landmarks: int = 21) -> np.ndarray:
+    """Landmarks (num_landmarks, 3) mang giá trị riêng của frame để kiểm tra thứ tự"""
+    frame = np.full((num_landmarks, 3), value, dtype=np.float32)
+    frame[:, 0] += np.arange(num_landmarks)
+    return frame
+
+
+def test_window_after_wraparound():
+    history = LandmarkHistory(capacity=4)
+    frames = [_frame(float(t)) for t in range(11)]
+    for t, frame in enumerate(frames):
+        history.push(frame, t * 0.1)
+
+        expected = np.stack(frames[max(0, t - 3):t + 1])
+        np.testing.assert_array_equal(history.window(), expected)
+        np.testing.assert_allclose(history.times(), np.arange(max(0, t - 3), t + 1) * 0.1)
+        np.testing.assert_array_equal(history.latest(), frames[t])
+
+    assert len(history) == 4
+    np.testing.assert_array_equal(history.window(2), np.stack(frames[-2:]))
+    np.testing.assert_array_equal(history.track(8), np.stack(frames[-4:])[:, 8])
+    assert history.latest_time() == 1.0
+
+    # Mọi cửa sổ là view của buffer cấp phát sẵn
+    assert np.shares_memory(history.window(), history._landmarks)
+    assert np.shares_memory(history.times(), history._timestamps)
+
+
+def test_frame_lookup_and_overwrite():
+    history = LandmarkHistory(capacity=3)
+    for t in range(5):
+        history.push(_frame(float(t)), float(t))
+
+    np.testing.assert_array_equal(history.frame(4), _frame(4.0))
+    np.testing.assert_array_equal(history.frame(2), _frame(2.0))
+    # Frame đã bị ghi đè hoặc chưa tồn tại
+    assert history.frame(1) is None
+    assert history.frame(5) is None
+
+
+def test_two_column_landmarks_clear_z():
+    history = LandmarkHistory(capacity=2)
+    history.push(_frame(5.0), 0.0)
+    history.push(_frame(5.0), 0.1)
+
+    # Landmarks (x, y) ghi đè slot cũ: z phải về 0, không giữ z của frame trước
+    history.push(_frame(7.0)[:, :2], 0.2)
+    np.testing.assert_array_equal(history.latest()[:, 2], 0.0)
+    np.testing.assert_array_equal(history.latest()[:, :2], _frame(7.0)[:, :2])
+
+
+def test_reset_keeps_frame_count():
+    history = LandmarkHistory(capacity=4)
+    for t in range(6):
+        history.push(_frame(float(t)), float(t))
+    history.reset()
+
+    assert len(history) == 0
+    assert history.latest() is None
+    assert history.window().shape == (0, 21, 3)
+
+    # Tay xuất hiện lại: lịch sử mới chỉ có frame sau reset
+    history.push(_frame(9.0), 9.0)
+    np.testing.assert_array_equal(history.window(), _frame(9.0)[None])
+    assert history.frame_count == 7
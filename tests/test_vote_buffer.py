@@ -0,0 +1,59 @@
+"""
+Kiểm tra VoteBuffer: số đếm chạy và nhãn thắng phải khớp với việc đếm lại cửa sổ từ đầu
+"""
+
+import random
+from collections import Counter
+from utils.vote_buffer import VoteBuffer
+
+
+def test_counts_match_naive_window():
+    rng = random.Random(0)
+    buffer = VoteBuffer(5, num_labels=3)
+    labels = []
+    for _ in range(200):
+        label = rng.randrange(3)
+        buffer.push(label)
+        labels.append(label)
+
+        window = labels[-5:]
+        assert buffer.values() == window
+        assert [buffer.count(i) for i in range(3)] == [window.count(i) for i in range(3)]
+
+        # Nhãn thắng luôn có số phiếu lớn nhất của cửa sổ
+        assert buffer.count(buffer.most_common()) == max(Counter(window).values())
+
+
+def test_tie_keeps_current_winner():
+    buffer = VoteBuffer(4, num_labels=2)
+    for label in (1, 1, 0):
+        buffer.push(label)
+    assert buffer.most_common() == 1
+
+    # 2-2: nhãn đang thắng được giữ thay vì nhảy về nhãn nhỏ hơn
+    buffer.push(0)
+    assert buffer.most_common() == 1
+
+    # 0 nhiều phiếu hơn mới đổi nhãn thắng, rồi hòa lại thì giữ 0
+    buffer.push(0)
+    assert buffer.most_common() == 0
+    buffer.push(1)
+    buffer.push(1)
+    assert buffer.values() == [0, 0, 1, 1]
+    assert buffer.most_common() == 0
+
+
+def test_reset_clears_window():
+    buffer = VoteBuffer(3, num_labels=2)
+    for label in (1, 1, 1):
+        buffer.push(label)
+    buffer.reset()
+
+    assert buffer.values() == []
+    assert buffer.count(1) == 0
+    assert buffer.most_common() == 0
+
+    # Sau reset cửa sổ đầy lại từ đầu, nhãn cũ không còn bị trừ
+    buffer.push(0)
+    assert buffer.values() == [0]
+    assert buffer.count(0) == 1
@@ -0,0 +1,200 @@
+"""
+Train Gesture Classifier
+Huấn luyện MLP nhận diện gesture (utils.gesture_classifier) từ các phiên đã ghi bằng --process-video,
+rồi báo cáo độ chính xác và độ trễ trên tập held-out so với các luật ngưỡng
+
+Mỗi phiên là một file .npz, nhãn gán cho cả file (ghi riêng một video cho từng gesture),
+hoặc lấy theo từng frame nếu file có mảng 'labels':
+    python main.py --process-video fist.mp4 --out fist.npz
+    python train_gesture_classifier.py none:open.npz pinch:pinch.npz fist:fist.npz --out models/gesture_classifier.npz
+"""
+
+import argparse
+import os
+import time
+import numpy as np
+from typing import Dict, List, Tuple
+from config.settings import GESTURE_CLASSIFIER_MODEL
+from utils.gesture_features import compute_features_batch
+from utils.gesture_rules import GestureRuleSet, build_rules
+from utils.gesture_classifier import (
+    CLASSIFIER_INPUTS, NO_GESTURE, GestureClassifier, save_model, load_weights, rule_predictions
+)
+
+
+def load_session(spec: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Đọc đặc trưng và nhãn của một phiên (chỉ các frame có tay)
+
+    Args:
+        spec: "nhãn:đường_dẫn.npz" hoặc "đường_dẫn.npz" (file phải có mảng 'labels' theo frame)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (features (N, NUM_FEATURES), nhãn (N,) dạng chuỗi)
+    """
+    label, _, path = spec.partition(":") if not os.path.exists(spec) else ("", "", spec)
+    data = np.load(path)
+    present = data['num_hands'] > 0
+    features = compute_features_batch(data['landmarks'][present, 0])
+    if label:
+        labels = np.full(len(features), label)
+    elif 'labels' in data:
+        labels = data['labels'][present].astype(str)
+    else:
+        raise ValueError(f"{path}: cần nhãn dạng 'nhãn:{path}' hoặc mảng 'labels' trong file")
+    return features, labels
+
+
+def split_holdout(features: np.ndarray, labels: np.ndarray, holdout: float):
+    """
+    Tách phần cuối của phiên làm tập held-out (các frame liền kề gần giống nhau nên không chia ngẫu nhiên)
+
+    Returns:
+        Tuple: (train features, train labels, test features, test labels)
+    """
+    cut = int(len(features) * (1.0 - holdout))
+    return features[:cut], labels[:cut], features[cut:], labels[cut:]
+
+
+def train_mlp(inputs: np.ndarray, targets: np.ndarray, num_classes: int, hidden: int = 32,
+              epochs: int = 200, batch_size: int = 256, learning_rate: float = 1e-2,
+              weight_decay: float = 1e-4, seed: int = 0) -> Dict[str, np.ndarray]:
+    """
+    Huấn luyện MLP một lớp ẩn bằng softmax cross-entropy và Adam (thuần NumPy)
+
+    Các lớp được cân bằng trọng số để lớp ít mẫu không bị lấn át.
+
+    Args:
+        inputs: Mảng (N, D) đã chuẩn hóa
+        targets: Mảng (N,) index lớp
+
+    Returns:
+        Dict[str, np.ndarray]: Trọng số 'w1', 'b1', 'w2', 'b2'
+    """
+    rng = np.random.default_rng(seed)
+    dims = inputs.shape[1]
+    params = {
+        'w1': rng.normal(0, np.sqrt(2.0 / dims), (dims, hidden)),
+        'b1': np.zeros(hidden),
+        'w2': rng.normal(0, np.sqrt(1.0 / hidden), (hidden, num_classes)),
+        'b2': np.zeros(num_classes),
+    }
+    moments = {name: (np.zeros_like(value), np.zeros_like(value)) for name, value in params.items()}
+    class_weights = len(targets) / (num_classes * np.maximum(np.bincount(targets, minlength=num_classes), 1))
+    one_hot = np.eye(num_classes)
+
+    step = 0
+    for _ in range(epochs):
+        order = rng.permutation(len(inputs))
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            x, y = inputs[batch], targets[batch]
+            weights = class_weights[y][:, None] / class_weights[y].sum()
+
+            # Lan truyền xuôi
+            hidden_out = np.maximum(x @ params['w1'] + params['b1'], 0.0)
+            logits = hidden_out @ params['w2'] + params['b2']
+            logits -= logits.max(axis=1, keepdims=True)
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=1, keepdims=True)
+
+            # Lan truyền ngược
+            d_logits = (probs - one_hot[y]) * weights
+            d_hidden = (d_logits @ params['w2'].T) * (hidden_out > 0)
+            grads = {
+                'w1': x.T @ d_hidden + weight_decay * params['w1'],
+                'b1': d_hidden.sum(axis=0),
+                'w2': hidden_out.T @ d_logits + weight_decay * params['w2'],
+                'b2': d_logits.sum(axis=0),
+            }
+
+            # Adam
+            step += 1
+            for name, grad in grads.items():
+                m, v = moments[name]
+                m *= 0.9
+                m += 0.1 * grad
+                v *= 0.999
+                v += 0.001 * grad * grad
+                m_hat = m / (1 - 0.9 ** step)
+                v_hat = v / (1 - 0.999 ** step)
+                params[name] -= learning_rate * m_hat / (np.sqrt(v_hat) + 1e-8)
+
+    return {name: value.astype(np.float32) for name, value in params.items()}
+
+
+def report(name: str, predicted: np.ndarray, targets: np.ndarray, labels: List[str]):
+    """In độ chính xác tổng, recall từng lớp và ma trận nhầm lẫn"""
+    confusion = np.zeros((len(labels), len(labels)), dtype=np.int64)
+    valid = predicted >= 0
+    np.add.at(confusion, (targets[valid], predicted[valid]), 1)
+    recall = confusion.diagonal() / np.maximum(confusion.sum(axis=1), 1)
+    print(f"\n{name}: accuracy {100 * np.mean(predicted == targets):.1f}%")
+    print(f"{'':>10} " + " ".join(f"{label:>8}" for label in labels) + f" {'recall':>8}")
+    for i, label in enumerate(labels):
+        print(f"{label:>10} " + " ".join(f"{count:>8d}" for count in confusion[i]) + f" {100 * recall[i]:>7.1f}%")
+
+
+def time_per_frame(function, frames: np.ndarray) -> float:
+    """Thời gian trung bình mỗi frame (µs), tốt nhất trong 3 lần chạy"""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for frame in frames:
+            function(frame)
+        best = min(best, time.perf_counter() - start)
+    return best / len(frames) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the NumPy gesture classifier on recorded sessions")
+    parser.add_argument("sessions", nargs="+", help="label:session.npz, or session.npz with a per-frame 'labels' array")
+    parser.add_argument("--out", default=GESTURE_CLASSIFIER_MODEL, help="Output model (.npz)")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Tail fraction of each session kept for testing")
+    parser.add_argument("--hidden", type=int, default=32, help="Hidden units")
+    parser.add_argument("--epochs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Tách held-out theo từng phiên rồi gộp lại
+    splits = [split_holdout(*load_session(spec), args.holdout) for spec in args.sessions]
+    train_features = np.concatenate([split[0] for split in splits])
+    test_features = np.concatenate([split[2] for split in splits])
+    train_names = np.concatenate([split[1] for split in splits])
+    test_names = np.concatenate([split[3] for split in splits])
+
+    # "none" đứng đầu, các lớp khác trùng tên luật trong utils.gesture_rules ("pinch", "fist"...)
+    labels = sorted({str(name) for name in np.concatenate([train_names, test_names])}, key=lambda label: (label != NO_GESTURE, label))
+    train_targets = np.array([labels.index(name) for name in train_names])
+    test_targets = np.array([labels.index(name) for name in test_names])
+    print(f"🖐️  {len(train_targets)} train / {len(test_targets)} held-out frames, classes: {labels}")
+
+    train_inputs = train_features[:, CLASSIFIER_INPUTS].astype(np.float64)
+    mean = train_inputs.mean(axis=0)
+    std = train_inputs.std(axis=0) + 1e-6
+
+    start = time.perf_counter()
+    params = train_mlp((train_inputs - mean) / std, train_targets, len(labels), hidden=args.hidden,
+                       epochs=args.epochs, seed=args.seed)
+    print(f"⏱️  Trained in {time.perf_counter() - start:.1f}s")
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    save_model(args.out, params, mean.astype(np.float32), std.astype(np.float32), labels)
+    load_weights.cache_clear()
+    classifier = GestureClassifier.load(args.out)
+    print(f"💾 Saved {args.out}")
+
+    # Độ chính xác trên held-out: classifier và luật ngưỡng (từng frame, chưa qua cửa sổ ổn định)
+    rule_set = GestureRuleSet(build_rules())
+    report("Classifier (held-out)", classifier.predict_batch(test_features), test_targets, labels)
+    report("Rules (held-out)", rule_predictions(rule_set.match_batch(test_features), rule_set.names, labels),
+           test_targets, labels)
+
+    # Độ trễ suy luận từng frame như trong GestureRecognizer
+    frames = test_features[:2000] if len(test_features) else train_features[:2000]
+    print(f"\n{'classifier':>12}: {time_per_frame(classifier.predict, frames):6.1f} µs/frame")
+    print(f"{'rules':>12}: {time_per_frame(rule_set.match, frames):6.1f} µs/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Click Onset Module
+Phát hiện thời điểm bắt đầu nhíp (left click) từ khoảng cách và vận tốc khép của ngón trỏ - ngón cái,
+với ngưỡng nhấn/nhả tách biệt (hysteresis): click trong 1-2 frame thay vì chờ cửa sổ ổn định và bầu chọn
+"""
+
+from config.settings import (
+    CLICK_THRESHOLD, CLICK_RELEASE_RATIO, CLICK_ONSET_RATIO, CLICK_ONSET_SPEED, TRACKING_MAX_GAP
+)
+from utils.gesture_features import FEATURE_NAMES
+from utils.gesture_rules import INDEX_EXTENDED_MIN, THUMB_EXTENDED_MIN
+
+# Vị trí các đặc trưng dùng trong vector của GestureFeatureExtractor
+_PINCH = FEATURE_NAMES["pinch_distance"]
+_PINCH_NORM = FEATURE_NAMES["pinch_distance_norm"]
+_INDEX_PIP_TIP = FEATURE_NAMES["index_pip_tip"]
+_THUMB_IP_TIP = FEATURE_NAMES["thumb_ip_tip"]
+
+
+class PinchOnsetDetector:
+    """
+    Máy trạng thái nhấn/nhả của cử chỉ nhíp
+
+    Nhấn khi khoảng cách < press_threshold, hoặc sớm hơn khi khoảng cách < onset_threshold và hai ngón
+    đang khép nhanh (>= onset_speed kích thước lòng bàn tay / giây). Nhả khi khoảng cách > release_threshold.
+    Mỗi lần nhấn chỉ trả về True một lần, giữ nhíp không tạo thêm click.
+    """
+
+    def __init__(self, press_threshold: float = CLICK_THRESHOLD,
+                 release_ratio: float = CLICK_RELEASE_RATIO, onset_ratio: float = CLICK_ONSET_RATIO,
+                 onset_speed: float = CLICK_ONSET_SPEED, max_gap: float = TRACKING_MAX_GAP):
+        """
+        Args:
+            press_threshold: Khoảng cách pinch tối đa để nhấn (như CLICK_THRESHOLD)
+            release_ratio: Nhả khi khoảng cách > press_threshold x release_ratio
+            onset_ratio: Nhấn sớm khi khoảng cách < press_threshold x onset_ratio và đang khép nhanh
+            onset_speed: Tốc độ khép tối thiểu để nhấn sớm (kích thước lòng bàn tay / giây)
+            max_gap: Khoảng trống giữa hai frame lớn hơn thì không tính vận tốc (giây)
+        """
+        self.press_threshold = press_threshold
+        self.onset_threshold = press_threshold * max(onset_ratio, 1.0)
+        # Ngưỡng nhả không thấp hơn ngưỡng nhấn sớm, nếu không một lần nhấn sớm sẽ nhả ngay frame sau
+        self.release_threshold = max(press_threshold * release_ratio, self.onset_threshold)
+        self.onset_speed = onset_speed
+        self.max_gap = max_gap
+
+        self.pressed = False
+        self.closing_speed = 0.0
+        self.prev_distance = None
+        self.prev_time = 0.0
+
+    def update(self, features, timestamp: float) -> bool:
+        """
+        Cập nhật trạng thái với frame hiện tại
+
+        Args:
+            features: Vector đặc trưng (NUM_FEATURES,) của GestureFeatureExtractor
+            timestamp: Thời điểm của frame (giây)
+
+        Returns:
+            bool: True ở frame bắt đầu nhíp (cạnh nhấn)
+        """
+        distance = features.item(_PINCH)
+        normalized = features.item(_PINCH_NORM)
+
+        # Vận tốc khép (dương khi hai ngón tiến lại gần) theo kích thước lòng bàn tay / giây
+        elapsed = timestamp - self.prev_time
+        if self.prev_distance is not None and 0.0 < elapsed <= self.max_gap:
+            self.closing_speed = (self.prev_distance - normalized) / elapsed
+        else:
+            self.closing_speed = 0.0
+        self.prev_distance = normalized
+        self.prev_time = timestamp
+
+        if self.pressed:
+            if distance > self.release_threshold:
+                self.pressed = False
+            return False
+
+        # Cùng điều kiện hình dạng tay với luật pinch: cả hai ngón đều duỗi (tránh nhầm với nắm tay)
+        if features.item(_INDEX_PIP_TIP) <= INDEX_EXTENDED_MIN or features.item(_THUMB_IP_TIP) <= THUMB_EXTENDED_MIN:
+            return False
+
+        if distance < self.press_threshold or (
+                distance < self.onset_threshold and self.closing_speed >= self.onset_speed):
+            self.pressed = True
+        return self.pressed
+
+    def reset(self):
+        """Quay về trạng thái nhả (ví dụ khi mất tay)"""
+        self.pressed = False
+        self.closing_speed = 0.0
+        self.prev_distance = None
@@ -0,0 +1,60 @@
+"""
+Clock Module
+Nguồn thời gian dùng chung của pipeline gesture và chuột: mặc định đồng hồ đơn điệu (time.monotonic),
+không bị nhảy khi NTP chỉnh giờ hay máy ngủ; đồng hồ ảo để chạy lại phiên đã ghi nhanh hơn thời gian thực
+"""
+
+import time
+
+
+class Clock:
+    """Đồng hồ đơn điệu của hệ thống (giây, gốc tùy ý - chỉ dùng để tính khoảng thời gian)"""
+
+    def now(self) -> float:
+        """Thời điểm hiện tại (giây)"""
+        return time.monotonic()
+
+    def __call__(self) -> float:
+        return self.now()
+
+
+class VirtualClock(Clock):
+    """
+    Đồng hồ ảo do người gọi điều khiển: chạy lại phiên đã ghi theo timestamps của từng frame,
+    cooldown, double click và hover cho cùng quyết định như khi chạy trực tiếp mà không cần chờ
+    """
+
+    def __init__(self, start: float = 0.0):
+        """
+        Args:
+            start: Thời điểm ban đầu (giây)
+        """
+        self.time = float(start)
+
+    def now(self) -> float:
+        """Thời điểm hiện tại của đồng hồ ảo (giây)"""
+        return self.time
+
+    def set(self, timestamp: float) -> None:
+        """
+        Đặt thời điểm hiện tại (ví dụ timestamp của frame đang chạy lại)
+
+        Args:
+            timestamp: Thời điểm mới (giây), không nhỏ hơn thời điểm hiện tại
+        """
+        if timestamp < self.time:
+            raise ValueError(f"Đồng hồ ảo không được lùi ({timestamp:.3f} < {self.time:.3f})")
+        self.time = float(timestamp)
+
+    def advance(self, seconds: float) -> None:
+        """
+        Tiến đồng hồ thêm một khoảng thời gian
+
+        Args:
+            seconds: Số giây (>= 0)
+        """
+        self.set(self.time + seconds)
+
+
+# Đồng hồ mặc định của mọi thành phần khi không truyền clock
+SYSTEM_CLOCK = Clock()
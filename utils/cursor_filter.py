@@ -0,0 +1,247 @@
+"""
+Cursor Filter Module
+Bộ lọc vị trí con trỏ chuột có thể thay thế: EMA (cửa sổ trọng số + SMOOTHING_FACTOR như trước đây),
+One Euro và Kalman vận tốc không đổi. Mỗi lần cập nhật O(1) trên vài số thực, không tạo mảng
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+from config.settings import (
+    CURSOR_FILTER, SMOOTHING_FACTOR, CURSOR_SMOOTHING_WINDOW,
+    CURSOR_ONE_EURO_MIN_CUTOFF, CURSOR_ONE_EURO_BETA, CURSOR_ONE_EURO_D_CUTOFF,
+    CURSOR_KALMAN_PROCESS_NOISE, CURSOR_KALMAN_MEASUREMENT_NOISE, TRACKING_MAX_GAP
+)
+
+CURSOR_FILTERS = ("ema", "one_euro", "kalman")
+
+# Trọng số của frame cũ hơn một frame trong cửa sổ của bộ lọc EMA (như smoothing trước đây)
+EMA_WINDOW_DECAY = math.exp(-0.5)
+
+
+class CursorFilter(ABC):
+    """
+    Giao diện chung: lọc vị trí (x, y) normalized của landmark điều khiển con trỏ theo thời gian
+
+    Khoảng trống giữa hai frame lớn hơn max_gap (mất tay) thì bắt đầu lại từ vị trí đo.
+    """
+
+    def __init__(self, max_gap: float = TRACKING_MAX_GAP):
+        """
+        Args:
+            max_gap: Khoảng trống giữa hai frame lớn hơn thì bắt đầu lại (giây)
+        """
+        self.max_gap = max_gap
+        self.last_time: Optional[float] = None
+
+    def apply(self, x: float, y: float, timestamp: float) -> Tuple[float, float]:
+        """
+        Lọc vị trí của frame hiện tại
+
+        Args:
+            x: Tọa độ x normalized đo được
+            y: Tọa độ y normalized đo được
+            timestamp: Thời điểm capture của frame (giây)
+
+        Returns:
+            Tuple[float, float]: Vị trí đã lọc (normalized)
+        """
+        elapsed = 0.0 if self.last_time is None else timestamp - self.last_time
+        self.last_time = timestamp
+        if not 0.0 < elapsed <= self.max_gap:
+            return self._start(x, y)
+        return self._step(x, y, elapsed)
+
+    def reset(self):
+        """Bắt đầu lại ở frame tiếp theo (ví dụ khi đổi tay điều khiển)"""
+        self.last_time = None
+
+    @abstractmethod
+    def _start(self, x: float, y: float) -> Tuple[float, float]:
+        """Khởi tạo trạng thái từ vị trí đo đầu tiên"""
+
+    @abstractmethod
+    def _step(self, x: float, y: float, elapsed: float) -> Tuple[float, float]:
+        """Cập nhật trạng thái với vị trí đo mới sau elapsed giây"""
+
+
+class EmaCursorFilter(CursorFilter):
+    """
+    Smoothing cũ của MouseController tính tăng dần: trung bình trọng số e^(-0.5 k) của window frame
+    gần nhất, rồi làm mượt hàm mũ với SMOOTHING_FACTOR. Theo frame, không phụ thuộc khoảng thời gian.
+
+    Tổng trọng số cập nhật bằng S_t = d S_(t-1) + x_t - d^W x_(t-W) trên ring buffer W vị trí,
+    nên mỗi frame O(1) thay vì tính lại cả cửa sổ.
+    """
+
+    def __init__(self, smoothing: float = SMOOTHING_FACTOR, window: int = CURSOR_SMOOTHING_WINDOW,
+                 max_gap: float = TRACKING_MAX_GAP):
+        """
+        Args:
+            smoothing: Phần giữ lại của vị trí trước (0.0 - 1.0, càng cao càng mượt)
+            window: Số frame của trung bình trọng số
+            max_gap: Khoảng trống giữa hai frame lớn hơn thì bắt đầu lại (giây)
+        """
+        super().__init__(max_gap)
+        self.alpha = 1.0 - smoothing
+        self.window = max(1, window)
+
+        # Trọng số tính sẵn: d^W và tổng trọng số khi cửa sổ mới có n frame
+        self.tail_weight = EMA_WINDOW_DECAY ** self.window
+        self.norms = [(1.0 - EMA_WINDOW_DECAY ** n) / (1.0 - EMA_WINDOW_DECAY) for n in range(self.window + 1)]
+
+        self.ring_x = [0.0] * self.window
+        self.ring_y = [0.0] * self.window
+        self.head = 0
+        self.count = 0
+        self.sum_x = self.sum_y = 0.0
+        self.x = self.y = 0.0
+
+    def _start(self, x: float, y: float) -> Tuple[float, float]:
+        self.count = 0
+        self.sum_x = self.sum_y = 0.0
+        self._push(x, y)
+        self.x, self.y = x, y
+        return x, y
+
+    def _step(self, x: float, y: float, elapsed: float) -> Tuple[float, float]:
+        average_x, average_y = self._push(x, y)
+        self.x += (average_x - self.x) * self.alpha
+        self.y += (average_y - self.y) * self.alpha
+        return self.x, self.y
+
+    def _push(self, x: float, y: float) -> Tuple[float, float]:
+        """Thêm vị trí vào cửa sổ, trả về trung bình trọng số"""
+        decay = EMA_WINDOW_DECAY
+        self.sum_x = decay * self.sum_x + x
+        self.sum_y = decay * self.sum_y + y
+        if self.count == self.window:
+            # Vị trí cũ nhất rời khỏi cửa sổ
+            self.sum_x -= self.tail_weight * self.ring_x[self.head]
+            self.sum_y -= self.tail_weight * self.ring_y[self.head]
+        else:
+            self.count += 1
+        self.ring_x[self.head] = x
+        self.ring_y[self.head] = y
+        self.head = (self.head + 1) % self.window
+        norm = self.norms[self.count]
+        return self.sum_x / norm, self.sum_y / norm
+
+
+class OneEuroCursorFilter(CursorFilter):
+    """
+    One Euro filter (Casiez et al., 2012) trên vị trí con trỏ: tần số cắt f_c = min_cutoff + beta * |v|
+    với |v| là tốc độ 2D đã lọc, chung cho hai trục để con trỏ không lệch hướng khi di chuyển chéo
+    """
+
+    def __init__(self, min_cutoff: float = CURSOR_ONE_EURO_MIN_CUTOFF, beta: float = CURSOR_ONE_EURO_BETA,
+                 d_cutoff: float = CURSOR_ONE_EURO_D_CUTOFF, max_gap: float = TRACKING_MAX_GAP):
+        """
+        Args:
+            min_cutoff: Tần số cắt khi đứng yên (Hz), nhỏ hơn = ít rung hơn
+            beta: Hệ số tăng tần số cắt theo tốc độ (1 / đơn vị normalized), lớn hơn = ít trễ hơn khi nhanh
+            d_cutoff: Tần số cắt của vận tốc (Hz)
+            max_gap: Khoảng trống giữa hai frame lớn hơn thì bắt đầu lại (giây)
+        """
+        super().__init__(max_gap)
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.x = self.y = 0.0
+        self.dx = self.dy = 0.0
+
+    def _start(self, x: float, y: float) -> Tuple[float, float]:
+        self.x, self.y = x, y
+        self.dx = self.dy = 0.0
+        return x, y
+
+    def _step(self, x: float, y: float, elapsed: float) -> Tuple[float, float]:
+        # Vận tốc thô so với vị trí đã lọc, lọc thông thấp ở d_cutoff
+        r = 2.0 * math.pi * self.d_cutoff * elapsed
+        alpha = r / (r + 1.0)
+        self.dx += ((x - self.x) / elapsed - self.dx) * alpha
+        self.dy += ((y - self.y) / elapsed - self.dy) * alpha
+
+        r = 2.0 * math.pi * (self.min_cutoff + self.beta * math.hypot(self.dx, self.dy)) * elapsed
+        alpha = r / (r + 1.0)
+        self.x += (x - self.x) * alpha
+        self.y += (y - self.y) * alpha
+        return self.x, self.y
+
+
+class KalmanCursorFilter(CursorFilter):
+    """
+    Kalman vận tốc không đổi cho từng trục, nhiễu quá trình là gia tốc trắng (mật độ phổ q)
+
+    Hai trục có cùng khoảng thời gian và cùng nhiễu nên dùng chung ma trận hiệp phương sai 2x2
+    (3 số thực) và cùng hệ số Kalman; mỗi frame chỉ vài phép nhân.
+    """
+
+    def __init__(self, process_noise: float = CURSOR_KALMAN_PROCESS_NOISE,
+                 measurement_noise: float = CURSOR_KALMAN_MEASUREMENT_NOISE,
+                 initial_velocity: float = 1.0, max_gap: float = TRACKING_MAX_GAP):
+        """
+        Args:
+            process_noise: Mật độ phổ gia tốc q (normalized^2 / s^3), lớn hơn = bám nhanh hơn, rung hơn
+            measurement_noise: Độ lệch chuẩn nhiễu đo của vị trí (normalized)
+            initial_velocity: Độ lệch chuẩn vận tốc ban đầu (normalized / giây)
+            max_gap: Khoảng trống giữa hai frame lớn hơn thì bắt đầu lại (giây)
+        """
+        super().__init__(max_gap)
+        self.q = process_noise
+        self.r = measurement_noise * measurement_noise
+        self.initial_variance = initial_velocity * initial_velocity
+        self.x = self.y = 0.0
+        self.vx = self.vy = 0.0
+        self.p00 = self.p01 = self.p11 = 0.0
+
+    def _start(self, x: float, y: float) -> Tuple[float, float]:
+        self.x, self.y = x, y
+        self.vx = self.vy = 0.0
+        self.p00, self.p01, self.p11 = self.r, 0.0, self.initial_variance
+        return x, y
+
+    def _step(self, x: float, y: float, elapsed: float) -> Tuple[float, float]:
+        # Dự đoán: P = F P F^T + Q với F = [[1, dt], [0, 1]], Q = q [[dt^3/3, dt^2/2], [dt^2/2, dt]]
+        dt = elapsed
+        q = self.q
+        p00 = self.p00 + dt * (2.0 * self.p01 + dt * self.p11) + q * dt * dt * dt / 3.0
+        p01 = self.p01 + dt * self.p11 + q * dt * dt / 2.0
+        p11 = self.p11 + q * dt
+        predicted_x = self.x + self.vx * dt
+        predicted_y = self.y + self.vy * dt
+
+        # Cập nhật với vị trí đo (H = [1, 0])
+        innovation = p00 + self.r
+        gain_position = p00 / innovation
+        gain_velocity = p01 / innovation
+        error_x = x - predicted_x
+        error_y = y - predicted_y
+        self.x = predicted_x + gain_position * error_x
+        self.y = predicted_y + gain_position * error_y
+        self.vx += gain_velocity * error_x
+        self.vy += gain_velocity * error_y
+
+        self.p00 = (1.0 - gain_position) * p00
+        self.p01 = (1.0 - gain_position) * p01
+        self.p11 = p11 - gain_velocity * p01
+        return self.x, self.y
+
+
+def create_cursor_filter(name: str = CURSOR_FILTER) -> CursorFilter:
+    """
+    Tạo bộ lọc con trỏ theo tên với tham số trong config
+
+    Args:
+        name: "ema", "one_euro" hoặc "kalman"
+
+    Returns:
+        CursorFilter: Bộ lọc
+    """
+    if name == "one_euro":
+        return OneEuroCursorFilter()
+    if name == "kalman":
+        return KalmanCursorFilter()
+    if name != "ema":
+        raise ValueError(f"Unknown cursor filter: {name} (expected one of {CURSOR_FILTERS})")
+    return EmaCursorFilter()
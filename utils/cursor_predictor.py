@@ -0,0 +1,120 @@
+"""
+Cursor Predictor Module
+Bù độ trễ của con trỏ: ngoại suy vị trí đầu ngón trỏ (đã lọc) về phía trước đúng bằng độ trễ đầu-cuối
+của pipeline đo từ timestamp capture của frame, giảm dần phần ngoại suy khi tay dừng hoặc đổi hướng đột ngột
+"""
+
+import math
+from typing import Optional, Tuple
+from config.settings import (
+    CURSOR_PREDICTION_EXTRA_LATENCY, CURSOR_PREDICTION_MAX_HORIZON, CURSOR_PREDICTION_MIN_SPEED,
+    CURSOR_PREDICTION_VELOCITY_TIME, TRACKING_MAX_GAP
+)
+
+# Trọng số của mẫu độ trễ mới trong trung bình trượt độ trễ pipeline
+LATENCY_SMOOTHING = 0.1
+
+
+class CursorPredictor:
+    """
+    Dự đoán vị trí con trỏ tại thời điểm nó hiện trên màn hình
+
+    Độ trễ = (thời điểm đưa ra chuột - thời điểm capture của frame), làm mượt, cộng phần không đo được
+    (phơi sáng/truyền của camera, màn hình). Vận tốc là trung bình hàm mũ của vận tốc tức thời đo được.
+    Giảm chấn khi dừng đột ngột: phần ngoại suy nhân với tỉ lệ vận tốc tức thời trên hướng vận tốc trung bình
+    (0 khi dừng hoặc quay đầu), khi đang giảm tốc chỉ ngoại suy tới điểm dừng dự kiến, và tắt dần dưới
+    tốc độ tối thiểu để không khuếch đại rung.
+    """
+
+    def __init__(self, extra_latency: float = CURSOR_PREDICTION_EXTRA_LATENCY,
+                 max_horizon: float = CURSOR_PREDICTION_MAX_HORIZON,
+                 min_speed: float = CURSOR_PREDICTION_MIN_SPEED,
+                 velocity_time: float = CURSOR_PREDICTION_VELOCITY_TIME, max_gap: float = TRACKING_MAX_GAP):
+        """
+        Args:
+            extra_latency: Độ trễ không thấy được qua timestamp: trước khi frame được đọc và sau khi
+                           con trỏ được đặt (giây, tùy camera và màn hình)
+            max_horizon: Khoảng ngoại suy tối đa (giây)
+            min_speed: Dưới tốc độ này không ngoại suy, gấp đôi thì ngoại suy đầy đủ (normalized / giây)
+            velocity_time: Hằng số thời gian làm mượt vận tốc (giây)
+            max_gap: Khoảng trống giữa hai frame lớn hơn thì bắt đầu lại (giây)
+        """
+        self.extra_latency = extra_latency
+        self.max_horizon = max_horizon
+        self.min_speed = min_speed
+        self.velocity_time = velocity_time
+        self.max_gap = max_gap
+
+        self.latency: Optional[float] = None
+        self.last_time: Optional[float] = None
+        self.x = self.y = 0.0
+        self.vx = self.vy = 0.0
+        self.horizon = 0.0
+
+    def apply(self, x: float, y: float, measured_x: float, measured_y: float,
+              timestamp: float, now: float) -> Tuple[float, float]:
+        """
+        Ngoại suy vị trí của frame hiện tại
+
+        Vận tốc lấy từ vị trí đo (trước bộ lọc con trỏ): sau khi tay dừng, vị trí đã lọc vẫn còn
+        đang đuổi theo và sẽ bị ngoại suy vượt quá điểm dừng nếu dùng vận tốc của nó.
+
+        Args:
+            x: Tọa độ x normalized sau bộ lọc con trỏ (vị trí được ngoại suy)
+            y: Tọa độ y normalized sau bộ lọc con trỏ
+            measured_x: Tọa độ x normalized đưa vào bộ lọc con trỏ
+            measured_y: Tọa độ y normalized đưa vào bộ lọc con trỏ
+            timestamp: Thời điểm capture của frame (giây)
+            now: Thời điểm hiện tại, ngay trước khi đặt con trỏ (giây, cùng đồng hồ với timestamp)
+
+        Returns:
+            Tuple[float, float]: Vị trí dự đoán (normalized)
+        """
+        # Độ trễ pipeline đo được (capture -> đặt con trỏ), làm mượt theo thời gian
+        latency = max(now - timestamp, 0.0)
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += (latency - self.latency) * LATENCY_SMOOTHING
+        self.horizon = min(self.latency + self.extra_latency, self.max_horizon)
+
+        elapsed = 0.0 if self.last_time is None else timestamp - self.last_time
+        self.last_time = timestamp
+        if not 0.0 < elapsed <= self.max_gap:
+            # Frame đầu tiên hoặc mất tay quá lâu: chưa có vận tốc
+            self.x, self.y = measured_x, measured_y
+            self.vx = self.vy = 0.0
+            return x, y
+
+        velocity_x = (measured_x - self.x) / elapsed
+        velocity_y = (measured_y - self.y) / elapsed
+        self.x, self.y = measured_x, measured_y
+        alpha = 1.0 - math.exp(-elapsed / self.velocity_time)
+        acceleration_x = (velocity_x - self.vx) * alpha
+        acceleration_y = (velocity_y - self.vy) * alpha
+        self.vx += acceleration_x
+        self.vy += acceleration_y
+
+        speed_squared = self.vx * self.vx + self.vy * self.vy
+        speed = math.sqrt(speed_squared)
+        if speed <= self.min_speed:
+            return x, y
+
+        # Giảm chấn: phần vận tốc tức thời cùng hướng vận tốc trung bình (0 khi dừng hoặc quay đầu),
+        # và tăng dần từ min_speed tới 2 x min_speed
+        damping = min(max((velocity_x * self.vx + velocity_y * self.vy) / speed_squared, 0.0), 1.0)
+        damping *= min((speed - self.min_speed) / max(self.min_speed, 1e-9), 1.0)
+
+        # Đang giảm tốc: quãng đường tới khi dừng hẳn với gia tốc hiện tại, không ngoại suy qua điểm dừng
+        horizon = self.horizon
+        deceleration = -(acceleration_x * self.vx + acceleration_y * self.vy) / (speed * elapsed)
+        if deceleration > 0.0:
+            horizon = min(horizon, speed / deceleration)
+            lead = (horizon - deceleration * horizon * horizon / (2.0 * speed)) * damping
+        else:
+            lead = horizon * damping
+        return x + self.vx * lead, y + self.vy * lead
+
+    def reset(self):
+        """Bắt đầu lại ở frame tiếp theo (giữ độ trễ đã đo)"""
+        self.last_time = None
@@ -0,0 +1,229 @@
+"""
+Dynamic Gestures Module
+Nhận diện gesture động (vuốt, vẽ vòng tròn) bằng subsequence DTW tăng dần trên quỹ đạo đầu ngón trỏ,
+đọc trực tiếp từ lịch sử landmarks dùng chung (utils.landmark_history)
+
+Mỗi frame chỉ cập nhật một cột DTW cho mọi template (O(tổng độ dài template)), không tính lại
+toàn bộ cửa sổ. Các template được ghép thành một mảng, cả cột được tính bằng vài phép NumPy.
+"""
+
+import math
+import logging
+import numpy as np
+from typing import Dict, List, Optional
+from config.settings import (
+    DYNAMIC_MATCH_THRESHOLD, DYNAMIC_MIN_SPEED, DYNAMIC_WARP_PENALTY, DYNAMIC_COOLDOWN, DYNAMIC_MAX_GAP
+)
+from utils.landmark_history import LandmarkHistory
+
+# Số mẫu lùi lại khi ước lượng vận tốc (làm mượt rung của landmarks)
+VELOCITY_SPAN = 2
+
+# Landmark dùng cho quỹ đạo (đầu ngón trỏ) và kích thước lòng bàn tay (cổ tay -> MCP ngón giữa)
+POINTER_LANDMARK = 8
+PALM_LANDMARKS = (0, 9)
+
+# Vuốt thẳng dùng ngưỡng chặt hơn để một đoạn cung của vòng tròn không bị nhận nhầm là vuốt
+SWIPE_THRESHOLD = 0.2
+
+
+class GestureTemplate:
+    """Template của một gesture động: chuỗi hướng di chuyển (vector đơn vị) trong tọa độ ảnh"""
+
+    def __init__(self, name: str, directions: np.ndarray, threshold: float = DYNAMIC_MATCH_THRESHOLD):
+        """
+        Args:
+            name: Tên gesture trả về khi khớp (nhiều template có thể cùng tên)
+            directions: Mảng (m, 2) hướng di chuyển theo thời gian (x sang phải, y xuống dưới)
+            threshold: Khoảng cách DTW trung bình mỗi mẫu tối đa
+        """
+        self.name = name
+        self.directions = np.asarray(directions, dtype=np.float32)
+        self.threshold = threshold
+
+
+def swipe_template(name: str, angle: float, length: int = 8,
+                   threshold: float = SWIPE_THRESHOLD) -> GestureTemplate:
+    """
+    Template vuốt thẳng
+
+    Args:
+        name: Tên gesture
+        angle: Hướng vuốt (độ, 0 = sang phải, 90 = xuống dưới trong tọa độ ảnh)
+        length: Số mẫu của template
+        threshold: Ngưỡng khớp
+
+    Returns:
+        GestureTemplate: Template
+    """
+    direction = np.array([np.cos(np.radians(angle)), np.sin(np.radians(angle))])
+    return GestureTemplate(name, np.tile(direction, (length, 1)), threshold)
+
+
+def circle_templates(name: str, clockwise: bool, length: int = 18, turn: float = 0.75,
+                     threshold: float = DYNAMIC_MATCH_THRESHOLD) -> List[GestureTemplate]:
+    """
+    Template vẽ vòng tròn, bắt đầu ở 4 hướng khác nhau để vòng tròn bắt đầu ở đâu cũng khớp
+
+    Args:
+        name: Tên gesture
+        clockwise: Chiều kim đồng hồ trên ảnh
+        length: Số mẫu mỗi template
+        turn: Phần vòng tròn mỗi template bao phủ (0.75 = 270 độ)
+        threshold: Ngưỡng khớp
+
+    Returns:
+        List[GestureTemplate]: Các template cùng tên
+    """
+    sign = 1.0 if clockwise else -1.0  # Trục y hướng xuống nên góc tăng là chiều kim đồng hồ
+    templates = []
+    for start in np.arange(4) * np.pi / 2:
+        angles = start + sign * np.linspace(0.0, 2 * np.pi * turn, length)
+        templates.append(GestureTemplate(name, np.stack([np.cos(angles), np.sin(angles)], axis=1), threshold))
+    return templates
+
+
+# Template mặc định: vuốt 4 hướng và vẽ vòng tròn 2 chiều
+DEFAULT_TEMPLATES = [
+    swipe_template("swipe_right", 0),
+    swipe_template("swipe_down", 90),
+    swipe_template("swipe_left", 180),
+    swipe_template("swipe_up", 270),
+] + circle_templates("circle_cw", True) + circle_templates("circle_ccw", False)
+
+
+class DynamicGestureEngine:
+    """
+    Subsequence DTW tăng dần (kiểu SPRING) trên hướng di chuyển của đầu ngón trỏ
+
+    Với template y[1..m] và mẫu x_t, cột DTW D(t, i) = c_i + min(D(t, i-1) + p, D(t-1, i), D(t-1, i-1)),
+    D(t, 0) = 0 (khớp có thể bắt đầu ở bất kỳ frame nào), p là chi phí thêm của bước chỉ tiến trên template.
+    Phần phụ thuộc D(t, i-1) trong cùng cột được khử bằng tổng tích lũy P_i = sum_{j<=i}(c_j + p):
+    D(t, i) = P_i + min_{k<=i}(a_k - P_k + c_k) với a_k = min(D(t-1, k), D(t-1, k-1)),
+    nên cả cột là một lần cumsum và một lần minimum.accumulate.
+    """
+
+    def __init__(self, templates: Optional[List[GestureTemplate]] = None, min_speed: float = DYNAMIC_MIN_SPEED,
+                 warp_penalty: float = DYNAMIC_WARP_PENALTY, cooldown: float = DYNAMIC_COOLDOWN,
+                 max_gap: float = DYNAMIC_MAX_GAP):
+        """
+        Args:
+            templates: Các template (mặc định DEFAULT_TEMPLATES)
+            min_speed: Tốc độ (lòng bàn tay / giây) từ đó hướng di chuyển có độ lớn 1
+            warp_penalty: Chi phí thêm cho mỗi bước chỉ tiến trên template (một frame không khớp cả template)
+            cooldown: Thời gian chờ sau mỗi lần nhận gesture (giây)
+            max_gap: Khoảng trống giữa hai mẫu lớn hơn thì bắt đầu lại (giây)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.templates = templates or DEFAULT_TEMPLATES
+        self.min_speed = min_speed
+        self.cooldown = cooldown
+        self.max_gap = max_gap
+
+        # Mọi template ghép nối thành một mảng số phức x + iy; starts/ends là vị trí đầu/cuối từng template
+        lengths = np.array([len(template.directions) for template in self.templates], dtype=np.intp)
+        self.ends = np.cumsum(lengths) - 1
+        self.starts = self.ends - lengths + 1
+        self.lengths = lengths.astype(np.float32)
+        self.thresholds = [template.threshold for template in self.templates]
+        points = np.concatenate([template.directions for template in self.templates])
+        self._template = (points[:, 0] + 1j * points[:, 1]).astype(np.complex64)
+
+        # P_i = C_i + ramp_i: chi phí bước dọc cộng dồn theo vị trí (tăng dần nên không rò giữa các template)
+        size = len(points)
+        self._ramp = (warp_penalty * np.arange(1, size + 1)).astype(np.float32)
+
+        # Trạng thái DTW: cột trước đó và các buffer dùng lại mỗi frame
+        self._column = np.full(size, np.inf, dtype=np.float32)
+        self._delta = np.zeros(size, dtype=np.complex64)
+        self._costs = np.zeros(size, dtype=np.float32)
+        self._cumulative = np.zeros(size, dtype=np.float32)
+        self._shifted = np.zeros(size, dtype=np.float32)
+        self.scores = np.full(len(self.templates), np.inf, dtype=np.float32)
+        self._end_values = np.zeros(len(self.templates), dtype=np.float32)
+        self.last_trigger_time = float('-inf')
+
+    def update(self, history: LandmarkHistory) -> Optional[str]:
+        """
+        Cập nhật DTW với frame mới nhất trong lịch sử landmarks
+
+        Args:
+            history: Lịch sử landmarks của tay (frame hiện tại đã được ghi)
+
+        Returns:
+            Optional[str]: Tên gesture động vừa hoàn thành hoặc None
+        """
+        if len(history) <= 1:
+            return None
+
+        # Đọc trực tiếp từ view của lịch sử: đầu ngón trỏ và thời điểm của VELOCITY_SPAN + 1 frame gần nhất
+        span = min(VELOCITY_SPAN, len(history) - 1)
+        times = history.times(span + 1)
+        timestamp = times.item(-1)
+        if timestamp - times.item(-2) > self.max_gap:
+            # Mất tay quá lâu: quỹ đạo cũ không còn liên quan
+            self._column.fill(np.inf)
+            return None
+
+        window = history.window(span + 1)
+        old_x, old_y = window[0, POINTER_LANDMARK, :2].tolist()
+        x, y = window[-1, POINTER_LANDMARK, :2].tolist()
+        wrist_x, wrist_y, middle_x, middle_y = window[-1, PALM_LANDMARKS, :2].ravel().tolist()
+
+        # Vận tốc (lòng bàn tay / giây) trên span mẫu gần nhất, nén về độ lớn <= 1
+        scale = max(math.hypot(middle_x - wrist_x, middle_y - wrist_y), 1e-6)
+        speed_scale = scale * max(timestamp - times.item(0), 1e-6)
+        vx = (x - old_x) / speed_scale
+        vy = (y - old_y) / speed_scale
+        norm = max(math.hypot(vx, vy), self.min_speed)
+
+        self._update_column(complex(vx / norm, vy / norm))
+
+        # Template khớp khi khoảng cách trung bình mỗi mẫu dưới ngưỡng, chọn template khớp nhất
+        np.take(self._column, self.ends, out=self._end_values)
+        np.divide(self._end_values, self.lengths, out=self.scores)
+        best = int(self.scores.argmin())
+        score = self.scores.item(best)
+        if score >= self.thresholds[best] or timestamp - self.last_trigger_time < self.cooldown:
+            return None
+
+        # Bắt đầu lại mọi template để cùng một chuyển động không bị nhận lần nữa
+        self.last_trigger_time = timestamp
+        self._column.fill(np.inf)
+        name = self.templates[best].name
+        self.logger.debug(f"Dynamic gesture {name} (DTW {score:.3f})")
+        return name
+
+    def _update_column(self, sample: complex):
+        """Tính cột DTW của mẫu (dạng số phức x + iy) từ cột trước đó, tại chỗ"""
+        costs, cumulative, shifted, column = self._costs, self._cumulative, self._shifted, self._column
+
+        # c_i: khoảng cách từ mẫu hiện tại tới từng điểm template; P_i = C_i + p * i
+        np.subtract(self._template, sample, out=self._delta)
+        np.abs(self._delta, out=costs)
+        np.cumsum(costs, out=cumulative)
+        cumulative += self._ramp
+
+        # a_k = min(D(t-1, k), D(t-1, k-1)), với D(t-1, 0) = 0 ở đầu mỗi template
+        shifted[1:] = column[:-1]
+        shifted[self.starts] = 0.0
+        np.minimum(column, shifted, out=shifted)
+
+        # D(t, i) = P_i + min_{k<=i}(a_k - P_k + c_k); P tăng dần nên giá trị của template trước
+        # không bao giờ nhỏ hơn phần tử đầu của template sau, không cần tách theo template
+        shifted -= cumulative
+        shifted += costs
+        np.minimum.accumulate(shifted, out=shifted)
+        np.add(cumulative, shifted, out=column)
+
+    def get_scores(self) -> Dict[str, float]:
+        """Khoảng cách DTW trung bình mỗi mẫu tốt nhất hiện tại của từng gesture (để hiển thị/debug)"""
+        scores = {}
+        for template, score in zip(self.templates, self.scores.tolist()):
+            scores[template.name] = min(score, scores.get(template.name, float('inf')))
+        return scores
+
+    def reset(self):
+        """Xóa trạng thái DTW (ví dụ khi mất tay)"""
+        self._column.fill(np.inf)
+        self.scores.fill(np.inf)
@@ -3,172 +3,247 @@ Gesture Recognition Module
 Module nhận diện các cử chỉ tay để điều khiển chuột với tính năng nâng cao
 """
 
-import time
 import logging
 import numpy as np
 from typing import List, Tuple, Optional, Dict
 from config.settings import (
-    CLICK_THRESHOLD, FIST_THRESHOLD, CLICK_COOLDOWN, 
-    DOUBLE_CLICK_TIME, HOVER_TIME, PINCH_STABILITY_FRAMES
+    CLICK_THRESHOLD, CLICK_COOLDOWN,
+    DOUBLE_CLICK_TIME, HOVER_TIME, GESTURE_VOTE_WINDOW,
+    GESTURE_CLASSIFIER_MODE, GESTURE_CLASSIFIER_MODEL, DYNAMIC_GESTURES, CLICK_MODE
 )
+from utils.vote_buffer import VoteBuffer
+from utils.gesture_features import Landmarks, GestureFeatureExtractor, F_POINTER
+from utils.gesture_rules import GestureRule, GestureRuleSet, build_rules
+from utils.gesture_classifier import GestureClassifier, NO_GESTURE
+from utils.dynamic_gestures import DynamicGestureEngine
+from utils.click_onset import PinchOnsetDetector
+from utils.landmark_history import LandmarkHistory
+from utils.clock import Clock, SYSTEM_CLOCK
+
+# Bán kính (tọa độ normalized) của hover và double click
+HOVER_RADIUS = 0.03
+DOUBLE_CLICK_RADIUS = 0.05
 
 class GestureRecognizer:
     """Class nhận diện các cử chỉ tay với tính năng nâng cao"""
     
-    def __init__(self):
+    def __init__(self, stability: Optional[Dict[str, Dict[str, int]]] = None,
+                 vote_window: Optional[int] = None, click_threshold: Optional[float] = None,
+                 click_cooldown: Optional[float] = None, rules: Optional[List[GestureRule]] = None,
+                 classifier_mode: Optional[str] = None, classifier: Optional[GestureClassifier] = None,
+                 dynamic_gestures: Optional[bool] = None, history: Optional[LandmarkHistory] = None,
+                 click_mode: Optional[str] = None, clock: Optional[Clock] = None):
+        """
+        Args:
+            stability: Cửa sổ và số phiếu tối thiểu của từng detector (mặc định GESTURE_STABILITY)
+            vote_window: Số frame bầu chọn gesture đầu ra (mặc định GESTURE_VOTE_WINDOW)
+            click_threshold: Khoảng cách pinch tối đa (mặc định CLICK_THRESHOLD)
+            click_cooldown: Thời gian chờ giữa hai lần click (mặc định CLICK_COOLDOWN)
+            rules: Danh sách luật gesture (mặc định build_rules() với các tham số trên)
+            classifier_mode: "rules", "classifier" hoặc "shadow" (mặc định GESTURE_CLASSIFIER_MODE)
+            classifier: Classifier đã nạp (mặc định đọc GESTURE_CLASSIFIER_MODEL khi cần)
+            dynamic_gestures: Bật nhận diện gesture động (mặc định DYNAMIC_GESTURES)
+            history: Lịch sử landmarks dùng chung do pipeline ghi mỗi frame trước process_gesture();
+                     mặc định tự tạo lịch sử riêng và ghi trong process_gesture()
+            click_mode: "vote" hoặc "onset" (mặc định CLICK_MODE)
+            clock: Nguồn thời gian khi frame không kèm timestamp (mặc định đồng hồ đơn điệu của hệ thống,
+                   VirtualClock khi chạy lại phiên đã ghi)
+        """
         self.logger = logging.getLogger(__name__)
+        self.clock = clock or SYSTEM_CLOCK
+        
+        # Lịch sử landmarks: nguồn dữ liệu theo thời gian cho gesture động, hover và double click
+        self.owns_history = history is None
+        self.history = LandmarkHistory() if history is None else history
+        
+        self.click_threshold = CLICK_THRESHOLD if click_threshold is None else click_threshold
+        self.click_cooldown = CLICK_COOLDOWN if click_cooldown is None else click_cooldown
+        
+        # Bộ luật đã biên dịch: mọi gesture được kiểm tra trong một lần đánh giá vector hóa
+        if rules is None:
+            rules = build_rules(self.click_threshold, self.click_cooldown, stability)
+        self.rules = GestureRuleSet(rules)
+        self.labels = self.rules.labels
         
-        # Thời gian của lần click cuối cùng
-        self.last_left_click_time = 0
-        self.last_right_click_time = 0
+        # Classifier học từ dữ liệu: thay kết quả của các luật cùng tên, hoặc chạy song song để so sánh
+        self.classifier_mode = classifier_mode or GESTURE_CLASSIFIER_MODE
+        self.classifier = classifier if self.classifier_mode != "rules" else None
+        if self.classifier_mode != "rules" and self.classifier is None:
+            self.classifier = self._load_classifier(GESTURE_CLASSIFIER_MODEL)
+        if self.classifier is None:
+            self.classifier_mode = "rules"
+        else:
+            # Cặp (vị trí luật, lớp tương ứng) cho các luật mà classifier biết
+            self.classifier_rules = [
+                (r, self.classifier.labels.index(name)) for r, name in enumerate(self.rules.names)
+                if name in self.classifier.labels
+            ]
+            labels = self.classifier.labels
+            self.classifier_fallback = labels.index(NO_GESTURE) if NO_GESTURE in labels else -1
+        self.classifier_agreement = {'frames': 0, 'agree': 0}
+        
+        # Gesture động (vuốt, vòng tròn): DTW tăng dần trên quỹ đạo đầu ngón trỏ
+        if dynamic_gestures is None:
+            dynamic_gestures = DYNAMIC_GESTURES
+        self.dynamic_engine = DynamicGestureEngine() if dynamic_gestures else None
+        
+        # Chế độ click onset: bộ phát hiện cạnh nhấn thay cho luật "pinch" (không qua cửa sổ ổn định và bầu chọn)
+        self.click_mode = click_mode or CLICK_MODE
+        self.click_onset = None
+        if self.click_mode == "onset" and "pinch" in self.rules.names:
+            self.click_onset = PinchOnsetDetector(self.click_threshold)
+            self.onset_rule = self.rules.names.index("pinch")
+        
+        # Thời gian kích hoạt cuối cùng của từng gesture (cooldown)
+        self.last_trigger_times = {gesture: float('-inf') for gesture in self.labels[1:]}
         self.click_count = 0
-        self.last_click_position = None
+        self.last_click_frame = None  # Frame (history.frame_count) của left click cuối cùng
         
-        # Trạng thái gesture hiện tại
+        # Trạng thái gesture hiện tại và trạng thái ổn định của từng luật ở frame gần nhất
         self.current_gesture = "moving"
+        self.stable: List[bool] = []
         
-        # Buffer để lưu trữ lịch sử gesture
-        self.gesture_buffer = []
-        self.buffer_size = 5
+        # Ring buffer bầu chọn gesture đầu ra, giữ số đếm chạy nên mỗi frame là O(1)
+        self.gesture_votes = VoteBuffer(vote_window or GESTURE_VOTE_WINDOW, len(self.labels))
         
-        # Pinch detection stability
-        self.pinch_buffer = []
-        self.pinch_buffer_size = PINCH_STABILITY_FRAMES
-          # Hover detection
-        self.hover_start_time = 0
-        self.hover_position = None
+        # Hover detection (tính từ lịch sử landmarks)
         self.is_hovering = False
         
         # Gesture stability
         self.gesture_stability_count = 0
         self.stable_gesture_threshold = 3
+        
+        # Vector đặc trưng của frame hiện tại, dùng chung cho mọi luật
+        self.feature_extractor = GestureFeatureExtractor()
+        self.features = self.feature_extractor.features
     
-    def detect_pinch_gesture(self, landmarks: List[Tuple[float, float]]) -> bool:
+    def _load_classifier(self, path: str) -> Optional[GestureClassifier]:
         """
-        Phát hiện cử chỉ nhíp (ngón trỏ và ngón cái chạm nhau) với độ chính xác cao
+        Nạp classifier từ file model, quay về dùng luật nếu không nạp được
         
         Args:
-            landmarks: Danh sách landmarks của bàn tay
+            path: Đường dẫn file .npz
             
         Returns:
-            bool: True nếu phát hiện cử chỉ nhíp
+            Optional[GestureClassifier]: Classifier hoặc None
         """
         try:
-            if len(landmarks) < 21:  # MediaPipe có 21 landmarks
-                return False
-            
-            # Lấy vị trí đầu ngón trỏ (landmark 8) và đầu ngón cái (landmark 4)
-            index_tip = landmarks[8]  # INDEX_FINGER_TIP
-            thumb_tip = landmarks[4]  # THUMB_TIP
-            
-            # Lấy thêm các landmarks để kiểm tra tư thế
-            index_pip = landmarks[6]  # INDEX_FINGER_PIP (khớp giữa ngón trỏ)
-            thumb_ip = landmarks[3]   # THUMB_IP (khớp ngón cái)
-            
-            # Tính khoảng cách giữa hai đầu ngón
-            tip_distance = self._calculate_distance(index_tip, thumb_tip)
-            
-            # Kiểm tra xem ngón trỏ có thẳng không (để tránh nhầm với nắm tay)
-            index_pip_to_tip = self._calculate_distance(index_pip, index_tip)
-            thumb_ip_to_tip = self._calculate_distance(thumb_ip, thumb_tip)
-            
-            # Ngón trỏ phải duỗi thẳng (khoảng cách từ PIP đến TIP phải đủ lớn)
-            index_extended = index_pip_to_tip > 0.05
-            thumb_extended = thumb_ip_to_tip > 0.03
-            
-            # Kiểm tra pinch chỉ khi cả hai ngón đều duỗi
-            is_pinch_gesture = (tip_distance < CLICK_THRESHOLD and 
-                               index_extended and thumb_extended)
-            
-            # Thêm vào buffer để làm mượt
-            self.pinch_buffer.append(is_pinch_gesture)
-            if len(self.pinch_buffer) > self.pinch_buffer_size:
-                self.pinch_buffer.pop(0)
-            
-            # Chỉ trả về True nếu đa số các frame gần đây đều phát hiện pinch
-            pinch_count = sum(self.pinch_buffer)
-            stable_pinch = pinch_count >= (self.pinch_buffer_size // 2 + 1)
-            
-            self.logger.debug(f"Pinch - Distance: {tip_distance:.3f}, Index extended: {index_extended}, "
-                            f"Thumb extended: {thumb_extended}, Stable: {stable_pinch} ({pinch_count}/{len(self.pinch_buffer)})")
-            
-            return stable_pinch
-            
+            return GestureClassifier.load(path)
         except Exception as e:
-            self.logger.error(f"Lỗi khi phát hiện cử chỉ nhíp: {e}")
-            return False
+            self.logger.warning(f"Không nạp được gesture classifier ({path}): {e} - dùng luật")
+            return None
+    
+    @property
+    def last_left_click_time(self) -> float:
+        """Thời gian left click cuối cùng"""
+        return self.last_trigger_times.get("left_click", float('-inf'))
+    
+    @property
+    def last_right_click_time(self) -> float:
+        """Thời gian right click cuối cùng"""
+        return self.last_trigger_times.get("right_click", float('-inf'))
+    
+    def detect_pinch_gesture(self, landmarks: Landmarks) -> bool:
+        """
+        Phát hiện cử chỉ nhíp (ngón trỏ và ngón cái chạm nhau) với độ chính xác cao
+        
+        Args:
+            landmarks: Landmarks của bàn tay (mảng (21, 2|3) hoặc danh sách (x, y))
+            
+        Returns:
+            bool: True nếu phát hiện cử chỉ nhíp
+        """
+        return self.detect_rule('pinch', landmarks)
     
-    def detect_fist_gesture(self, landmarks: List[Tuple[float, float]]) -> bool:
+    def detect_fist_gesture(self, landmarks: Landmarks) -> bool:
         """
         Phát hiện cử chỉ nắm tay (tất cả ngón tay co lại)
         
         Args:
-            landmarks: Danh sách landmarks của bàn tay
+            landmarks: Landmarks của bàn tay (mảng (21, 2|3) hoặc danh sách (x, y))
             
         Returns:
             bool: True nếu phát hiện cử chỉ nắm tay
         """
+        return self.detect_rule('fist', landmarks)
+    
+    def detect_rule(self, name: str, landmarks: Landmarks) -> bool:
+        """
+        Đánh giá mọi luật trên frame hiện tại và trả về trạng thái ổn định của một luật
+        
+        Args:
+            name: Tên luật (ví dụ "pinch", "fist")
+            landmarks: Landmarks của bàn tay (mảng (21, 2|3) hoặc danh sách (x, y))
+            
+        Returns:
+            bool: True nếu luật khớp đủ số frame trong cửa sổ ổn định
+        """
         try:
-            if len(landmarks) < 21:
+            if len(landmarks) < 21:  # MediaPipe có 21 landmarks
                 return False
-            
-            # Landmarks của các đầu ngón tay
-            finger_tips = [
-                landmarks[4],   # Thumb tip
-                landmarks[8],   # Index finger tip
-                landmarks[12],  # Middle finger tip
-                landmarks[16],  # Ring finger tip
-                landmarks[20]   # Pinky tip
-            ]
-            
-            # Landmarks của các khớp MCP (gốc ngón tay)
-            finger_mcps = [
-                landmarks[2],   # Thumb MCP (sử dụng landmark khác cho ngón cái)
-                landmarks[5],   # Index finger MCP
-                landmarks[9],   # Middle finger MCP
-                landmarks[13],  # Ring finger MCP
-                landmarks[17]   # Pinky MCP
-            ]
-            
-            # Trung tâm của lòng bàn tay (landmark 0 - wrist)
-            wrist = landmarks[0]
-            
-            # Đếm số ngón tay đang co
-            closed_fingers = 0
-            
-            for i, (tip, mcp) in enumerate(zip(finger_tips, finger_mcps)):
-                # Tính khoảng cách từ đầu ngón tay đến cổ tay
-                tip_to_wrist = self._calculate_distance(tip, wrist)
-                # Tính khoảng cách từ khớp MCP đến cổ tay
-                mcp_to_wrist = self._calculate_distance(mcp, wrist)
-                
-                # Nếu đầu ngón tay gần cổ tay hơn khớp MCP, ngón tay được coi là co
-                if i == 0:  # Ngón cái - xử lý đặc biệt
-                    # Đối với ngón cái, kiểm tra theo trục x
-                    if abs(tip[0] - mcp[0]) < 0.05:  # Ngón cái co ngang
-                        closed_fingers += 1
-                else:
-                    # Các ngón tay khác
-                    if tip_to_wrist < mcp_to_wrist * 0.9:  # 10% tolerance
-                        closed_fingers += 1
-            
-            # Nếu ít nhất 4/5 ngón tay co lại thì coi là nắm tay
-            is_fist = closed_fingers >= 4
-            
-            self.logger.debug(f"Closed fingers: {closed_fingers}/5, is_fist: {is_fist}")
-            
-            return is_fist
+            stable = self._evaluate_rules(self.compute_features(landmarks))
+            return bool(stable[self.rules.names.index(name)])
             
         except Exception as e:
-            self.logger.error(f"Lỗi khi phát hiện cử chỉ nắm tay: {e}")
+            self.logger.error(f"Lỗi khi phát hiện gesture {name}: {e}")
             return False
     
-    def get_pointer_position(self, landmarks: List[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    def _evaluate_rules(self, features: np.ndarray) -> List[bool]:
+        """
+        Kiểm tra mọi luật trên vector đặc trưng và cập nhật luật ổn định
+        
+        Args:
+            features: Vector đặc trưng của frame hiện tại
+            
+        Returns:
+            List[bool]: Trạng thái ổn định theo thứ tự ưu tiên của self.rules.rules
+        """
+        matched = self.rules.match(features)
+        if self.classifier is not None:
+            self._apply_classifier(features, matched)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Rules matched: {matched.tolist()} ({self.rules.names})")
+        return self.rules.stabilize(matched)
+    
+    def _apply_classifier(self, features: np.ndarray, matched: np.ndarray):
+        """
+        Chạy classifier trên frame hiện tại: thay kết quả các luật cùng tên ("classifier")
+        hoặc chỉ thống kê mức đồng thuận với luật ("shadow")
+        
+        Args:
+            features: Vector đặc trưng của frame hiện tại
+            matched: Kết quả match() của các luật, được sửa tại chỗ ở chế độ "classifier"
+        """
+        predicted = self.classifier.predict(features)
+        
+        if self.classifier_mode == "classifier":
+            for r, label in self.classifier_rules:
+                matched[r] = label == predicted
+            return
+        
+        # Lớp mà các luật chọn: luật khớp đầu tiên theo độ ưu tiên, NO_GESTURE nếu không khớp
+        rule_label = next((label for r, label in self.classifier_rules if matched[r]), self.classifier_fallback)
+        self.classifier_agreement['frames'] += 1
+        self.classifier_agreement['agree'] += rule_label == predicted
+    
+    def compute_features(self, landmarks: Landmarks) -> np.ndarray:
+        """
+        Tính vector đặc trưng dùng chung cho frame hiện tại
+        
+        Args:
+            landmarks: Landmarks của bàn tay (mảng (21, 2|3) hoặc danh sách (x, y))
+            
+        Returns:
+            np.ndarray: Vector đặc trưng (xem utils.gesture_features)
+        """
+        return self.feature_extractor.compute(landmarks)
+    
+    def get_pointer_position(self, landmarks: Landmarks) -> Optional[Tuple[float, float]]:
         """
         Lấy vị trí ngón trỏ để điều khiển con trỏ chuột
         
         Args:
-            landmarks: Danh sách landmarks của bàn tay
+            landmarks: Landmarks của bàn tay (mảng (21, 2|3) hoặc danh sách (x, y))
             
         Returns:
             Optional[Tuple[float, float]]: Tọa độ ngón trỏ hoặc None
@@ -176,64 +251,80 @@ class GestureRecognizer:
         try:
             if len(landmarks) < 21:
                 return None
-              # Sử dụng đầu ngón trỏ (landmark 8)
+            # Sử dụng đầu ngón trỏ (landmark 8), trả về bản sao vì mảng landmarks được dùng lại
             index_tip = landmarks[8]
-            return index_tip
+            return (float(index_tip[0]), float(index_tip[1]))
             
         except Exception as e:
             self.logger.error(f"Lỗi khi lấy vị trí ngón trỏ: {e}")
             return None
     
-    def process_gesture(self, landmarks: List[Tuple[float, float]]) -> str:
+    def process_gesture(self, landmarks: Landmarks, timestamp: Optional[float] = None) -> str:
         """
         Xử lý và nhận diện gesture tổng thể
         
         Args:
-            landmarks: Danh sách landmarks của bàn tay
+            landmarks: Landmarks của bàn tay (mảng (21, 2|3) hoặc danh sách (x, y))
+            timestamp: Thời điểm capture của frame (giây, cùng gốc với clock); mặc định thời điểm
+                       đã ghi vào lịch sử dùng chung, hoặc clock.now() với lịch sử riêng
             
         Returns:
-            str: Tên gesture ("moving", "left_click", "right_click")
+            str: Tên gesture trong self.labels ("moving", "left_click", "right_click"...),
+                 "<gesture>_cooldown" khi gesture đang trong thời gian chờ,
+                 hoặc tên gesture động ("swipe_left", "circle_cw"...) ở frame nó hoàn thành
         """
         try:
-            current_time = time.time()
             gesture = "moving"  # Default gesture
             
-            # Kiểm tra cử chỉ nắm tay (right click) trước
-            if self.detect_fist_gesture(landmarks):
-                if current_time - self.last_right_click_time > CLICK_COOLDOWN:
-                    gesture = "right_click"
-                    self.last_right_click_time = current_time
-                    self.logger.debug("Right click detected and executed")
-                else:
-                    gesture = "right_click_cooldown"
-                    self.logger.debug(f"Right click in cooldown: {current_time - self.last_right_click_time:.2f}s")
-            
-            # Kiểm tra cử chỉ nhíp (left click) - chỉ khi không phải right click
-            elif self.detect_pinch_gesture(landmarks):
-                if current_time - self.last_left_click_time > CLICK_COOLDOWN:
-                    gesture = "left_click"
-                    self.last_left_click_time = current_time
-                    self.logger.debug("Left click detected and executed")
-                else:
-                    gesture = "left_click_cooldown"
-                    self.logger.debug(f"Left click in cooldown: {current_time - self.last_left_click_time:.2f}s")
-            
-            # Không dùng buffer cho cooldown - trả về trực tiếp
-            if "cooldown" in gesture:
-                return gesture
-            
-            # Chỉ dùng buffer cho các gesture khác
-            if gesture not in ["left_click_cooldown", "right_click_cooldown"]:
-                self.gesture_buffer.append(gesture)
-                if len(self.gesture_buffer) > self.buffer_size:
-                    self.gesture_buffer.pop(0)
-                
-                # Lấy gesture phổ biến nhất trong buffer (không bao gồm cooldown)
-                smoothed_gesture = self._get_most_common_gesture()
-                self.current_gesture = smoothed_gesture
-                return smoothed_gesture
+            # Lịch sử dùng chung đã được pipeline ghi, lịch sử riêng thì ghi tại đây
+            if self.owns_history:
+                current_time = self.clock.now() if timestamp is None else timestamp
+                landmarks = self.history.push(landmarks, current_time)
             else:
-                return gesture
+                current_time = self.history.latest_time() if timestamp is None else timestamp
+            
+            # Tính đặc trưng một lần, mọi luật được kiểm tra trên cùng một vector
+            features = self.compute_features(landmarks)
+            stable = self.stable = self._evaluate_rules(features)
+            
+            # Gesture động là sự kiện một lần: trả về trực tiếp, không qua buffer bầu chọn
+            if self.dynamic_engine is not None:
+                dynamic_gesture = self.dynamic_engine.update(self.history)
+                if dynamic_gesture is not None:
+                    return dynamic_gesture
+            
+            # Click onset cũng là sự kiện một lần; luật "pinch" không còn kích hoạt qua buffer
+            if self.click_onset is not None:
+                stable[self.onset_rule] = False
+                if self.click_onset.update(features, current_time):
+                    rule = self.rules.rules[self.onset_rule]
+                    if current_time - self.last_trigger_times[rule.gesture] <= rule.cooldown:
+                        return f"{rule.gesture}_cooldown"
+                    self.last_trigger_times[rule.gesture] = current_time
+                    self.last_click_frame = self.history.frame_count - 1
+                    self.logger.debug(f"{rule.gesture} onset detected and executed")
+                    return rule.gesture
+            
+            # Luật đã sắp theo độ ưu tiên giảm dần: luật ổn định đầu tiên thắng
+            if True in stable:
+                rule = self.rules.rules[stable.index(True)]
+                elapsed = current_time - self.last_trigger_times[rule.gesture]
+                if elapsed <= rule.cooldown:
+                    # Không dùng buffer cho cooldown - trả về trực tiếp
+                    self.logger.debug(f"{rule.gesture} in cooldown: {elapsed:.2f}s")
+                    return f"{rule.gesture}_cooldown"
+                
+                gesture = rule.gesture
+                self.last_trigger_times[gesture] = current_time
+                if gesture == "left_click":
+                    self.last_click_frame = self.history.frame_count - 1
+                self.logger.debug(f"{gesture} detected and executed")
+            
+            # Chỉ dùng buffer cho các gesture khác: lấy gesture nhiều phiếu nhất (không bao gồm cooldown)
+            self.gesture_votes.push(self.rules.label_index[gesture])
+            smoothed_gesture = self._get_most_common_gesture()
+            self.current_gesture = smoothed_gesture
+            return smoothed_gesture
             
         except Exception as e:
             self.logger.error(f"Lỗi khi xử lý gesture: {e}")
@@ -252,23 +343,38 @@ class GestureRecognizer:
         """
         return np.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
     
+    def _pointer_from_features(self) -> Tuple[float, float]:
+        """Vị trí đầu ngón trỏ trong vector đặc trưng của frame gần nhất (bản sao)"""
+        pointer = self.features[F_POINTER]
+        return (float(pointer[0]), float(pointer[1]))
+    
     def _get_most_common_gesture(self) -> str:
         """
-        Lấy gesture phổ biến nhất trong buffer
+        Lấy gesture phổ biến nhất trong buffer (số đếm chạy, không duyệt lại buffer)
         
         Returns:
             str: Gesture phổ biến nhất
         """
-        if not self.gesture_buffer:
+        if self.gesture_votes.length == 0:
             return "moving"
+        return self.labels[self.gesture_votes.most_common()]
+    
+    def is_active(self, name: str) -> bool:
+        """
+        Luật có đang ổn định ở frame gần nhất của process_gesture không
+        (luật "pinch" ở chế độ onset: hai ngón đang nhíp giữa cạnh nhấn và cạnh nhả)
         
-        # Đếm tần suất của mỗi gesture
-        gesture_counts = {}
-        for gesture in self.gesture_buffer:
-            gesture_counts[gesture] = gesture_counts.get(gesture, 0) + 1
-        
-        # Trả về gesture có tần suất cao nhất
-        return max(gesture_counts, key=gesture_counts.get)
+        Args:
+            name: Tên luật (ví dụ "pinch", "fist")
+            
+        Returns:
+            bool: True nếu luật đang hoạt động
+        """
+        if name == "pinch" and self.click_onset is not None:
+            return self.click_onset.pressed
+        if not self.stable or name not in self.rules.names:
+            return False
+        return bool(self.stable[self.rules.names.index(name)])
     
     def get_current_gesture(self) -> str:
         """
@@ -280,9 +386,22 @@ class GestureRecognizer:
         return self.current_gesture
     
     def reset_cooldowns(self):
-        """Reset thời gian cooldown của các click"""
-        self.last_left_click_time = 0
-        self.last_right_click_time = 0
+        """Reset thời gian cooldown của các gesture"""
+        for gesture in self.last_trigger_times:
+            self.last_trigger_times[gesture] = float('-inf')
+    
+    def reset_tracking(self):
+        """
+        Xóa trạng thái theo quỹ đạo khi mất tay: lịch sử landmarks, hover và gesture động. Tay xuất hiện
+        lại không nối quỹ đạo với lần trước, ví dụ hover không tính cả khoảng thời gian tay vắng mặt.
+        
+        Cửa sổ ổn định, bầu chọn, click onset và cooldown được giữ như evaluate_gestures (frame không
+        có tay không làm thay đổi trạng thái) để đánh giá offline vẫn khớp với pipeline trực tiếp.
+        """
+        self.history.reset()
+        self.is_hovering = False
+        if self.dynamic_engine is not None:
+            self.dynamic_engine.reset()
     
     def get_gesture_info(self) -> Dict[str, any]:
         """
@@ -291,34 +410,44 @@ class GestureRecognizer:
         Returns:
             Dict[str, any]: Thông tin gesture
         """
-        current_time = time.time()
-        return {
+        current_time = self.clock.now()
+        info = {
             'current_gesture': self.current_gesture,
-            'left_click_cooldown': max(0, CLICK_COOLDOWN - (current_time - self.last_left_click_time)),
-            'right_click_cooldown': max(0, CLICK_COOLDOWN - (current_time - self.last_right_click_time)),
-            'buffer_size': len(self.gesture_buffer),
-            'gesture_buffer': self.gesture_buffer.copy()
+            'buffer_size': self.gesture_votes.length,
+            'gesture_counts': dict(zip(self.labels, self.gesture_votes.counts)),
+            'classifier_mode': self.classifier_mode
         }
+        if self.classifier_agreement['frames']:
+            info['classifier_agreement'] = self.classifier_agreement['agree'] / self.classifier_agreement['frames']
+        for rule in self.rules.rules:
+            elapsed = current_time - self.last_trigger_times[rule.gesture]
+            info[f'{rule.gesture}_cooldown'] = max(0, rule.cooldown - elapsed)
+        return info
     
-    def detect_double_click(self, current_position: Tuple[float, float]) -> bool:
+    def detect_double_click(self, current_position: Optional[Tuple[float, float]] = None) -> bool:
         """
         Phát hiện double click dựa trên thời gian và vị trí
         
         Args:
-            current_position: Vị trí hiện tại của gesture
+            current_position: Vị trí hiện tại của gesture (mặc định đầu ngón trỏ trong vector đặc trưng)
             
         Returns:
             bool: True nếu là double click
         """
         try:
-            current_time = time.time()
+            # Thời điểm của frame mới nhất, cùng gốc với thời điểm click đã ghi
+            current_time = self.history.latest_time() if len(self.history) else self.clock.now()
+            if current_position is None:
+                current_position = self._pointer_from_features()
             
             # Kiểm tra thời gian giữa các click
             if (current_time - self.last_left_click_time) <= DOUBLE_CLICK_TIME:
-                # Kiểm tra khoảng cách giữa các vị trí click
-                if self.last_click_position:
-                    distance = self._calculate_distance(current_position, self.last_click_position)
-                    if distance < 0.05:  # Threshold cho khoảng cách double click
+                # Vị trí click trước đọc lại từ lịch sử (None nếu frame đó đã bị ghi đè)
+                click_landmarks = None if self.last_click_frame is None else self.history.frame(self.last_click_frame)
+                if click_landmarks is not None:
+                    click_x, click_y = click_landmarks[8, :2].tolist()
+                    distance = self._calculate_distance(current_position, (click_x, click_y))
+                    if distance < DOUBLE_CLICK_RADIUS:
                         return True
             
             return False
@@ -327,40 +456,36 @@ class GestureRecognizer:
             self.logger.error(f"Lỗi khi phát hiện double click: {e}")
             return False
     
-    def detect_hover(self, current_position: Tuple[float, float]) -> bool:
+    def detect_hover(self, current_position: Optional[Tuple[float, float]] = None) -> bool:
         """
         Phát hiện hover (giữ tay ở một vị trí trong thời gian dài)
         
+        Hover bắt đầu ở frame đầu tiên sau lần cuối đầu ngón trỏ ở ngoài bán kính HOVER_RADIUS
+        quanh vị trí hiện tại, tính trên quỹ đạo trong lịch sử landmarks.
+        
         Args:
-            current_position: Vị trí hiện tại
+            current_position: Vị trí hiện tại (mặc định đầu ngón trỏ của frame mới nhất trong lịch sử)
             
         Returns:
             bool: True nếu đang hover
         """
         try:
-            current_time = time.time()
-            
-            if self.hover_position is None:
-                self.hover_position = current_position
-                self.hover_start_time = current_time
+            if len(self.history) < 2:
                 return False
             
-            # Tính khoảng cách di chuyển
-            distance = self._calculate_distance(current_position, self.hover_position)
-            
-            if distance < 0.03:  # Threshold cho hover (ít di chuyển)
-                if current_time - self.hover_start_time >= HOVER_TIME:
-                    if not self.is_hovering:
-                        self.is_hovering = True
-                        self.logger.debug("Hover detected")
-                    return True
-            else:
-                # Reset hover nếu di chuyển quá nhiều
-                self.hover_position = current_position
-                self.hover_start_time = current_time
-                self.is_hovering = False
-            
-            return False
+            track = self.history.track(8)
+            times = self.history.times()
+            center = track[-1, :2] if current_position is None else np.asarray(current_position, dtype=np.float32)
+            offsets = track[:, :2] - center
+            outside = np.flatnonzero(np.einsum('ij,ij->i', offsets, offsets) >= HOVER_RADIUS ** 2)
+            
+            # Thời điểm bắt đầu đứng yên; toàn bộ lịch sử trong bán kính thì tính từ frame cũ nhất
+            start = outside[-1] + 1 if len(outside) else 0
+            hovering = start < len(times) and times[-1] - times[start] >= HOVER_TIME
+            if hovering and not self.is_hovering:
+                self.logger.debug("Hover detected")
+            self.is_hovering = bool(hovering)
+            return self.is_hovering
             
         except Exception as e:
             self.logger.error(f"Lỗi khi phát hiện hover: {e}")
@@ -0,0 +1,187 @@
+"""
+Gesture Batch Module
+Chạy lại toàn bộ logic của GestureRecognizer.process_gesture trên chuỗi landmarks đã ghi,
+dùng để đánh giá offline các thay đổi ngưỡng (CLICK_THRESHOLD, PINCH_STABILITY_FRAMES, CLICK_COOLDOWN...)
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+from config.settings import CLICK_THRESHOLD, CLICK_COOLDOWN, GESTURE_VOTE_WINDOW, CLICK_MODE, LANDMARK_FILTER
+from utils.vote_buffer import VoteBuffer
+from utils.gesture_features import compute_features_batch
+from utils.gesture_rules import GestureRule, GestureRuleSet, build_rules
+from utils.gesture_classifier import GestureClassifier
+from utils.click_onset import PinchOnsetDetector
+from utils.landmark_filter import OneEuroLandmarkFilter, filter_sequence
+from utils.clock import VirtualClock
+from utils.gesture import GestureRecognizer
+
+
+def batch_labels(rule_set: GestureRuleSet) -> List[str]:
+    """
+    Nhãn đầu ra của evaluate_gestures: các gesture của process_gesture,
+    trạng thái cooldown của từng gesture và frame không có tay
+
+    Args:
+        rule_set: Bộ luật đã biên dịch
+
+    Returns:
+        List[str]: Nhãn theo mã trả về
+    """
+    return rule_set.labels + [f"{gesture}_cooldown" for gesture in rule_set.labels[1:]] + ["no_hand"]
+
+
+# Nhãn của bộ luật mặc định (không gồm gesture đăng ký thêm)
+BATCH_LABELS = batch_labels(GestureRuleSet(build_rules(registry=())))
+
+
+def evaluate_gestures(landmarks: np.ndarray, timestamps: np.ndarray, present: Optional[np.ndarray] = None,
+                      click_threshold: float = CLICK_THRESHOLD, click_cooldown: float = CLICK_COOLDOWN,
+                      stability: Optional[Dict[str, Dict[str, int]]] = None,
+                      vote_window: int = GESTURE_VOTE_WINDOW,
+                      rules: Optional[List[GestureRule]] = None,
+                      classifier: Optional[GestureClassifier] = None,
+                      click_mode: str = CLICK_MODE, landmark_filter: bool = LANDMARK_FILTER) -> np.ndarray:
+    """
+    Tính chuỗi gesture mà GestureRecognizer.process_gesture sẽ trả về cho từng frame
+
+    Đặc trưng và luật được tính vector hóa trên cả chuỗi, luật ổn định dùng tổng tích lũy;
+    chỉ cooldown và bầu chọn gesture (phụ thuộc trạng thái) được chạy lại trong một vòng lặp.
+
+    Args:
+        landmarks: Mảng (T, 21, 2|3) landmarks của tay điều khiển
+        timestamps: Mảng (T,) thời điểm của từng frame (giây)
+        present: Mảng (T,) bool, False ở frame không có tay (mặc định mọi frame đều có tay)
+        click_threshold: Khoảng cách pinch tối đa
+        click_cooldown: Thời gian chờ giữa hai lần click
+        stability: Ghi đè GESTURE_STABILITY theo từng detector
+        vote_window: Số frame bầu chọn gesture đầu ra
+        rules: Danh sách luật (mặc định build_rules() với các tham số trên), nhãn xem batch_labels()
+        classifier: Nếu có, thay kết quả của các luật cùng tên như chế độ "classifier" của GestureRecognizer
+        click_mode: "vote" hoặc "onset" như GestureRecognizer (onset chạy trong vòng lặp trạng thái)
+        landmark_filter: Lọc One Euro landmarks trước khi tính đặc trưng, như pipeline trực tiếp
+
+    Returns:
+        np.ndarray: Mảng (T,) int8, index trong batch_labels() (BATCH_LABELS với luật mặc định)
+    """
+    if rules is None:
+        rules = build_rules(click_threshold, click_cooldown, stability)
+    rule_set = GestureRuleSet(rules)
+    num_labels = len(rule_set.labels)
+    no_hand = 2 * num_labels - 1
+
+    total = len(landmarks)
+    output = np.full(total, no_hand, dtype=np.int8)
+
+    # Frame không có tay không đi qua process_gesture nên không làm thay đổi trạng thái
+    frames = np.flatnonzero(present) if present is not None else np.arange(total)
+    if len(frames) == 0:
+        return output
+
+    if landmark_filter:
+        landmarks = filter_sequence(landmarks, timestamps, present)
+
+    # Mọi luật trên mọi frame có tay, rồi luật ổn định theo cửa sổ của từng luật
+    features = compute_features_batch(landmarks[frames])
+    matched = rule_set.match_batch(features)
+    if classifier is not None:
+        predicted = classifier.predict_batch(features)
+        for r, name in enumerate(rule_set.names):
+            if name in classifier.labels:
+                matched[:, r] = predicted == classifier.labels.index(name)
+    stable = rule_set.stabilize_batch(matched)
+
+    # Chế độ onset: luật "pinch" chỉ kích hoạt qua bộ phát hiện cạnh nhấn
+    onset, onset_rule = None, -1
+    if click_mode == "onset" and "pinch" in rule_set.names:
+        onset_rule = rule_set.names.index("pinch")
+        onset = PinchOnsetDetector(click_threshold)
+        stable[:, onset_rule] = False
+
+    # Luật đã sắp theo độ ưu tiên: luật ổn định đầu tiên thắng, -1 khi không có luật nào
+    winners = np.full(len(frames), -1)
+    if stable.shape[1]:
+        winners = np.where(stable.any(axis=1), stable.argmax(axis=1), -1)
+    rule_labels = [rule_set.label_index[rule.gesture] for rule in rule_set.rules]
+    cooldowns = [rule.cooldown for rule in rule_set.rules]
+
+    # Cooldown và bầu chọn phụ thuộc trạng thái trước đó: chạy lại trong một vòng lặp
+    votes = VoteBuffer(vote_window, num_labels)
+    last_trigger = [float('-inf')] * num_labels
+    decisions = np.empty(len(frames), dtype=np.int8)
+    for i, (now, winner) in enumerate(zip(np.asarray(timestamps, dtype=np.float64)[frames].tolist(),
+                                          winners.tolist())):
+        # Cạnh nhấn trả về trực tiếp, không qua bầu chọn (như process_gesture)
+        if onset is not None and onset.update(features[i], now):
+            label = rule_labels[onset_rule]
+            if now - last_trigger[label] <= cooldowns[onset_rule]:
+                decisions[i] = num_labels + label - 1
+            else:
+                last_trigger[label] = now
+                decisions[i] = label
+            continue
+
+        label = 0
+        if winner >= 0:
+            label = rule_labels[winner]
+            if now - last_trigger[label] <= cooldowns[winner]:
+                decisions[i] = num_labels + label - 1
+                continue
+            last_trigger[label] = now
+
+        votes.push(label)
+        decisions[i] = votes.most_common()
+
+    output[frames] = decisions
+    return output
+
+
+def replay_gestures(landmarks: np.ndarray, timestamps: np.ndarray, present: Optional[np.ndarray] = None,
+                    landmark_filter: bool = LANDMARK_FILTER, **recognizer_options) -> List[str]:
+    """
+    Chạy lại chuỗi landmarks đã ghi qua chính GestureRecognizer của pipeline trực tiếp trên đồng hồ ảo
+
+    Chậm hơn evaluate_gestures nhưng dùng đúng mã của ứng dụng (kể cả gesture động), không phải chờ
+    theo thời gian thực; dùng làm tham chiếu khi kiểm tra evaluate_gestures.
+
+    Args:
+        landmarks: Mảng (T, 21, 2|3) landmarks của tay điều khiển
+        timestamps: Mảng (T,) thời điểm của từng frame (giây)
+        present: Mảng (T,) bool, False ở frame không có tay
+        landmark_filter: Lọc One Euro landmarks như pipeline trực tiếp
+        recognizer_options: Tham số của GestureRecognizer (click_threshold, click_mode...)
+
+    Returns:
+        List[str]: Kết quả process_gesture của từng frame, "no_hand" ở frame không có tay
+    """
+    clock = VirtualClock()
+    recognizer = GestureRecognizer(clock=clock, **recognizer_options)
+    one_euro = OneEuroLandmarkFilter(landmarks.shape[1]) if landmark_filter else None
+    source = np.zeros((len(landmarks), landmarks.shape[1], 3), dtype=np.float32)
+    source[:, :, :landmarks.shape[2]] = landmarks[:, :, :3]
+
+    output = []
+    for t, timestamp in enumerate(np.asarray(timestamps, dtype=np.float64).tolist()):
+        if present is not None and not present[t]:
+            output.append("no_hand")
+            continue
+        clock.set(timestamp)
+        hand = source[t] if one_euro is None else one_euro.apply(source[t], timestamp)
+        output.append(recognizer.process_gesture(hand))
+    return output
+
+
+def summarize(decisions: np.ndarray, labels: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Đếm số frame của từng nhãn
+
+    Args:
+        decisions: Kết quả của evaluate_gestures
+        labels: Nhãn của bộ luật đã dùng (mặc định BATCH_LABELS)
+
+    Returns:
+        Dict[str, int]: Số frame theo nhãn
+    """
+    labels = labels or BATCH_LABELS
+    counts = np.bincount(decisions, minlength=len(labels))
+    return dict(zip(labels, counts.tolist()))
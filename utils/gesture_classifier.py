@@ -0,0 +1,142 @@
+"""
+Gesture Classifier Module
+MLP nhỏ phân loại gesture từ các đặc trưng không phụ thuộc kích thước tay (khoảng cách đã chuẩn hóa
+và độ co của từng ngón), suy luận thuần NumPy trên buffer cấp phát sẵn
+"""
+
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+from utils.gesture_features import F_NORMALIZED, F_CURL
+
+# Đầu vào của classifier: khoảng cách chia cho kích thước lòng bàn tay (bỏ chính nó, luôn bằng 1)
+# và tỉ lệ co của 5 ngón
+CLASSIFIER_INPUTS = np.r_[np.arange(F_NORMALIZED.start, F_NORMALIZED.stop - 1),
+                          np.arange(F_CURL.start, F_CURL.stop)].astype(np.intp)
+NUM_INPUTS = len(CLASSIFIER_INPUTS)
+
+# Nhãn không thuộc gesture nào
+NO_GESTURE = "none"
+
+
+def save_model(path: str, params: Dict[str, np.ndarray], mean: np.ndarray, std: np.ndarray,
+               labels: Sequence[str]) -> None:
+    """
+    Lưu model ra file .npz
+
+    Args:
+        path: Đường dẫn file
+        params: Trọng số 'w1' (D, H), 'b1' (H,), 'w2' (H, C), 'b2' (C,) trên đầu vào đã chuẩn hóa
+        mean: Trung bình của từng đầu vào trên tập train
+        std: Độ lệch chuẩn của từng đầu vào trên tập train
+        labels: Tên các lớp (tên luật trong utils.gesture_rules, hoặc NO_GESTURE)
+    """
+    np.savez(path, mean=mean, std=std, labels=np.array(labels), **params)
+
+
+@lru_cache(maxsize=4)
+def load_weights(path: str) -> Tuple[np.ndarray, np.ndarray, Tuple[str, ...]]:
+    """
+    Đọc model và gộp phép chuẩn hóa đầu vào cùng bias vào ma trận trọng số
+
+    Kết quả được cache để mọi GestureRecognizer (mỗi tay một bộ) dùng chung một bản trọng số.
+
+    Args:
+        path: Đường dẫn file .npz của save_model
+
+    Returns:
+        Tuple: (W1 (D+1, H), W2 (H+1, C), labels), hàng cuối của mỗi ma trận là bias
+    """
+    data = np.load(path)
+    std = np.maximum(data['std'], 1e-6)
+    w1 = data['w1'] / std[:, None]
+    b1 = data['b1'] - (data['mean'] / std) @ data['w1']
+    layer1 = np.vstack([w1, b1]).astype(np.float32)
+    layer2 = np.vstack([data['w2'], data['b2']]).astype(np.float32)
+    return layer1, layer2, tuple(str(label) for label in data['labels'])
+
+
+class GestureClassifier:
+    """MLP một lớp ẩn (ReLU), mỗi frame gồm một lần lấy đầu vào, hai phép nhân ma trận và một argmax"""
+
+    def __init__(self, layer1: np.ndarray, layer2: np.ndarray, labels: Sequence[str]):
+        """
+        Args:
+            layer1: Ma trận (NUM_INPUTS + 1, H), hàng cuối là bias
+            layer2: Ma trận (H + 1, C), hàng cuối là bias
+            labels: Tên C lớp
+        """
+        self.layer1 = layer1
+        self.layer2 = layer2
+        self.labels = list(labels)
+
+        # Buffer có thêm phần tử hằng 1 ở cuối để bias nằm trong phép nhân ma trận
+        self._inputs = np.ones(layer1.shape[0], dtype=np.float32)
+        self._hidden = np.ones(layer2.shape[0], dtype=np.float32)
+        self._input_values = self._inputs[:-1]
+        self._hidden_values = self._hidden[:-1]
+        self.scores = np.zeros(layer2.shape[1], dtype=np.float32)
+
+    @classmethod
+    def load(cls, path: str) -> "GestureClassifier":
+        """
+        Tạo classifier từ file model (trọng số được dùng chung giữa các instance)
+
+        Args:
+            path: Đường dẫn file .npz
+
+        Returns:
+            GestureClassifier: Classifier với buffer riêng
+        """
+        return cls(*load_weights(path))
+
+    def predict(self, features: np.ndarray) -> int:
+        """
+        Phân loại frame hiện tại
+
+        Args:
+            features: Vector (NUM_FEATURES,) float32 của GestureFeatureExtractor
+
+        Returns:
+            int: Index lớp trong self.labels (điểm từng lớp nằm trong self.scores)
+        """
+        np.take(features, CLASSIFIER_INPUTS, out=self._input_values)
+        np.dot(self._inputs, self.layer1, out=self._hidden_values)
+        np.maximum(self._hidden_values, 0.0, out=self._hidden_values)
+        np.dot(self._hidden, self.layer2, out=self.scores)
+        return int(self.scores.argmax())
+
+    def predict_batch(self, features: np.ndarray) -> np.ndarray:
+        """
+        Phân loại cả chuỗi frame
+
+        Args:
+            features: Mảng (T, NUM_FEATURES) của compute_features_batch
+
+        Returns:
+            np.ndarray: Mảng (T,) index lớp
+        """
+        hidden = np.maximum(features[:, CLASSIFIER_INPUTS] @ self.layer1[:-1] + self.layer1[-1], 0.0)
+        return (hidden @ self.layer2[:-1] + self.layer2[-1]).argmax(axis=1)
+
+
+def rule_predictions(matched: np.ndarray, rule_names: Sequence[str], labels: Sequence[str]) -> np.ndarray:
+    """
+    Quy kết quả của các luật về cùng tập lớp với classifier: luật khớp đầu tiên (theo độ ưu tiên)
+    có trong labels, NO_GESTURE nếu không có luật nào khớp
+
+    Args:
+        matched: Mảng (T, số luật) bool của GestureRuleSet.match_batch
+        rule_names: Tên luật theo thứ tự cột (GestureRuleSet.names)
+        labels: Tên các lớp của classifier
+
+    Returns:
+        np.ndarray: Mảng (T,) index lớp (-1 nếu labels không có NO_GESTURE)
+    """
+    columns = [r for r, name in enumerate(rule_names) if name in labels]
+    classes = np.array([labels.index(rule_names[r]) for r in columns], dtype=np.intp)
+    covered = matched[:, columns]
+    fallback = labels.index(NO_GESTURE) if NO_GESTURE in labels else -1
+    if not len(columns):
+        return np.full(len(matched), fallback)
+    return np.where(covered.any(axis=1), classes[covered.argmax(axis=1)], fallback)
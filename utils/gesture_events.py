@@ -0,0 +1,183 @@
+"""
+Gesture Events Module
+Bus sự kiện gesture: chỉ phát các chuyển trạng thái (hand_enter, pinch_start, pinch_end, fist_start,
+hover_enter, drag_move, left_click...) kèm thời điểm và vị trí tới các subscriber (chuột, overlay, logger, IPC),
+thay vì mỗi thành phần tự đọc chuỗi gesture mỗi frame
+"""
+
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Các trạng thái liên tục: (tên luật/trạng thái, sự kiện bắt đầu, sự kiện kết thúc)
+STATE_EVENTS = (
+    ("pinch", "pinch_start", "pinch_end"),
+    ("fist", "fist_start", "fist_end"),
+)
+HOVER_EVENTS = ("hover_enter", "hover_exit")
+
+# Đầu ngón trỏ phải di chuyển tối thiểu bấy nhiêu (normalized) giữa hai drag_move
+DRAG_MIN_MOVE = 0.01
+
+
+class GestureEvent:
+    """Một sự kiện gesture: loại, tay, thời điểm và vị trí đầu ngón trỏ (normalized)"""
+
+    __slots__ = ("type", "hand_id", "timestamp", "position")
+
+    def __init__(self, type: str, hand_id: int, timestamp: float, position: Tuple[float, float]):
+        self.type = type
+        self.hand_id = hand_id
+        self.timestamp = timestamp
+        self.position = position
+
+    def __repr__(self) -> str:
+        return (f"GestureEvent({self.type}, hand={self.hand_id}, t={self.timestamp:.3f}, "
+                f"pos=({self.position[0]:.3f}, {self.position[1]:.3f}))")
+
+
+Subscriber = Callable[[GestureEvent], None]
+
+
+class GestureEventBus:
+    """Phân phối sự kiện tới các subscriber đã đăng ký theo loại sự kiện"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._subscribers: Dict[Optional[str], List[Subscriber]] = {}
+
+    def subscribe(self, callback: Subscriber, *event_types: str) -> Subscriber:
+        """
+        Đăng ký subscriber
+
+        Args:
+            callback: Hàm nhận GestureEvent
+            event_types: Các loại sự kiện cần nhận (không truyền = mọi sự kiện)
+
+        Returns:
+            Subscriber: Chính callback (để hủy đăng ký sau)
+        """
+        for event_type in event_types or (None,):
+            self._subscribers.setdefault(event_type, []).append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        """Hủy mọi đăng ký của subscriber"""
+        for event_type in list(self._subscribers):
+            remaining = [subscriber for subscriber in self._subscribers[event_type] if subscriber is not callback]
+            if remaining:
+                self._subscribers[event_type] = remaining
+            else:
+                del self._subscribers[event_type]
+
+    def wants(self, event_type: str) -> bool:
+        """Có subscriber nào nhận loại sự kiện này không (để bỏ qua phần tính toán không ai cần)"""
+        return event_type in self._subscribers or None in self._subscribers
+
+    def publish(self, event: GestureEvent) -> None:
+        """
+        Gửi sự kiện tới các subscriber của loại đó và các subscriber nhận mọi sự kiện
+
+        Lỗi của một subscriber được ghi log và không ảnh hưởng tới các subscriber khác.
+        """
+        for event_type in (event.type, None):
+            for callback in self._subscribers.get(event_type, ()):
+                try:
+                    callback(event)
+                except Exception as e:
+                    self.logger.error(f"Lỗi trong subscriber của {event.type}: {e}")
+
+
+class GestureStateMachine:
+    """
+    Theo dõi trạng thái gesture của tay điều khiển và chỉ phát sự kiện khi trạng thái thay đổi
+
+    Mỗi frame chỉ so sánh vài cờ với frame trước; số sự kiện (không phải số subscriber) quyết định chi phí.
+    """
+
+    def __init__(self, bus: GestureEventBus):
+        """
+        Args:
+            bus: Bus nhận các sự kiện
+        """
+        self.bus = bus
+        self.hand_id: Optional[int] = None
+        self.active = {name: False for name, _, _ in STATE_EVENTS}
+        self.hovering = False
+        self.last_gesture = "moving"
+        self.last_position = (0.0, 0.0)
+        self.drag_position = (0.0, 0.0)
+
+    def update(self, hand_id: int, recognizer, gesture: str, timestamp: float) -> None:
+        """
+        Cập nhật với kết quả của frame hiện tại
+
+        Args:
+            hand_id: ID ổn định của tay điều khiển
+            recognizer: GestureRecognizer của tay (đã chạy process_gesture cho frame này)
+            gesture: Kết quả của process_gesture
+            timestamp: Thời điểm của frame
+        """
+        latest = recognizer.history.latest()
+        position = self.last_position if latest is None else (float(latest[8, 0]), float(latest[8, 1]))
+
+        if hand_id != self.hand_id:
+            # Tay mới xuất hiện hoặc đổi tay điều khiển: kết thúc các trạng thái của tay cũ
+            self.release(timestamp)
+            self.hand_id = hand_id
+            self._publish("hand_enter", timestamp, position)
+        self.last_position = position
+
+        # Trạng thái liên tục: nhíp, nắm tay
+        for name, start_event, end_event in STATE_EVENTS:
+            is_active = recognizer.is_active(name)
+            if is_active != self.active[name]:
+                self.active[name] = is_active
+                self._publish(start_event if is_active else end_event, timestamp, position)
+                if name == "pinch":
+                    self.drag_position = position
+
+        # Kéo: đầu ngón trỏ di chuyển trong khi đang nhíp
+        if self.active["pinch"] and self.bus.wants("drag_move"):
+            dx = position[0] - self.drag_position[0]
+            dy = position[1] - self.drag_position[1]
+            if dx * dx + dy * dy >= DRAG_MIN_MOVE * DRAG_MIN_MOVE:
+                self.drag_position = position
+                self._publish("drag_move", timestamp, position)
+
+        # Hover chỉ được tính khi có subscriber
+        if self.bus.wants(HOVER_EVENTS[0]) or self.bus.wants(HOVER_EVENTS[1]):
+            hovering = recognizer.detect_hover()
+            if hovering != self.hovering:
+                self.hovering = hovering
+                self._publish(HOVER_EVENTS[0] if hovering else HOVER_EVENTS[1], timestamp, position)
+
+        # Gesture rời rạc (click, vuốt...): phát khi đầu ra chuyển sang gesture đó
+        if gesture != self.last_gesture:
+            self.last_gesture = gesture
+            if gesture != "moving" and not gesture.endswith("_cooldown"):
+                self._publish(gesture, timestamp, position)
+
+    def release(self, timestamp: float) -> None:
+        """
+        Kết thúc mọi trạng thái đang hoạt động (mất tay hoặc đổi tay) để subscriber không bị kẹt
+
+        Args:
+            timestamp: Thời điểm hiện tại
+        """
+        if self.hand_id is None:
+            return
+        for name, _, end_event in STATE_EVENTS:
+            if self.active[name]:
+                self.active[name] = False
+                self._publish(end_event, timestamp, self.last_position)
+        if self.hovering:
+            self.hovering = False
+            self._publish(HOVER_EVENTS[1], timestamp, self.last_position)
+        self._publish("hand_exit", timestamp, self.last_position)
+        self.last_gesture = "moving"
+        self.hand_id = None
+
+    def _publish(self, event_type: str, timestamp: float, position: Tuple[float, float]) -> None:
+        """Tạo và gửi sự kiện (chỉ khi có subscriber)"""
+        if self.bus.wants(event_type):
+            self.bus.publish(GestureEvent(event_type, self.hand_id, timestamp, position))
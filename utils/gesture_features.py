@@ -0,0 +1,140 @@
+"""
+Gesture Features Module
+Tính toàn bộ khoảng cách cần cho nhận diện gesture trong một phép tính vector hóa trên mảng (21, 2)
+"""
+
+import numpy as np
+from typing import List, Tuple, Union
+
+# Landmarks có thể là mảng (21, 2) / (21, 3) từ HandTracker hoặc danh sách (x, y)
+Landmarks = Union[np.ndarray, List[Tuple[float, float]]]
+
+# Các cặp landmark cần đo khoảng cách, theo đúng thứ tự trong vector đặc trưng
+FEATURE_PAIRS = np.array([
+    (8, 4),                                      # Đầu ngón trỏ - đầu ngón cái (pinch)
+    (6, 8),                                      # PIP -> tip ngón trỏ (ngón trỏ duỗi)
+    (3, 4),                                      # IP -> tip ngón cái (ngón cái duỗi)
+    (4, 0), (8, 0), (12, 0), (16, 0), (20, 0),   # Đầu 5 ngón -> cổ tay
+    (2, 0), (5, 0), (9, 0), (13, 0), (17, 0),    # Khớp MCP 5 ngón -> cổ tay
+    (9, 0)                                       # Kích thước lòng bàn tay: cổ tay -> MCP ngón giữa
+], dtype=np.intp)
+NUM_DISTANCES = len(FEATURE_PAIRS)
+
+# Vị trí các đặc trưng trong vector
+F_PINCH = 0
+F_INDEX_PIP_TIP = 1
+F_THUMB_IP_TIP = 2
+F_TIP_WRIST = slice(3, 8)
+F_MCP_WRIST = slice(8, 13)
+F_PALM_SIZE = 13
+F_NORMALIZED = slice(NUM_DISTANCES, 2 * NUM_DISTANCES)  # Các khoảng cách chia cho kích thước lòng bàn tay
+F_THUMB_DX = 2 * NUM_DISTANCES                           # |x đầu ngón cái - x MCP ngón cái|
+F_POINTER = slice(2 * NUM_DISTANCES + 1, 2 * NUM_DISTANCES + 3)  # Tọa độ (x, y) đầu ngón trỏ
+F_CURL = slice(2 * NUM_DISTANCES + 3, 2 * NUM_DISTANCES + 8)     # Tỉ lệ tip -> cổ tay / MCP -> cổ tay của 5 ngón
+NUM_FEATURES = 2 * NUM_DISTANCES + 8
+
+# Tên đặc trưng dùng trong khai báo luật gesture (utils.gesture_rules) -> vị trí trong vector
+FINGER_NAMES = ("thumb", "index", "middle", "ring", "pinky")
+DISTANCE_NAMES = (
+    ["pinch_distance", "index_pip_tip", "thumb_ip_tip"]
+    + [f"{finger}_tip_wrist" for finger in FINGER_NAMES]
+    + [f"{finger}_mcp_wrist" for finger in FINGER_NAMES]
+    + ["palm_size"]
+)
+FEATURE_NAMES = {name: i for i, name in enumerate(DISTANCE_NAMES)}
+FEATURE_NAMES.update({f"{name}_norm": NUM_DISTANCES + i for i, name in enumerate(DISTANCE_NAMES)})
+FEATURE_NAMES.update({"thumb_dx": F_THUMB_DX, "pointer_x": F_POINTER.start, "pointer_y": F_POINTER.start + 1})
+FEATURE_NAMES.update({f"{finger}_curl": F_CURL.start + i for i, finger in enumerate(FINGER_NAMES)})
+
+
+def _build_operator() -> np.ndarray:
+    """
+    Ma trận (NUM_DISTANCES + 2, 21) biến landmarks thành mọi vector hiệu cần dùng bằng một phép nhân:
+    mỗi hàng là +1 / -1 tại hai landmark của một cặp, thêm hàng (tip - MCP ngón cái) và hàng chọn đầu ngón trỏ
+    """
+    operator = np.zeros((NUM_DISTANCES + 2, 21), dtype=np.float32)
+    rows = np.arange(NUM_DISTANCES)
+    np.add.at(operator, (rows, FEATURE_PAIRS[:, 0]), 1.0)
+    np.add.at(operator, (rows, FEATURE_PAIRS[:, 1]), -1.0)
+    operator[NUM_DISTANCES, 4] = 1.0
+    operator[NUM_DISTANCES, 2] = -1.0
+    operator[NUM_DISTANCES + 1, 8] = 1.0
+    return operator
+
+
+FEATURE_OPERATOR = _build_operator()
+
+
+class GestureFeatureExtractor:
+    """Tính vector đặc trưng dùng chung cho mọi detector trong một frame, không cấp phát bộ nhớ mới"""
+
+    def __init__(self):
+        self.features = np.zeros(NUM_FEATURES, dtype=np.float32)
+        self._distances = self.features[:NUM_DISTANCES]
+        self._normalized = self.features[F_NORMALIZED]
+        self._tip_wrist = self.features[F_TIP_WRIST]
+        self._mcp_wrist = self.features[F_MCP_WRIST]
+        self._curl = self.features[F_CURL]
+
+        # Buffer kết quả phép nhân ma trận cho landmarks (21, 2) và (21, 3), cùng các view cắt sẵn
+        self._products = {}
+        for columns in (2, 3):
+            product = np.zeros((NUM_DISTANCES + 2, columns), dtype=np.float32)
+            self._products[columns] = (product, product[:NUM_DISTANCES, 0], product[:NUM_DISTANCES, 1])
+
+    def compute(self, landmarks: Landmarks) -> np.ndarray:
+        """
+        Tính vector đặc trưng của frame hiện tại
+
+        Vector trả về được dùng lại ở frame sau; sao chép nếu cần giữ lâu hơn một frame.
+
+        Args:
+            landmarks: Mảng (21, 2|3) hoặc danh sách (x, y)
+
+        Returns:
+            np.ndarray: Vector (NUM_FEATURES,) float32
+        """
+        points = np.asarray(landmarks, dtype=np.float32)
+        product, dx, dy = self._products[points.shape[1]]
+        features = self.features
+
+        # Mọi vector hiệu trong một phép nhân ma trận, mọi khoảng cách trong một lần hypot
+        np.dot(FEATURE_OPERATOR, points, out=product)
+        np.hypot(dx, dy, out=self._distances)
+
+        # Chuẩn hóa theo kích thước lòng bàn tay để không phụ thuộc khoảng cách tay - camera
+        np.divide(self._distances, max(float(features[F_PALM_SIZE]), 1e-6), out=self._normalized)
+
+        # Độ co của từng ngón (< 1 khi đầu ngón gần cổ tay hơn khớp MCP)
+        np.maximum(self._mcp_wrist, 1e-6, out=self._curl)
+        np.divide(self._tip_wrist, self._curl, out=self._curl)
+
+        features[F_THUMB_DX] = abs(product[NUM_DISTANCES, 0])
+        features[F_POINTER] = product[NUM_DISTANCES + 1, :2]
+        return features
+
+
+def compute_features_batch(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Tính vector đặc trưng cho cả chuỗi frame, cùng công thức với GestureFeatureExtractor.compute
+
+    Args:
+        landmarks: Mảng (T, 21, 2|3)
+
+    Returns:
+        np.ndarray: Mảng (T, NUM_FEATURES) float32
+    """
+    points = np.asarray(landmarks, dtype=np.float32)[..., :2]
+    product = np.matmul(FEATURE_OPERATOR, points)  # (T, NUM_DISTANCES + 2, 2)
+
+    features = np.empty((len(points), NUM_FEATURES), dtype=np.float32)
+    distances = features[:, :NUM_DISTANCES]
+    np.hypot(product[:, :NUM_DISTANCES, 0], product[:, :NUM_DISTANCES, 1], out=distances)
+    np.divide(distances, np.maximum(distances[:, F_PALM_SIZE:F_PALM_SIZE + 1], 1e-6),
+              out=features[:, F_NORMALIZED])
+
+    np.divide(distances[:, F_TIP_WRIST], np.maximum(distances[:, F_MCP_WRIST], 1e-6), out=features[:, F_CURL])
+
+    features[:, F_THUMB_DX] = np.abs(product[:, NUM_DISTANCES, 0])
+    features[:, F_POINTER] = product[:, NUM_DISTANCES + 1]
+    return features
@@ -0,0 +1,242 @@
+"""
+Gesture Rules Module
+Khai báo gesture dưới dạng ngưỡng trên các đặc trưng có tên (utils.gesture_features) và biên dịch
+toàn bộ luật thành vài phép so sánh vector hóa mỗi frame, không phụ thuộc số gesture
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from config.settings import CLICK_THRESHOLD, CLICK_COOLDOWN, GESTURE_STABILITY
+from utils.vote_buffer import VoteBuffer
+from utils.gesture_features import FEATURE_NAMES, FINGER_NAMES, NUM_FEATURES
+
+# Ngưỡng hình dạng tay của các gesture mặc định
+INDEX_EXTENDED_MIN = 0.05  # PIP -> tip ngón trỏ tối thiểu để coi là duỗi
+THUMB_EXTENDED_MIN = 0.03  # IP -> tip ngón cái tối thiểu để coi là duỗi
+FIST_CURL_RATIO = 0.9      # Ngón co khi tip -> cổ tay < tỉ lệ này x MCP -> cổ tay
+THUMB_CURL_MAX_DX = 0.05   # Ngón cái co khi |x tip - x MCP| nhỏ hơn ngưỡng này
+FIST_MIN_CLOSED = 4        # Số ngón co tối thiểu để coi là nắm tay
+
+# Một điều kiện: (tên đặc trưng, "<" hoặc ">", ngưỡng)
+Condition = Tuple[str, str, float]
+
+
+class GestureRule:
+    """Khai báo một gesture: các điều kiện ngưỡng, độ ưu tiên, luật ổn định và cooldown"""
+
+    def __init__(self, name: str, gesture: str, conditions: Sequence[Condition], priority: int = 0,
+                 window: int = 1, min_votes: int = 1, cooldown: float = 0.0,
+                 min_conditions: Optional[int] = None):
+        """
+        Args:
+            name: Tên detector (khóa trong GESTURE_STABILITY)
+            gesture: Gesture trả về khi luật kích hoạt (ví dụ "left_click")
+            conditions: Danh sách điều kiện (tên đặc trưng, "<" | ">", ngưỡng)
+            priority: Luật ưu tiên cao hơn thắng khi nhiều luật cùng ổn định
+            window: Số frame trong cửa sổ ổn định
+            min_votes: Số frame tối thiểu trong cửa sổ phải thỏa luật
+            cooldown: Thời gian chờ giữa hai lần kích hoạt (giây)
+            min_conditions: Số điều kiện tối thiểu phải thỏa (mặc định tất cả)
+        """
+        if not conditions:
+            raise ValueError(f"Luật '{name}' phải có ít nhất một điều kiện")
+        for feature, operator, _ in conditions:
+            if feature not in FEATURE_NAMES:
+                raise ValueError(f"Đặc trưng không tồn tại trong luật '{name}': {feature}")
+            if operator not in ("<", ">"):
+                raise ValueError(f"Toán tử không hợp lệ trong luật '{name}': {operator}")
+        if min_conditions is not None and min_conditions > len(conditions):
+            raise ValueError(f"Luật '{name}' cần {min_conditions} điều kiện nhưng chỉ có {len(conditions)}")
+        if min_votes > max(1, window):
+            raise ValueError(f"Luật '{name}' cần {min_votes} phiếu trong cửa sổ {window} frame, "
+                             f"không bao giờ kích hoạt")
+
+        self.name = name
+        self.gesture = gesture
+        self.conditions = list(conditions)
+        self.priority = priority
+        self.window = max(1, window)
+        self.min_votes = min_votes
+        self.cooldown = cooldown
+        self.min_conditions = len(self.conditions) if min_conditions is None else min_conditions
+
+    def replace(self, **changes) -> "GestureRule":
+        """Bản sao của luật với một số tham số được thay đổi"""
+        options = {
+            'name': self.name, 'gesture': self.gesture, 'conditions': self.conditions,
+            'priority': self.priority, 'window': self.window, 'min_votes': self.min_votes,
+            'cooldown': self.cooldown, 'min_conditions': self.min_conditions
+        }
+        options.update(changes)
+        return GestureRule(**options)
+
+
+# Các gesture do người dùng đăng ký thêm (scroll, drag...), được thêm vào sau các gesture mặc định
+GESTURE_REGISTRY: List[GestureRule] = []
+
+
+def register_gesture(rule: GestureRule) -> None:
+    """
+    Đăng ký gesture mới cho mọi GestureRecognizer tạo sau đó với bộ luật mặc định
+    (build_rules không truyền registry); recognizer đã tạo giữ bộ luật của nó
+
+    Args:
+        rule: Khai báo gesture
+    """
+    GESTURE_REGISTRY[:] = [existing for existing in GESTURE_REGISTRY if existing.name != rule.name]
+    GESTURE_REGISTRY.append(rule)
+
+
+def build_rules(click_threshold: float = CLICK_THRESHOLD, click_cooldown: float = CLICK_COOLDOWN,
+                stability: Optional[Dict[str, Dict[str, int]]] = None,
+                registry: Optional[Sequence[GestureRule]] = None) -> List[GestureRule]:
+    """
+    Danh sách luật mặc định (nhíp -> left click, nắm tay -> right click, nắm tay được ưu tiên)
+    cùng các luật đăng ký thêm
+
+    Args:
+        click_threshold: Khoảng cách pinch tối đa
+        click_cooldown: Thời gian chờ giữa hai lần click
+        stability: Ghi đè cửa sổ/số phiếu theo tên detector (mặc định GESTURE_STABILITY)
+        registry: Các luật thêm sau luật mặc định (mặc định bản sao GESTURE_REGISTRY tại thời điểm gọi,
+                  () = chỉ luật mặc định, không phụ thuộc register_gesture)
+
+    Returns:
+        List[GestureRule]: Các luật, chưa sắp xếp theo độ ưu tiên
+    """
+    rules = [
+        # Nhíp: đầu ngón trỏ chạm đầu ngón cái trong khi cả hai ngón đều duỗi
+        GestureRule(
+            "pinch", "left_click",
+            [("pinch_distance", "<", click_threshold),
+             ("index_pip_tip", ">", INDEX_EXTENDED_MIN),
+             ("thumb_ip_tip", ">", THUMB_EXTENDED_MIN)],
+            priority=1, cooldown=click_cooldown
+        ),
+        # Nắm tay: ít nhất 4/5 ngón co, ngón cái xét theo trục x (ngón cái co ngang)
+        GestureRule(
+            "fist", "right_click",
+            [("thumb_dx", "<", THUMB_CURL_MAX_DX)]
+            + [(f"{finger}_curl", "<", FIST_CURL_RATIO) for finger in FINGER_NAMES[1:]],
+            priority=2, cooldown=click_cooldown, min_conditions=FIST_MIN_CLOSED
+        ),
+    ] + list(GESTURE_REGISTRY if registry is None else registry)
+
+    overrides = {**GESTURE_STABILITY, **(stability or {})}
+    return [rule.replace(**overrides[rule.name]) if rule.name in overrides else rule for rule in rules]
+
+
+class GestureRuleSet:
+    """
+    Bộ luật đã biên dịch thành ma trận: mọi điều kiện của mọi luật được kiểm tra bằng
+    một phép nhân ma trận, một phép so sánh và một phép đếm, không phụ thuộc số gesture
+    """
+
+    def __init__(self, rules: Sequence[GestureRule]):
+        """
+        Args:
+            rules: Các luật, được sắp xếp theo độ ưu tiên giảm dần
+        """
+        self.rules = sorted(rules, key=lambda rule: -rule.priority)
+        self.names = [rule.name for rule in self.rules]
+
+        # Nhãn bầu chọn: "moving" rồi các gesture theo thứ tự khai báo (nhãn nhỏ hơn thắng khi hòa phiếu)
+        self.labels = ["moving"] + list(dict.fromkeys(rule.gesture for rule in rules))
+        self.label_index = {gesture: i for i, gesture in enumerate(self.labels)}
+
+        # Mỗi điều kiện là một hàng: +1 / -1 tại đặc trưng để mọi điều kiện đều có dạng "giá trị < ngưỡng"
+        conditions = [(r, condition) for r, rule in enumerate(self.rules) for condition in rule.conditions]
+        self.selector = np.zeros((len(conditions), NUM_FEATURES), dtype=np.float32)
+        self.bounds = np.zeros(len(conditions), dtype=np.float32)
+        self.membership = np.zeros((len(self.rules), len(conditions)), dtype=np.uint8)
+        for k, (r, (feature, operator, threshold)) in enumerate(conditions):
+            sign = 1.0 if operator == "<" else -1.0
+            self.selector[k, FEATURE_NAMES[feature]] = sign
+            self.bounds[k] = sign * threshold
+            self.membership[r, k] = 1
+        self.required = np.array([rule.min_conditions for rule in self.rules], dtype=np.uint8)
+        self.windows = np.array([rule.window for rule in self.rules], dtype=np.intp)
+        self.min_votes = np.array([rule.min_votes for rule in self.rules], dtype=np.intp)
+
+        # Buffer dùng lại mỗi frame
+        self._values = np.zeros(len(conditions), dtype=np.float32)
+        self._passed = np.zeros(len(conditions), dtype=bool)
+        self._passed_count = self._passed.view(np.uint8)
+        self._counts = np.zeros(len(self.rules), dtype=np.uint8)
+        self._matched = np.zeros(len(self.rules), dtype=bool)
+
+        # Cửa sổ ổn định của từng luật: ring buffer với số đếm chạy (O(1) mỗi frame)
+        self._votes = [VoteBuffer(rule.window) for rule in self.rules]
+        self._stability = list(zip(self._votes, [rule.min_votes for rule in self.rules]))
+
+    def match(self, features: np.ndarray) -> np.ndarray:
+        """
+        Kiểm tra mọi luật trên vector đặc trưng của một frame
+
+        Mảng trả về được dùng lại ở frame sau.
+
+        Args:
+            features: Vector (NUM_FEATURES,) float32 của GestureFeatureExtractor
+
+        Returns:
+            np.ndarray: Mảng (số luật,) bool theo thứ tự self.rules
+        """
+        if not self.rules:
+            return self._matched
+        np.dot(self.selector, features, out=self._values)
+        np.less(self._values, self.bounds, out=self._passed)
+        np.dot(self.membership, self._passed_count, out=self._counts)
+        return np.greater_equal(self._counts, self.required, out=self._matched)
+
+    def match_batch(self, features: np.ndarray) -> np.ndarray:
+        """
+        Kiểm tra mọi luật trên cả chuỗi frame, cùng công thức với match()
+
+        Args:
+            features: Mảng (T, NUM_FEATURES) float32
+
+        Returns:
+            np.ndarray: Mảng (T, số luật) bool
+        """
+        passed = np.matmul(features, self.selector.T) < self.bounds
+        return np.matmul(passed.view(np.uint8), self.membership.T) >= self.required
+
+    def stabilize(self, matched: np.ndarray) -> List[bool]:
+        """
+        Đưa kết quả khớp của frame hiện tại vào cửa sổ của từng luật, luật ổn định khi khớp
+        ở ít nhất min_votes trong window frame gần nhất
+
+        Args:
+            matched: Kết quả của match()
+
+        Returns:
+            List[bool]: Trạng thái ổn định theo thứ tự self.rules
+        """
+        stable = []
+        for (votes, min_votes), is_matched in zip(self._stability, matched.tolist()):
+            votes.push(1 if is_matched else 0)
+            stable.append(votes.counts[1] >= min_votes)
+        return stable
+
+    def stabilize_batch(self, matched: np.ndarray) -> np.ndarray:
+        """
+        Luật ổn định của stabilize() cho cả chuỗi, dùng tổng tích lũy
+
+        Args:
+            matched: Mảng (T, số luật) bool của match_batch()
+
+        Returns:
+            np.ndarray: Mảng (T, số luật) bool
+        """
+        columns = np.arange(len(self.rules))
+        cumulative = np.zeros((len(matched) + 1, len(self.rules)), dtype=np.int64)
+        np.cumsum(matched, axis=0, out=cumulative[1:])
+        ends = np.arange(1, len(matched) + 1)[:, None]
+        starts = np.maximum(ends - self.windows, 0)
+        counts = cumulative[ends, columns] - cumulative[starts, columns]
+        return counts >= self.min_votes
+
+    def reset(self):
+        """Xóa cửa sổ ổn định của mọi luật"""
+        for votes in self._votes:
+            votes.reset()
@@ -0,0 +1,121 @@
+"""
+Landmark Filter Module
+Bộ lọc One Euro vector hóa cho toàn bộ mảng landmarks của một bàn tay: lọc mạnh khi tay đứng yên
+(khử rung của MediaPipe), lọc nhẹ khi tay di chuyển nhanh (không gây trễ), không cấp phát bộ nhớ mỗi frame
+"""
+
+import math
+import numpy as np
+from typing import Optional
+from config.settings import ONE_EURO_MIN_CUTOFF, ONE_EURO_BETA, ONE_EURO_D_CUTOFF, TRACKING_MAX_GAP
+
+
+class OneEuroLandmarkFilter:
+    """
+    One Euro filter (Casiez et al., 2012) trên tọa độ (x, y) của mọi landmark cùng lúc
+
+    Mỗi landmark có tần số cắt riêng theo tốc độ của chính nó: f_c = min_cutoff + beta * |v|,
+    với v là vận tốc (đã lọc thông thấp ở d_cutoff). Tọa độ z được giữ nguyên.
+    """
+
+    def __init__(self, num_landmarks: int = 21, min_cutoff: float = ONE_EURO_MIN_CUTOFF,
+                 beta: float = ONE_EURO_BETA, d_cutoff: float = ONE_EURO_D_CUTOFF,
+                 max_gap: float = TRACKING_MAX_GAP):
+        """
+        Args:
+            num_landmarks: Số landmark mỗi frame
+            min_cutoff: Tần số cắt khi đứng yên (Hz), nhỏ hơn = mượt hơn nhưng trễ hơn khi chậm
+            beta: Hệ số tăng tần số cắt theo tốc độ (1 / đơn vị normalized), lớn hơn = ít trễ hơn khi nhanh
+            d_cutoff: Tần số cắt của vận tốc (Hz)
+            max_gap: Khoảng trống giữa hai frame lớn hơn thì bắt đầu lại (giây)
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.max_gap = max_gap
+
+        # Trạng thái và buffer dùng lại mỗi frame
+        self.output = np.zeros((num_landmarks, 3), dtype=np.float32)
+        self._value = self.output[:, :2]
+        self._derivative = np.zeros((num_landmarks, 2), dtype=np.float32)
+        self._residual = np.zeros((num_landmarks, 2), dtype=np.float32)
+        self._delta = np.zeros((num_landmarks, 2), dtype=np.float32)
+        self._speed = np.zeros((num_landmarks, 1), dtype=np.float32)
+        self._denominator = np.zeros((num_landmarks, 1), dtype=np.float32)
+        self.last_time: Optional[float] = None
+
+    def apply(self, landmarks: np.ndarray, timestamp: float) -> np.ndarray:
+        """
+        Lọc landmarks của frame hiện tại
+
+        Args:
+            landmarks: Mảng (num_landmarks, 3) float32 tọa độ normalized (ví dụ của HandTracker.get_landmarks)
+            timestamp: Thời điểm của frame (giây)
+
+        Returns:
+            np.ndarray: View (num_landmarks, 3) của buffer đầu ra (bị ghi đè ở frame sau)
+        """
+        xy = landmarks[:, :2]
+        self.output[:, 2] = landmarks[:, 2]
+
+        elapsed = 0.0 if self.last_time is None else timestamp - self.last_time
+        self.last_time = timestamp
+        if not 0.0 < elapsed <= self.max_gap:
+            # Frame đầu tiên hoặc mất tay quá lâu: lấy nguyên giá trị đo, vận tốc 0
+            self._value[:] = xy
+            self._derivative.fill(0.0)
+            return self.output
+
+        # Vận tốc thô so với giá trị đã lọc, rồi lọc thông thấp ở d_cutoff
+        np.subtract(xy, self._value, out=self._residual)
+        np.multiply(self._residual, 1.0 / elapsed, out=self._delta)
+        self._delta -= self._derivative
+        self._delta *= self._smoothing_factor(self.d_cutoff, elapsed)
+        self._derivative += self._delta
+
+        # Tần số cắt theo tốc độ từng landmark, alpha = r / (r + 1) với r = 2 pi f_c dt
+        np.hypot(self._derivative[:, :1], self._derivative[:, 1:], out=self._speed)
+        self._speed *= self.beta
+        self._speed += self.min_cutoff
+        self._speed *= 2.0 * math.pi * elapsed
+        np.add(self._speed, 1.0, out=self._denominator)
+        np.divide(self._speed, self._denominator, out=self._speed)
+
+        # x_hat += alpha * (x - x_hat)
+        self._residual *= self._speed
+        self._value += self._residual
+        return self.output
+
+    @staticmethod
+    def _smoothing_factor(cutoff: float, elapsed: float) -> float:
+        """Hệ số làm mượt hàm mũ của bộ lọc thông thấp bậc một tại tần số cắt cho trước"""
+        r = 2.0 * math.pi * cutoff * elapsed
+        return r / (r + 1.0)
+
+    def reset(self):
+        """Bắt đầu lại ở frame tiếp theo (ví dụ khi mất tay)"""
+        self.last_time = None
+
+
+def filter_sequence(landmarks: np.ndarray, timestamps: np.ndarray, present: Optional[np.ndarray] = None,
+                    landmark_filter: Optional[OneEuroLandmarkFilter] = None) -> np.ndarray:
+    """
+    Lọc cả chuỗi landmarks đã ghi như pipeline trực tiếp (frame không có tay bị bỏ qua)
+
+    Args:
+        landmarks: Mảng (T, 21, 2|3) landmarks của một tay
+        timestamps: Mảng (T,) thời điểm của từng frame (giây)
+        present: Mảng (T,) bool, False ở frame không có tay
+        landmark_filter: Bộ lọc (mặc định OneEuroLandmarkFilter với cấu hình mặc định)
+
+    Returns:
+        np.ndarray: Mảng (T, 21, 3) float32 đã lọc
+    """
+    landmark_filter = landmark_filter or OneEuroLandmarkFilter(landmarks.shape[1])
+    source = np.zeros((len(landmarks), landmarks.shape[1], 3), dtype=np.float32)
+    source[:, :, :landmarks.shape[2]] = landmarks[:, :, :3]
+    output = source.copy()
+    frames = np.flatnonzero(present) if present is not None else range(len(landmarks))
+    for t, timestamp in zip(frames, np.asarray(timestamps, dtype=np.float64)[frames].tolist()):
+        output[t] = landmark_filter.apply(source[t], timestamp)
+    return output
@@ -0,0 +1,128 @@
+"""
+Landmark History Module
+Ring buffer cấp phát sẵn chứa landmarks (T, 21, 3) float32 và thời điểm của các frame gần nhất,
+dùng chung cho mọi thành phần cần dữ liệu theo thời gian (làm mượt con trỏ, hover, double click,
+gesture động) thay vì mỗi thành phần tự sao chép tọa độ vào buffer riêng
+"""
+
+import numpy as np
+from typing import Optional
+from config.settings import LANDMARK_HISTORY_FRAMES
+
+
+class LandmarkHistory:
+    """
+    Ring buffer lưu mỗi frame hai lần (ở vị trí i và i + capacity) để n frame gần nhất
+    luôn là một đoạn liên tục: mọi cửa sổ trả về đều là view, không sao chép
+    """
+
+    def __init__(self, capacity: int = LANDMARK_HISTORY_FRAMES, num_landmarks: int = 21):
+        """
+        Args:
+            capacity: Số frame tối đa giữ lại
+            num_landmarks: Số landmark mỗi frame
+        """
+        self.capacity = max(2, capacity)
+        self._landmarks = np.zeros((2 * self.capacity, num_landmarks, 3), dtype=np.float32)
+        self._timestamps = np.zeros(2 * self.capacity, dtype=np.float64)
+        self.head = 0          # Vị trí ghi tiếp theo trong [0, capacity)
+        self.length = 0        # Số frame hợp lệ
+        self.frame_count = 0   # Tổng số frame đã ghi (không giảm khi ring quay vòng)
+
+    def push(self, landmarks: np.ndarray, timestamp: float) -> np.ndarray:
+        """
+        Ghi landmarks của frame hiện tại (bản sao duy nhất của tọa độ trong pipeline)
+
+        Args:
+            landmarks: Mảng (num_landmarks, 2|3)
+            timestamp: Thời điểm của frame (giây)
+
+        Returns:
+            np.ndarray: View (num_landmarks, 3) của frame vừa ghi
+        """
+        points = np.asarray(landmarks)
+        columns = min(points.shape[1], 3)
+        # Hai bản sao ở head và head + capacity: một phép gán qua slice bước capacity
+        slots = self._landmarks[self.head::self.capacity]
+        slots[:, :, :columns] = points[:, :columns]
+        if columns < 3:
+            slots[:, :, columns:] = 0.0
+        self._timestamps[self.head::self.capacity] = timestamp
+
+        self.head = (self.head + 1) % self.capacity
+        self.length = min(self.length + 1, self.capacity)
+        self.frame_count += 1
+        return self._landmarks[self.head - 1 + self.capacity]
+
+    def window(self, frames: Optional[int] = None) -> np.ndarray:
+        """
+        Landmarks của n frame gần nhất theo thứ tự cũ -> mới
+
+        Args:
+            frames: Số frame (mặc định toàn bộ lịch sử hợp lệ)
+
+        Returns:
+            np.ndarray: View (n, num_landmarks, 3)
+        """
+        end = self.head + self.capacity
+        return self._landmarks[end - self._count(frames):end]
+
+    def times(self, frames: Optional[int] = None) -> np.ndarray:
+        """
+        Thời điểm của n frame gần nhất theo thứ tự cũ -> mới
+
+        Returns:
+            np.ndarray: View (n,) float64
+        """
+        end = self.head + self.capacity
+        return self._timestamps[end - self._count(frames):end]
+
+    def track(self, landmark_id: int, frames: Optional[int] = None) -> np.ndarray:
+        """
+        Quỹ đạo của một landmark trong n frame gần nhất
+
+        Args:
+            landmark_id: Index landmark (ví dụ 8 = đầu ngón trỏ)
+            frames: Số frame (mặc định toàn bộ lịch sử hợp lệ)
+
+        Returns:
+            np.ndarray: View (n, 3)
+        """
+        return self.window(frames)[:, landmark_id]
+
+    def latest(self) -> Optional[np.ndarray]:
+        """View (num_landmarks, 3) của frame mới nhất, None nếu chưa có frame nào"""
+        if not self.length:
+            return None
+        return self._landmarks[self.head - 1 + self.capacity]
+
+    def latest_time(self) -> float:
+        """Thời điểm của frame mới nhất (0 nếu chưa có frame nào)"""
+        return float(self._timestamps[self.head - 1 + self.capacity]) if self.length else 0.0
+
+    def frame(self, frame_index: int) -> Optional[np.ndarray]:
+        """
+        Landmarks của frame thứ frame_index (theo frame_count lúc ghi), None nếu đã bị ghi đè
+
+        Args:
+            frame_index: Giá trị frame_count - 1 ngay sau khi ghi frame đó
+
+        Returns:
+            Optional[np.ndarray]: View (num_landmarks, 3)
+        """
+        age = self.frame_count - 1 - frame_index
+        if age < 0 or age >= self.length:
+            return None
+        return self._landmarks[self.head - 1 - age + self.capacity]
+
+    def _count(self, frames: Optional[int]) -> int:
+        """Số frame thực tế của một cửa sổ"""
+        return self.length if frames is None else max(0, min(frames, self.length))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def reset(self):
+        """Xóa lịch sử (ví dụ khi mất tay), bộ nhớ được giữ lại"""
+        self.head = 0
+        self.length = 0
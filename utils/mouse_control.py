@@ -5,21 +5,30 @@ Module điều khiển chuột máy tính với tính năng nâng cao
 
 import pyautogui
 import numpy as np
-import time
 import logging
 from typing import Tuple, Optional, List
-from collections import deque
 from config.settings import (
-    SMOOTHING_FACTOR, MOUSE_SPEED, SCREEN_MARGIN, 
-    MOUSE_ACCELERATION, DEADZONE_SIZE, CURSOR_SMOOTHING_WINDOW,
+    MOUSE_SPEED, SCREEN_MARGIN, MOUSE_ACCELERATION, DEADZONE_SIZE, CURSOR_FILTER, CURSOR_PREDICTION,
     PRECISION_MODE_THRESHOLD, PRECISION_SPEED_FACTOR
 )
+from utils.landmark_history import LandmarkHistory
+from utils.cursor_filter import create_cursor_filter
+from utils.cursor_predictor import CursorPredictor
+from utils.clock import Clock, SYSTEM_CLOCK
 
 class MouseController:
     """Class điều khiển chuột máy tính với tính năng nâng cao"""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None, cursor_filter: str = CURSOR_FILTER,
+                 cursor_prediction: bool = CURSOR_PREDICTION):
+        """
+        Args:
+            clock: Nguồn thời gian khi vị trí tay không kèm timestamp (mặc định đồng hồ đơn điệu của hệ thống)
+            cursor_filter: Bộ lọc vị trí con trỏ "one_euro", "kalman" hoặc "ema" (mặc định CURSOR_FILTER)
+            cursor_prediction: Ngoại suy con trỏ bù độ trễ pipeline (mặc định CURSOR_PREDICTION)
+        """
         self.logger = logging.getLogger(__name__)
+        self.clock = clock or SYSTEM_CLOCK
         
         # Tắt fail-safe của pyautogui
         pyautogui.FAILSAFE = False
@@ -32,14 +41,22 @@ class MouseController:
         # Vị trí chuột trước đó
         self.prev_mouse_x = self.screen_width // 2
         self.prev_mouse_y = self.screen_height // 2
-          # Buffer cho smoothing
-        self.position_buffer = deque(maxlen=CURSOR_SMOOTHING_WINDOW)
-        self.stable_position_buffer = deque(maxlen=3)  # Buffer nhỏ hơn cho ổn định
         
         # Vùng hoạt động hiệu dụng
         self.effective_width = self.screen_width - 2 * SCREEN_MARGIN
         self.effective_height = self.screen_height - 2 * SCREEN_MARGIN
         
+        # Bộ lọc vị trí con trỏ: trạng thái O(1) cập nhật mỗi frame theo timestamp của frame
+        self.cursor_filter = create_cursor_filter(cursor_filter)
+        
+        # Bù độ trễ: độ trễ đo từ timestamp capture tới lúc đặt con trỏ (cần clock cùng gốc với timestamp)
+        self.cursor_predictor = CursorPredictor() if cursor_prediction else None
+        self.deadzone = DEADZONE_SIZE * self.screen_width
+        
+        # Lịch sử riêng cho move_cursor()/move_cursor_to_landmark() khi không có lịch sử dùng chung
+        # (chỉ cần hai frame gần nhất cho vùng chết)
+        self.pointer_history = LandmarkHistory(2, num_landmarks=1)
+        
         # Trạng thái precision mode
         self.precision_mode = False
         self.precision_start_time = 0
@@ -51,61 +68,48 @@ class MouseController:
         self.last_click_time = 0
         self.click_position = (0, 0)
     
-    def move_cursor(self, hand_x: float, hand_y: float, frame_width: int, frame_height: int):
+    def move_cursor_from_history(self, history: LandmarkHistory, landmark_id: int = 8):
         """
-        Di chuyển con trỏ chuột dựa trên vị trí tay với smoothing nâng cao
+        Di chuyển con trỏ chuột theo một landmark trong lịch sử landmarks, qua bộ lọc con trỏ
         
         Args:
-            hand_x: Tọa độ x của tay trong frame
-            hand_y: Tọa độ y của tay trong frame
-            frame_width: Chiều rộng của frame webcam
-            frame_height: Chiều cao của frame webcam
+            history: Lịch sử landmarks của tay điều khiển (frame hiện tại đã được ghi)
+            landmark_id: Landmark điều khiển con trỏ (mặc định đầu ngón trỏ)
         """
         try:
-            # Chuyển đổi tọa độ tay từ frame sang tọa độ màn hình
-            screen_x = np.interp(hand_x, [0, frame_width], [SCREEN_MARGIN, self.screen_width - SCREEN_MARGIN])
-            screen_y = np.interp(hand_y, [0, frame_height], [SCREEN_MARGIN, self.screen_height - SCREEN_MARGIN])
+            # View (n, 3) tọa độ normalized của tối đa hai frame gần nhất, không sao chép
+            track = history.track(landmark_id, 2)
+            if not len(track):
+                return
             
-            # Thêm vào buffer ổn định
-            self.stable_position_buffer.append((screen_x, screen_y))
+            # Bộ lọc và predictor nhận mọi frame (kể cả trong vùng chết) để trạng thái theo thời gian liên tục
+            x, y = track[-1, :2].tolist()
+            frame_time = history.latest_time()
+            filtered_x, filtered_y = self.cursor_filter.apply(x, y, frame_time)
+            if self.cursor_predictor is not None:
+                filtered_x, filtered_y = self.cursor_predictor.apply(
+                    filtered_x, filtered_y, x, y, frame_time, self.clock.now()
+                )
             
-            # Kiểm tra tính ổn định của tọa độ
-            if len(self.stable_position_buffer) >= 2:
-                current_pos = self.stable_position_buffer[-1]
-                prev_pos = self.stable_position_buffer[-2]
-                distance = np.sqrt((current_pos[0] - prev_pos[0])**2 + (current_pos[1] - prev_pos[1])**2)
+            # Kiểm tra tính ổn định của tọa độ (khoảng cách trên màn hình giữa hai frame gần nhất)
+            if len(track) >= 2:
+                (prev_x, prev_y), (current_x, current_y) = track[-2:, :2].tolist()
+                distance = np.hypot((current_x - prev_x) * self.effective_width,
+                                    (current_y - prev_y) * self.effective_height)
                 
                 # Nếu di chuyển quá nhỏ, tăng counter ổn định
-                if distance < DEADZONE_SIZE * self.screen_width:
+                if distance < self.deadzone:
                     self.stable_frames += 1
                 else:
                     self.stable_frames = 0
                 
                 # Chỉ di chuyển chuột khi đã ổn định hoặc di chuyển đủ lớn
-                if self.stable_frames < self.min_stable_frames and distance < DEADZONE_SIZE * self.screen_width:
+                if self.stable_frames < self.min_stable_frames and distance < self.deadzone:
                     return
             
-            # Thêm vào buffer chính để làm mượt
-            self.position_buffer.append((screen_x, screen_y))
-            
-            # Tính toán vị trí trung bình từ buffer với trọng số
-            if len(self.position_buffer) > 1:
-                # Sử dụng trọng số giảm dần cho các frame cũ
-                weights = np.exp(-np.arange(len(self.position_buffer)) * 0.5)
-                weights = weights / weights.sum()
-                
-                avg_x = sum(pos[0] * weight for pos, weight in zip(self.position_buffer, weights))
-                avg_y = sum(pos[1] * weight for pos, weight in zip(self.position_buffer, weights))
-            else:
-                avg_x, avg_y = screen_x, screen_y
-            
-            # Áp dụng smoothing với SMOOTHING_FACTOR
-            smooth_x = self.prev_mouse_x + (avg_x - self.prev_mouse_x) * (1 - SMOOTHING_FACTOR)
-            smooth_y = self.prev_mouse_y + (avg_y - self.prev_mouse_y) * (1 - SMOOTHING_FACTOR)
-            
-            # Áp dụng tốc độ
-            final_x = int(smooth_x)
-            final_y = int(smooth_y)
+            # Chuyển vị trí đã lọc (normalized) sang tọa độ màn hình
+            final_x = int(SCREEN_MARGIN + min(max(filtered_x, 0.0), 1.0) * self.effective_width)
+            final_y = int(SCREEN_MARGIN + min(max(filtered_y, 0.0), 1.0) * self.effective_height)
             
             # Đảm bảo không vượt quá ranh giới màn hình
             final_x = max(0, min(final_x, self.screen_width - 1))
@@ -121,6 +125,38 @@ class MouseController:
         except Exception as e:
             self.logger.error(f"Lỗi khi di chuyển chuột: {e}")
     
+    def move_cursor(self, hand_x: float, hand_y: float, frame_width: int, frame_height: int,
+                    timestamp: Optional[float] = None):
+        """
+        Di chuyển con trỏ chuột dựa trên vị trí tay (ghi vào lịch sử con trỏ riêng)
+        
+        Args:
+            hand_x: Tọa độ x của tay trong frame
+            hand_y: Tọa độ y của tay trong frame
+            frame_width: Chiều rộng của frame webcam
+            frame_height: Chiều cao của frame webcam
+            timestamp: Thời điểm capture của frame (mặc định clock.now())
+        """
+        timestamp = self.clock.now() if timestamp is None else timestamp
+        self.pointer_history.push(((hand_x / frame_width, hand_y / frame_height),), timestamp)
+        self.move_cursor_from_history(self.pointer_history, landmark_id=0)
+    
+    def move_cursor_to_landmark(self, landmarks: np.ndarray, frame_width: int, frame_height: int,
+                                landmark_id: int = 8, timestamp: Optional[float] = None):
+        """
+        Di chuyển con trỏ chuột theo một landmark trong mảng landmarks của HandTracker
+        
+        Args:
+            landmarks: Mảng (21, 2|3) tọa độ normalized
+            frame_width: Chiều rộng của frame webcam
+            frame_height: Chiều cao của frame webcam
+            landmark_id: Landmark điều khiển con trỏ (mặc định đầu ngón trỏ)
+            timestamp: Thời điểm capture của frame (mặc định clock.now())
+        """
+        timestamp = self.clock.now() if timestamp is None else timestamp
+        self.pointer_history.push(landmarks[landmark_id:landmark_id + 1], timestamp)
+        self.move_cursor_from_history(self.pointer_history, landmark_id=0)
+    
     def left_click(self):
         """Thực hiện click chuột trái"""
         try:
@@ -145,6 +181,22 @@ class MouseController:
         except Exception as e:
             self.logger.error(f"Lỗi khi double click: {e}")
     
+    def switch_window(self, reverse: bool = False):
+        """
+        Chuyển sang cửa sổ kế tiếp (Alt+Tab)
+        
+        Args:
+            reverse: Chuyển về cửa sổ trước (Alt+Shift+Tab)
+        """
+        try:
+            if reverse:
+                pyautogui.hotkey('alt', 'shift', 'tab')
+            else:
+                pyautogui.hotkey('alt', 'tab')
+            self.logger.debug(f"Switch window performed (reverse={reverse})")
+        except Exception as e:
+            self.logger.error(f"Lỗi khi chuyển cửa sổ: {e}")
+    
     def get_current_position(self) -> Tuple[int, int]:
         """
         Lấy vị trí hiện tại của con trỏ chuột
@@ -237,6 +289,10 @@ class MouseController:
         }
     
     def reset_smoothing(self):
-        """Reset buffer smoothing"""
-        self.position_buffer.clear()
+        """Reset lịch sử smoothing"""
+        self.pointer_history.reset()
+        self.cursor_filter.reset()
+        if self.cursor_predictor is not None:
+            self.cursor_predictor.reset()
+        self.stable_frames = 0
         self.precision_mode = False
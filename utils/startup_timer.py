@@ -0,0 +1,89 @@
+"""
+Startup Timer Utility
+Đo thời gian các giai đoạn khởi động (import, mở camera, nạp model) và thời điểm có landmark đầu tiên
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+# Tên hiển thị của các giai đoạn trong báo cáo
+STAGE_LABELS = {
+    'import': "import",
+    'camera_open': "camera open",
+    'model_load': "model load",
+    'warm_up': "warm-up",
+    'ready': "ready",
+    'first_landmark': "first landmark"
+}
+
+
+class StartupTimer:
+    """Ghi lại thời lượng từng giai đoạn khởi động và các mốc thời gian tính từ lúc process bắt đầu"""
+
+    def __init__(self, origin: Optional[float] = None):
+        """
+        Args:
+            origin: Thời điểm bắt đầu (time.perf_counter), mặc định là lúc tạo timer
+        """
+        self.origin = time.perf_counter() if origin is None else origin
+        self.durations = {}
+        self.milestones = {}
+        # Các giai đoạn có thể được đo từ thread warm-up song song với main thread
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Đo thời lượng của một giai đoạn
+
+        Args:
+            stage: Tên giai đoạn (vd: "camera_open")
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.durations[stage] = time.perf_counter() - start
+
+    def mark_once(self, milestone: str) -> bool:
+        """
+        Ghi mốc thời gian (tính từ origin) nếu chưa được ghi
+
+        Args:
+            milestone: Tên mốc (vd: "first_landmark")
+
+        Returns:
+            bool: True nếu mốc vừa được ghi lần đầu
+        """
+        with self.lock:
+            if milestone in self.milestones:
+                return False
+            self.milestones[milestone] = time.perf_counter() - self.origin
+            return True
+
+    def get_times(self) -> Dict[str, float]:
+        """
+        Lấy toàn bộ số đo
+
+        Returns:
+            Dict[str, float]: Thời lượng các giai đoạn và các mốc thời gian (giây)
+        """
+        with self.lock:
+            return {**self.durations, **self.milestones}
+
+    def report(self) -> str:
+        """
+        Tạo báo cáo một dòng, vd: "import 0.52s | camera open 0.80s | ... | first landmark @2.41s"
+
+        Returns:
+            str: Báo cáo thời gian khởi động
+        """
+        with self.lock:
+            parts = [f"{STAGE_LABELS.get(stage, stage)} {seconds:.2f}s"
+                     for stage, seconds in self.durations.items()]
+            parts += [f"{STAGE_LABELS.get(milestone, milestone)} @{seconds:.2f}s"
+                      for milestone, seconds in self.milestones.items()]
+        return " | ".join(parts)
@@ -0,0 +1,72 @@
+"""
+Vote Buffer Module
+Ring buffer kích thước cố định với số đếm chạy, dùng để làm mượt và bầu chọn gesture trong O(1) mỗi frame
+"""
+
+from typing import List
+
+
+class VoteBuffer:
+    """Giữ N nhãn gần nhất (số nguyên 0..num_labels-1) cùng số lần xuất hiện của từng nhãn"""
+
+    def __init__(self, size: int, num_labels: int = 2):
+        """
+        Args:
+            size: Số frame trong cửa sổ
+            num_labels: Số nhãn khác nhau (2 cho detector đúng/sai)
+        """
+        self.size = max(1, size)
+        self.ring = [0] * self.size
+        self.counts = [0] * num_labels
+        self.head = 0
+        self.length = 0
+        self.winner = 0
+
+    def push(self, label: int) -> None:
+        """
+        Thêm nhãn của frame hiện tại, bỏ nhãn cũ nhất nếu cửa sổ đã đầy
+
+        Args:
+            label: Nhãn của frame
+        """
+        if self.length == self.size:
+            self.counts[self.ring[self.head]] -= 1
+        else:
+            self.length += 1
+
+        self.ring[self.head] = label
+        self.counts[label] += 1
+        self.head = (self.head + 1) % self.size
+
+    def count(self, label: int) -> int:
+        """Số frame trong cửa sổ có nhãn cho trước"""
+        return self.counts[label]
+
+    def most_common(self) -> int:
+        """
+        Nhãn nhiều phiếu nhất trong cửa sổ
+
+        Chi phí chỉ phụ thuộc số nhãn, không phụ thuộc kích thước cửa sổ.
+
+        Returns:
+            int: Nhãn thắng (hòa phiếu thì giữ nhãn đang thắng để tránh nhảy qua lại)
+        """
+        counts = self.counts
+        winner = self.winner
+        for label, count in enumerate(counts):
+            if count > counts[winner]:
+                winner = label
+        self.winner = winner
+        return winner
+
+    def values(self) -> List[int]:
+        """Các nhãn trong cửa sổ theo thứ tự cũ -> mới (chỉ dùng để hiển thị/debug)"""
+        start = self.head if self.length == self.size else 0
+        return [self.ring[(start + i) % self.size] for i in range(self.length)]
+
+    def reset(self):
+        """Xóa toàn bộ cửa sổ"""
+        self.counts = [0] * len(self.counts)
+        self.head = 0
+        self.length = 0
+        self.winner = 0